@@ -0,0 +1,161 @@
+"""
+Scaling benchmarks of the linear static analysis pipeline.
+
+Every model is timed phase by phase (build, assembly, constraint, solve, scatter).
+Peak memory of each phase is measured with tracemalloc in a separate run, so that
+tracing does not distort the timings. Memory allocated outside Python's allocators,
+e.g. by the sparse LU factorization, is not included.
+
+Usage:
+    python -m benchmarks.bench --output results.json
+    python -m benchmarks.bench --models column truss --sizes 100 1000 --baseline results.json
+
+Timings depend on the machine, so no baseline is committed. To check a change for
+regressions, save a baseline on the same machine before the change and compare
+against it afterwards; the exit status is 1 if any phase got slower than tolerance:
+
+    git stash && python -m benchmarks.bench --sizes 100 1000 10000 --save-baseline
+    git stash pop && python -m benchmarks.bench --sizes 100 1000 10000 --baseline
+
+Both options default to BASELINE, benchmarks/baseline.json, which is ignored by git.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import pyFEM.solver as solver
+from benchmarks.models import GENERATORS
+
+PHASES = ("build", "assembly", "constraint", "solve", "scatter")
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _phases(generator, n_elems: int):
+    """
+    Yields phase names while running the analysis pipeline one phase at a time
+    """
+    data = {}
+
+    yield "build"
+    data["model"] = model = generator(n_elems)
+    yield "assembly"
+    data["K"] = model.global_stiffness_matrix
+    data["F"] = model.global_load_vector
+    yield "constraint"
+    data["fixed"] = model.fixed_dofs
+    data["b"] = model.constraint_vector
+    yield "solve"
+    data["U"], data["R"] = solver.reduced_static_load_analysis(data["K"], data["F"], data["fixed"], data["b"])
+    yield "scatter"
+    model.store_results(data["U"], data["R"], 0)
+    yield model
+
+
+def run_timing(generator, n_elems: int) -> tuple[dict[str, float], object]:
+    """
+    Returns wall-clock time of each phase and the solved model
+    """
+    times = {}
+    phases = _phases(generator, n_elems)
+    phase = next(phases)
+    while isinstance(phase, str):
+        start = time.perf_counter()
+        next_phase = next(phases)
+        times[phase] = time.perf_counter() - start
+        phase = next_phase
+    return times, phase
+
+
+def run_memory(generator, n_elems: int) -> dict[str, float]:
+    """
+    Returns peak traced memory [MB] of each phase
+    """
+    peaks = {}
+    tracemalloc.start()
+    try:
+        phases = _phases(generator, n_elems)
+        phase = next(phases)
+        while isinstance(phase, str):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            next_phase = next(phases)
+            peaks[phase] = (tracemalloc.get_traced_memory()[1] - current) / 1e6
+            phase = next_phase
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def run(models: list[str], sizes: list[int], memory: bool = True) -> list[dict]:
+    records = []
+    for name in models:
+        generator = GENERATORS[name]
+        for n_elems in sizes:
+            times, model = run_timing(generator, n_elems)
+            record = {"model": name, "n_elems": len(model.elements), "dofs": model.dofs,
+                      "size": n_elems, "time_s": times}
+            del model
+            if memory:
+                record["peak_mb"] = run_memory(generator, n_elems)
+            records.append(record)
+            print(f"{name:>12} {n_elems:>8}: " +
+                  " ".join(f"{phase} {times[phase]:.3f}s" for phase in PHASES), flush=True)
+    return records
+
+
+def compare(records: list[dict], baseline: list[dict], tolerance: float = 1.25,
+            min_time: float = 0.05) -> list[str]:
+    """
+    Returns descriptions of phases that are slower than tolerance * baseline time.
+    Phases faster than min_time seconds in both runs are ignored as noise.
+    """
+    reference = {(rec["model"], rec["size"]): rec for rec in baseline}
+    regressions = []
+    for rec in records:
+        ref = reference.get((rec["model"], rec["size"]))
+        if ref is None:
+            continue
+        for phase in PHASES:
+            t, t_ref = rec["time_s"][phase], ref["time_s"][phase]
+            if max(t, t_ref) >= min_time and t > tolerance * t_ref:
+                regressions.append(f"{rec['model']} {rec['size']} {phase}: "
+                                   f"{t:.3f}s vs baseline {t_ref:.3f}s")
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--no-memory", action="store_true", help="skip the memory measurement run")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE,
+                        help="write results as the baseline of later runs, defaults to BASELINE")
+    parser.add_argument("--baseline", nargs="?", const=BASELINE,
+                        help="compare timings against this results file, defaults to BASELINE")
+    parser.add_argument("--tolerance", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    records = run(args.models, args.sizes, memory=not args.no_memory)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump({"python": sys.version, "platform": platform.platform(),
+                           "records": records}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["records"]
+        regressions = compare(records, baseline, args.tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Parametrized model generators for benchmarks. Each generator returns a model
+with approximately n_elems elements.
+"""
+import numpy as np
+
+import pyFEM.catalogs.materials.steel.structural_steel as steel
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.pointload import PointLoad
+from pyFEM.steel_section import SteelSection
+from pyFEM.support import Support
+
+
+def column(n_elems: int, L: float = 5000) -> FEModel:
+    """
+    Cantilever column divided into n_elems elements with horizontal tip load
+    """
+    model = FEModel()
+    s = SteelSection.IPE100
+    m = steel.S355
+    nodes = [Node(0, 0, z) for z in np.linspace(0, L, n_elems + 1).tolist()]
+    for n1, n2 in zip(nodes[:-1], nodes[1:]):
+        model.add(Element(n1, n2, s, m))
+    model.add(Support.Fixed(nodes[0]))
+    model.add(PointLoad(nodes[-1], Fx=100e3))
+    return model
+
+
+def portal_frame(n_elems: int, L: float = 5000) -> FEModel:
+    """
+    Portal frame with fixed column bases, each member divided into n_elems // 3 elements
+    """
+    model = FEModel()
+    s = SteelSection.IPE100
+    m = steel.S355
+    n = max(n_elems // 3, 1)
+    t = np.linspace(0, L, n + 1)
+    left = [Node(0, 0, z) for z in t.tolist()]
+    right = [Node(L, 0, z) for z in t.tolist()]
+    beam = [left[-1]] + [Node(x, 0, L) for x in t[1:-1].tolist()] + [right[-1]]
+    for nodes in (left, right):
+        for n1, n2 in zip(nodes[:-1], nodes[1:]):
+            model.add(Element(n1, n2, s, m))
+    for n1, n2 in zip(beam[:-1], beam[1:]):
+        elem = Element(n1, n2, s, m)
+        model.add(elem)
+        model.add(LineLoad(elem, qz=[-100, -100]))
+    model.add(Support.Fixed(left[0]))
+    model.add(Support.Fixed(right[0]))
+    model.add(PointLoad(left[-1], Fx=100e3))
+    return model
+
+
+def grid_3d(n_elems: int, L: float = 5000, H: float = 3500) -> FEModel:
+    """
+    Three-dimensional frame of k x k bays and k storeys, where k is chosen so that
+    the frame has approximately n_elems elements
+    """
+    model = FEModel()
+    s = SteelSection.IPE100
+    m = steel.S355
+    k = max(int(round((n_elems / 3) ** (1 / 3))), 1)
+    nodes = [[[Node(i * L, j * L, z * H) for z in range(k + 1)]
+              for j in range(k + 1)] for i in range(k + 1)]
+    for i in range(k + 1):
+        for j in range(k + 1):
+            model.add(Support.Fixed(nodes[i][j][0]))
+            for z in range(k):
+                # Column
+                model.add(Element(nodes[i][j][z], nodes[i][j][z + 1], s, m))
+                # Beams in X- and Y-directions
+                if i < k:
+                    beam = Element(nodes[i][j][z + 1], nodes[i + 1][j][z + 1], s, m)
+                    model.add(beam)
+                    model.add(LineLoad(beam, qz=[-10, -10]))
+                if j < k:
+                    model.add(Element(nodes[i][j][z + 1], nodes[i][j + 1][z + 1], s, m))
+    model.add(PointLoad(nodes[k][k][k], Fx=10e3, Fy=10e3))
+    return model
+
+
+def truss(n_elems: int, L: float = 1000, H: float = 1000) -> FEModel:
+    """
+    Planar Pratt truss of n_elems // 4 panels on fixed supports
+    """
+    model = FEModel()
+    s = SteelSection.IPE100
+    m = steel.S355
+    n = max(n_elems // 4, 1)
+    bottom = [Node(i * L, 0, 0) for i in range(n + 1)]
+    top = [Node(i * L, 0, H) for i in range(n + 1)]
+    for i in range(n):
+        model.add(Element(bottom[i], bottom[i + 1], s, m))
+        model.add(Element(top[i], top[i + 1], s, m))
+        model.add(Element(bottom[i], top[i], s, m))
+        if i < n // 2:
+            model.add(Element(bottom[i + 1], top[i], s, m))
+        else:
+            model.add(Element(bottom[i], top[i + 1], s, m))
+        model.add(PointLoad(top[i + 1], Fz=-10e3))
+    model.add(Element(bottom[n], top[n], s, m))
+    model.add(Support.Fixed(bottom[0]))
+    model.add(Support.Fixed(bottom[n]))
+    return model
+
+
+GENERATORS = {
+    "column": column,
+    "portal_frame": portal_frame,
+    "grid_3d": grid_3d,
+    "truss": truss,
+}
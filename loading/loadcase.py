@@ -1,8 +1,28 @@
 from dataclasses import dataclass, field
-from pyFEM.loading.loadtype import LoadTypeEnum
+from loading.loadtype import LoadTypeEnum
 
 @dataclass
 class LoadCase:
 
     load_type: LoadTypeEnum = None
     loads: list = field(default_factory=list)
+    name: str = ""
+    # Key of load case's results in Node.u and NodalSupport.R, set by FEModel.add_load_case
+    load_id: int = field(default=None, init=False)
+
+    def add(self, load: object) -> None:
+        self.loads.append(load)
+
+
+def check_load_ids(load_cases: list[LoadCase]) -> None:
+    """
+    Raises ValueError if a load case has not been added to a model or
+    several load cases have the same load id, so their results would overwrite each other
+    """
+    seen = set()
+    for lc in load_cases:
+        if lc.load_id is None:
+            raise ValueError(f"Load case {lc.name!r} has no load id, add it to the model first")
+        if lc.load_id in seen:
+            raise ValueError(f"Several load cases have load id {lc.load_id}")
+        seen.add(lc.load_id)
@@ -0,0 +1,141 @@
+import enum
+import itertools
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from loading.loadcase import LoadCase, check_load_ids
+from loading.loadtype import LoadTypeEnum
+
+
+class CombinationType(enum.Enum):
+    """
+    Combinations of actions, EN 1990 6.4.3 and 6.5.3
+    """
+    ULS = enum.auto()
+    SLS_characteristic = enum.auto()
+    SLS_frequent = enum.auto()
+    SLS_quasi_permanent = enum.auto()
+    Accidental = enum.auto()
+    Seismic = enum.auto()
+
+
+@dataclass
+class LoadCombination:
+    name: str
+    # Load case id -> factor
+    factors: dict[int, float] = field(default_factory=dict)
+    combination_type: CombinationType = CombinationType.ULS
+    comb_id: int = 0
+
+
+def _case_name(lc: LoadCase) -> str:
+    return lc.name or f"LC{lc.load_id}"
+
+
+def _variable_factors(load_type: LoadTypeEnum, combination_type: CombinationType,
+                      gamma_Q: float) -> tuple[float, float]:
+    """
+    Returns factors of leading and accompanying variable action
+    """
+    if combination_type is CombinationType.ULS:
+        return gamma_Q, gamma_Q * load_type.psi0
+    if combination_type is CombinationType.SLS_characteristic:
+        return 1.0, load_type.psi0
+    if combination_type in (CombinationType.SLS_frequent, CombinationType.Accidental):
+        return load_type.psi1, load_type.psi2
+    return load_type.psi2, load_type.psi2
+
+
+def generate_combinations(load_cases: list[LoadCase],
+                          combination_type: CombinationType = CombinationType.ULS,
+                          gamma_G_sup: float = 1.35,
+                          gamma_G_inf: float = 1.0,
+                          gamma_Q: float = 1.5) -> list[LoadCombination]:
+    """
+    Generates load combinations of given load cases according to EN 1990 (6.10), (6.11b),
+    (6.12b) and (6.14b)-(6.16b).
+
+    Load cases of the same variable load type are alternatives (e.g. wind directions), so at
+    most one of them is included in a combination. Every included variable load case is in turn
+    the leading action. In ULS combinations permanent load cases are taken either all
+    unfavourable (gamma_G_sup) or all favourable (gamma_G_inf) and one imperfection load case is
+    included with factor 1.0. Accidental and seismic combinations include one accidental or
+    seismic load case each.
+    """
+    check_load_ids(load_cases)
+    permanent = []
+    special = {LoadTypeEnum.Imperfection: [], LoadTypeEnum.Accidental: [], LoadTypeEnum.Seismic: []}
+    variable: dict[LoadTypeEnum, list[LoadCase]] = {}
+    for lc in load_cases:
+        if lc.load_type is None:
+            raise ValueError(f"Load case {_case_name(lc)} has no load type")
+        if lc.load_type is LoadTypeEnum.Permanent:
+            permanent.append(lc)
+        elif lc.load_type.is_variable:
+            variable.setdefault(lc.load_type, []).append(lc)
+        else:
+            special[lc.load_type].append(lc)
+
+    if combination_type is CombinationType.ULS:
+        gammas_G = (gamma_G_sup,) if gamma_G_sup == gamma_G_inf else (gamma_G_sup, gamma_G_inf)
+        specials = special[LoadTypeEnum.Imperfection] or [None]
+    elif combination_type is CombinationType.Accidental:
+        gammas_G = (1.0,)
+        specials = special[LoadTypeEnum.Accidental]
+    elif combination_type is CombinationType.Seismic:
+        gammas_G = (1.0,)
+        specials = special[LoadTypeEnum.Seismic]
+    else:
+        gammas_G = (1.0,)
+        specials = [None]
+    has_leading = combination_type not in (CombinationType.SLS_quasi_permanent, CombinationType.Seismic)
+    factors_Q = {load_type: _variable_factors(load_type, combination_type, gamma_Q)
+                 for load_type in variable}
+
+    names = {lc.load_id: _case_name(lc) for lc in load_cases}
+    combinations = []
+    seen = set()
+    for gamma_G, extra in itertools.product(gammas_G, specials):
+        for choice in itertools.product(*([None] + cases for cases in variable.values())):
+            chosen = [lc for lc in choice if lc is not None]
+            for lead in (chosen if has_leading and chosen else [None]):
+                factors = {lc.load_id: gamma_G for lc in permanent}
+                if extra is not None:
+                    factors[extra.load_id] = 1.0
+                for lc in chosen:
+                    psi_lead, psi_acc = factors_Q[lc.load_type]
+                    factor = psi_lead if lc is lead else psi_acc
+                    if factor:
+                        factors[lc.load_id] = factor
+                key = frozenset(factors.items())
+                if not factors or key in seen:
+                    continue
+                seen.add(key)
+                name = " + ".join(f"{f:g}*{names[lid]}" for lid, f in factors.items())
+                combinations.append(LoadCombination(name, factors, combination_type, len(combinations)))
+    return combinations
+
+
+def factor_matrix(combinations: list[LoadCombination], load_ids: list[int]) -> np.ndarray:
+    """
+    Returns (n_combinations, n_cases) matrix of load case factors,
+    columns are in the order of load_ids
+    """
+    cols = {load_id: i for i, load_id in enumerate(load_ids)}
+    factors = np.zeros((len(combinations), len(load_ids)))
+    for row, comb in enumerate(combinations):
+        for load_id, factor in comb.factors.items():
+            factors[row, cols[load_id]] = factor
+    return factors
+
+
+def superpose(factors: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Superposes load case results
+
+    :param factors: (n_combinations, n_cases) matrix of load case factors
+    :param values: (n_cases, ...) array of load case results
+    :return: (n_combinations, ...) array of combined results
+    """
+    return np.tensordot(factors, values, axes=1)
@@ -16,4 +16,45 @@ class LoadTypeEnum(enum.Enum):
     Accidental
     Seismic
     """
+    Permanent = enum.auto()
+    Imposed_A = enum.auto()
+    Imposed_B = enum.auto()
+    Imposed_C = enum.auto()
+    Imposed_D = enum.auto()
+    Imposed_E = enum.auto()
+    Snow = enum.auto()
+    Wind = enum.auto()
+    Imperfection = enum.auto()
+    Temperature = enum.auto()
+    Accidental = enum.auto()
+    Seismic = enum.auto()
 
+    @property
+    def is_variable(self) -> bool:
+        return self in PSI
+
+    @property
+    def psi0(self) -> float:
+        return PSI[self][0]
+
+    @property
+    def psi1(self) -> float:
+        return PSI[self][1]
+
+    @property
+    def psi2(self) -> float:
+        return PSI[self][2]
+
+
+# Combination factors psi0, psi1, psi2 of variable actions, EN 1990 Table A1.1
+# Snow: Finland, Iceland, Norway, Sweden
+PSI: dict[LoadTypeEnum, tuple[float, float, float]] = {
+    LoadTypeEnum.Imposed_A: (0.7, 0.5, 0.3),
+    LoadTypeEnum.Imposed_B: (0.7, 0.5, 0.3),
+    LoadTypeEnum.Imposed_C: (0.7, 0.7, 0.6),
+    LoadTypeEnum.Imposed_D: (0.7, 0.7, 0.6),
+    LoadTypeEnum.Imposed_E: (1.0, 0.9, 0.8),
+    LoadTypeEnum.Snow: (0.7, 0.5, 0.2),
+    LoadTypeEnum.Wind: (0.6, 0.2, 0.0),
+    LoadTypeEnum.Temperature: (0.6, 0.5, 0.0),
+}
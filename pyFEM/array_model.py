@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy import sparse
+
+from pyFEM.coordinate_system import CoordinateSystem
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.pointload import PointLoad
+from pyFEM.support import NodalSupport
+
+
+def _section_properties(sections: list) -> np.ndarray:
+    return np.array([(sect.A, sect.Iy, sect.Iz, sect.It) for sect in sections],
+                    dtype=np.float64).reshape((-1, 4))
+
+
+def _material_properties(materials: list) -> np.ndarray:
+    return np.array([(mat.E, mat.G, mat.density) for mat in materials],
+                    dtype=np.float64).reshape((-1, 3))
+
+
+@dataclass
+class ArrayModel:
+    """
+    Struct-of-arrays representation of a frame model.
+    Nodes are referenced by their row in coordinates, elements by their row in connectivity.
+    """
+    # (n_nodes, 3) node coordinates
+    coordinates: np.ndarray
+    # (n_elems, 2) first and second node of elements
+    connectivity: np.ndarray
+    # (n_elems,) indices to sections and materials
+    element_section: np.ndarray
+    element_material: np.ndarray
+    # Section and material objects, their properties are tabulated in
+    # section_properties (A, Iy, Iz, It) and material_properties (E, G, density)
+    sections: list = field(default_factory=list)
+    materials: list = field(default_factory=list)
+    # (n_supports,) supported nodes, (n_supports, 6) restrained dofs and prescribed displacements
+    support_nodes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    restraints: np.ndarray = field(default_factory=lambda: np.zeros((0, 6), dtype=bool))
+    support_displacements: np.ndarray = field(default_factory=lambda: np.zeros((0, 6)))
+    # (n_pl,) loaded nodes, (n_pl, 6) point loads
+    pointload_nodes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    pointloads: np.ndarray = field(default_factory=lambda: np.zeros((0, 6)))
+    # (n_ll,) loaded elements, (n_ll, 12) line loads qx, qy, qz, mx, my, mz at both ends
+    lineload_elements: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    lineloads: np.ndarray = field(default_factory=lambda: np.zeros((0, 12)))
+    global_coordinate_system: CoordinateSystem = field(default_factory=CoordinateSystem)
+    section_properties: np.ndarray = field(init=False, repr=False)
+    material_properties: np.ndarray = field(init=False, repr=False)
+
+    # Results of processing stages
+    element_stiffness: np.ndarray = field(default=None, init=False, repr=False)
+    K: sparse.csr_matrix = field(default=None, init=False, repr=False)
+    F: np.ndarray = field(default=None, init=False, repr=False)
+    U: np.ndarray = field(default=None, init=False, repr=False)
+    R: np.ndarray = field(default=None, init=False, repr=False)
+    end_forces: np.ndarray = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.coordinates = np.asarray(self.coordinates, dtype=np.float64).reshape((-1, 3))
+        self.connectivity = np.asarray(self.connectivity, dtype=np.int64).reshape((-1, 2))
+        self.element_section = np.asarray(self.element_section, dtype=np.int64)
+        self.element_material = np.asarray(self.element_material, dtype=np.int64)
+        self.section_properties = _section_properties(self.sections)
+        self.material_properties = _material_properties(self.materials)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.coordinates)
+
+    @property
+    def n_elems(self) -> int:
+        return len(self.connectivity)
+
+    @property
+    def dofs(self) -> int:
+        return self.n_nodes * 6
+
+    @property
+    def fixed_dofs(self) -> np.ndarray:
+        """
+        Returns global indices of all restrained dofs
+        """
+        supp, dof = np.nonzero(self.restraints)
+        return self.support_nodes[supp] * 6 + dof
+
+    @property
+    def constraint_vector(self) -> np.ndarray:
+        """
+        Returns prescribed displacements of restrained dofs
+        """
+        return self.support_displacements[self.restraints]
+
+    @property
+    def element_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Returns elements' node ids, coordinates and cross-section properties as arrays,
+        see FEModel.element_arrays
+        """
+        sect = self.section_properties[self.element_section]
+        mat = self.material_properties[self.element_material]
+        return {"n1": self.connectivity[:, 0], "n2": self.connectivity[:, 1],
+                "coordinates1": self.coordinates[self.connectivity[:, 0]],
+                "coordinates2": self.coordinates[self.connectivity[:, 1]],
+                "E": mat[:, 0], "G": mat[:, 1], "rho": mat[:, 2], "A": sect[:, 0],
+                "Iy": sect[:, 1], "Iz": sect[:, 2], "It": sect[:, 3]}
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        Returns element lengths
+        """
+        return np.linalg.norm(self.coordinates[self.connectivity[:, 1]]
+                              - self.coordinates[self.connectivity[:, 0]], axis=-1)
+
+    @classmethod
+    def from_model(cls, model: FEModel) -> ArrayModel:
+        """
+        Creates array model from object based model. Node rows equal node ids.
+        Superelements have no array representation, so models with them are rejected.
+        """
+        if model.superelements:
+            raise ValueError("Array model does not support superelements")
+        nodes = sorted(model.node_list, key=lambda node: node.node_id)
+        elements = model.element_list
+        sections, materials = {}, {}
+        for elem in elements:
+            sections.setdefault(id(elem.section), (len(sections), elem.section))
+            materials.setdefault(id(elem.material), (len(materials), elem.material))
+        elem_rows = {elem.elem_id: i for i, elem in enumerate(elements)}
+        supports = model.support_list
+        pointloads = model.pointloads
+        lineloads = model.lineloads
+
+        return cls(
+            coordinates=np.array([(node.x, node.y, node.z) for node in nodes]),
+            connectivity=np.array([(elem.n1.node_id, elem.n2.node_id) for elem in elements]),
+            element_section=np.array([sections[id(elem.section)][0] for elem in elements]),
+            element_material=np.array([materials[id(elem.material)][0] for elem in elements]),
+            sections=[sect for _, sect in sections.values()],
+            materials=[mat for _, mat in materials.values()],
+            support_nodes=np.array([supp.node.node_id for supp in supports], dtype=np.int64),
+            restraints=np.array([supp.as_vector for supp in supports], dtype=bool).reshape((-1, 6)),
+            support_displacements=np.array([np.asarray(supp.displacement, dtype=np.float64)
+                                            for supp in supports]).reshape((-1, 6)),
+            pointload_nodes=np.array([pl.node.node_id for pl in pointloads], dtype=np.int64),
+            pointloads=np.array([pl.global_load_vector for pl in pointloads],
+                                dtype=np.float64).reshape((-1, 6)),
+            lineload_elements=np.array([elem_rows[ll.element.elem_id] for ll in lineloads],
+                                       dtype=np.int64),
+            lineloads=np.array([ll.load_vector for ll in lineloads],
+                               dtype=np.float64).reshape((-1, 12)),
+            global_coordinate_system=model.global_coordinate_system)
+
+    def to_model(self) -> FEModel:
+        """
+        Creates object based model, node ids equal node rows and element ids element rows.
+        Solved displacements and reactions are stored with load id 0.
+        """
+        model = FEModel(global_coordinate_system=self.global_coordinate_system)
+        nodes = [Node(*xyz) for xyz in self.coordinates.tolist()]
+        for i, node in enumerate(nodes):
+            node.node_id = i
+        model.node_id = len(nodes)
+        elements = [Element(nodes[n1], nodes[n2], self.sections[sect], self.materials[mat])
+                    for (n1, n2), sect, mat in zip(self.connectivity.tolist(),
+                                                   self.element_section.tolist(),
+                                                   self.element_material.tolist())]
+        for elem in elements:
+            model.add_element(elem)
+        for node_idx, restraint, disp in zip(self.support_nodes.tolist(), self.restraints,
+                                             self.support_displacements):
+            model.add_nodal_support(NodalSupport(nodes[node_idx], *restraint.tolist(),
+                                                 displacement=disp.copy()))
+        for node_idx, load in zip(self.pointload_nodes.tolist(), self.pointloads.tolist()):
+            model.add_pointload(PointLoad(nodes[node_idx], *load))
+        for elem_idx, q in zip(self.lineload_elements.tolist(), self.lineloads):
+            q = q.reshape((2, 6))
+            model.add_lineload(LineLoad(elements[elem_idx], *q.T.copy()))
+
+        if self.U is not None:
+            model.store_results(self.U, self.R, 0)
+        return model
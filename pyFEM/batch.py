@@ -0,0 +1,195 @@
+"""
+Batch runner for parametric studies of one model.
+
+Variants of a base model differ in sections, materials and load magnitude, so
+the topology, dof numbering, sparsity pattern, loads and element geometry are
+computed once from the base model and shared by all variants. Each variant only
+refreshes the stiffness values, factorizes and solves.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+
+import pyFEM.elem_funcs as ef
+import pyFEM.solver as solver
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+
+# Worker processes' copy of the study, set by the pool initializer
+_STUDY = None
+
+
+@dataclass
+class Topology:
+    """
+    Variant independent data of the base model
+    """
+    elem_ids: np.ndarray
+    # Node ids in dof numbering order
+    node_ids: np.ndarray
+    L: np.ndarray
+    dir_cos: np.ndarray
+    # (N, 12) elements' global dof indices
+    idxs: np.ndarray
+    plan: solver.AssemblyPlan
+    # Constant stiffness of superelements, None if the model has none
+    K_superelements: sparse.csr_matrix
+    fixed_dofs: np.ndarray
+    support_dofs: np.ndarray
+    restraints: np.ndarray
+    F: np.ndarray
+    # (N, 12) global equivalent nodal loads and (N, 2, 6) local distributed loads
+    F_eq: np.ndarray
+    q: np.ndarray
+    # (N, 9) base element properties E, G, A, Iy, Iz, It, fy, Wely, Welz
+    properties: np.ndarray
+
+
+def _properties(section, material) -> tuple:
+    return (material.E, material.G, section.A, section.Iy, section.Iz, section.It,
+            material.fy, section.Wely, section.Welz)
+
+
+class ParametricStudy:
+    """
+    Evaluates variants of a base model. Elements are overridden by groups,
+    e.g. {"columns": [0, 1, 2], "beams": [3, 4]}, and each variant is a dict
+
+        {"section": {"columns": SteelSection.IPE120},
+         "material": {"beams": steel.S275},
+         "load_factor": 1.2}
+
+    where all keys are optional. Results are returned as a structured array with one
+    row per variant: maximum nodal displacement, support reactions and the maximum
+    elastic utilisation |N| / (A fy) + |M_y| / (Wel_y fy) + |M_z| / (Wel_z fy).
+    """
+
+    def __init__(self, model: FEModel, groups: dict[str, list[int]] = None, n_stations: int = 11):
+        """
+        :param model: base model, elements' sections must provide Wely and Welz
+            and materials fy
+        :param groups: element ids of each element group
+        :param n_stations: number of stations per element where utilisation is checked
+        """
+        self.n_stations = n_stations
+        elem_rows = {elem_id: i for i, elem_id in enumerate(model.elements)}
+        self.groups = {name: np.array([elem_rows[elem_id] for elem_id in elem_ids], dtype=np.int64)
+                       for name, elem_ids in (groups or {}).items()}
+        self.topology = self._topology(model, elem_rows)
+
+    @staticmethod
+    def _topology(model: FEModel, elem_rows: dict[int, int]) -> Topology:
+        arrays = model.element_arrays
+        L, dir_cos = model.element_geometry(arrays)
+        plan = model.assembly_plan(arrays)
+        n_elems = len(L)
+        F_eq = np.zeros((n_elems, 12))
+        q = np.zeros((n_elems, 12))
+        for ll in model.loads.values():
+            if isinstance(ll, LineLoad):
+                i = elem_rows[ll.element.elem_id]
+                F_eq[i] += ll.global_load_vector
+                q[i] += ll.load_vector
+        properties = {}
+        for elem in model.element_list:
+            key = (id(elem.section), id(elem.material))
+            if key not in properties:
+                properties[key] = _properties(elem.section, elem.material)
+        offsets = model.dof_offsets
+        node_ids = np.array([node.node_id for node in model.node_list], dtype=np.int64)
+        supports = model.support_list
+        return Topology(
+            elem_ids=np.fromiter(model.elements, dtype=np.int64, count=n_elems),
+            node_ids=node_ids[np.argsort(offsets[node_ids])],
+            L=L, dir_cos=dir_cos, idxs=plan.element_dofs, plan=plan,
+            K_superelements=model.superelement_stiffness_matrix() if model.superelements else None,
+            fixed_dofs=model.fixed_dofs,
+            support_dofs=np.array([offsets[supp.node.node_id] + np.arange(6) for supp in supports],
+                                  dtype=np.int64).reshape((-1, 6)),
+            restraints=np.array([supp.as_vector for supp in supports], dtype=bool).reshape((-1, 6)),
+            F=model.global_load_vector.ravel(),
+            F_eq=F_eq,
+            q=ef.to_local(dir_cos, q).reshape((n_elems, 2, 6)),
+            properties=np.array([properties[id(elem.section), id(elem.material)]
+                                 for elem in model.element_list], dtype=np.float64).reshape((-1, 9)))
+
+    def result_dtype(self) -> np.dtype:
+        n_supports = len(self.topology.support_dofs)
+        return np.dtype([("variant", np.int64),
+                         ("max_displacement", np.float64),
+                         ("max_displacement_node", np.int64),
+                         ("reactions", np.float64, (n_supports, 6)),
+                         ("utilisation", np.float64),
+                         ("critical_element", np.int64)])
+
+    def variant_properties(self, variant: dict) -> np.ndarray:
+        """
+        Returns (N, 9) array of element properties of a variant
+        """
+        properties = self.topology.properties.copy()
+        for name, sect in variant.get("section", {}).items():
+            properties[self.groups[name], 2:6] = (sect.A, sect.Iy, sect.Iz, sect.It)
+            properties[self.groups[name], 7:] = (sect.Wely, sect.Welz)
+        for name, mat in variant.get("material", {}).items():
+            properties[self.groups[name], :2] = (mat.E, mat.G)
+            properties[self.groups[name], 6] = mat.fy
+        return properties
+
+    def analyse(self, i: int, variant: dict) -> tuple:
+        """
+        Solves one variant and returns its row of results
+        """
+        top = self.topology
+        load_factor = variant.get("load_factor", 1.0)
+        E, G, A, Iy, Iz, It, fy, Wely, Welz = self.variant_properties(variant).T
+        k0 = ef.local_stiffness_matrices(E, A, G, Iy, Iz, It, top.L)
+        K = top.plan.assemble(ef.transform_matrices(top.dir_cos, k0))
+        if top.K_superelements is not None:
+            K = (K + top.K_superelements).tocsr()
+        U, F_react = solver.reduced_static_load_analysis(K, load_factor * top.F, top.fixed_dofs)
+
+        translations = np.linalg.norm(U.reshape((-1, 6))[:, :3], axis=1)
+        position = int(np.argmax(translations))
+        u = ef.to_local(top.dir_cos, U[top.idxs])
+        end_forces = np.einsum('nij,nj->ni', k0, u) - load_factor * ef.to_local(top.dir_cos, top.F_eq)
+        _, forces = ef.section_forces(end_forces, load_factor * top.q, top.L, self.n_stations)
+        utilisation = (np.abs(forces[..., 0]) / (A * fy)[:, None]
+                       + np.abs(forces[..., 4]) / (Wely * fy)[:, None]
+                       + np.abs(forces[..., 5]) / (Welz * fy)[:, None]).max(axis=1)
+        elem_row = int(np.argmax(utilisation))
+        reactions = np.where(top.restraints, F_react[top.support_dofs], 0.0)
+        return (i, translations[position], top.node_ids[position], reactions,
+                utilisation[elem_row], top.elem_ids[elem_row])
+
+    def run(self, variants: list[dict], workers: int = None) -> np.ndarray:
+        """
+        Evaluates variants in a process pool
+
+        :param variants: parameter overrides of variants
+        :param workers: number of worker processes, defaults to number of CPUs,
+            variants are evaluated in this process if workers is 1
+        :return: structured array of results, one row per variant
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 1 or len(variants) == 1:
+            rows = [self.analyse(i, variant) for i, variant in enumerate(variants)]
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self,)) as pool:
+                rows = list(pool.map(_analyse, range(len(variants)), variants,
+                                     chunksize=max(len(variants) // (4 * workers), 1)))
+        return np.array(rows, dtype=self.result_dtype())
+
+
+def _init_worker(study: ParametricStudy) -> None:
+    global _STUDY
+    _STUDY = study
+
+
+def _analyse(i: int, variant: dict) -> tuple:
+    return _STUDY.analyse(i, variant)
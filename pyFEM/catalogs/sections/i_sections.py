@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# @Filename : i_sections
+# @Project: pyFEM
+"""
+Catalog of hot-rolled IPE, HEA, HEB and HEM sections.
+
+All sections are stored in one structured array TABLE, whose properties are computed
+once with the isection functions applied to arrays of dimensions. Rows are looked up
+by name and selected with range queries, e.g. the lightest section with
+Wply >= 500e3 mm^3:
+
+    row = lightest("Wply", 500e3, series="IPE")
+"""
+from __future__ import annotations
+
+import numpy as np
+
+import pyFEM.isection as isection
+
+# Dimensions h, b, tw, tf, r [mm]
+# https://eurocodeapplied.com/design/en1993/ipe-hea-heb-hem-design-properties
+DIMENSIONS = {
+    "IPE": {
+        80: (80, 46, 3.8, 5.2, 5), 100: (100, 55, 4.1, 5.7, 7), 120: (120, 64, 4.4, 6.3, 7),
+        140: (140, 73, 4.7, 6.9, 7), 160: (160, 82, 5.0, 7.4, 9), 180: (180, 91, 5.3, 8.0, 9),
+        200: (200, 100, 5.6, 8.5, 12), 220: (220, 110, 5.9, 9.2, 12), 240: (240, 120, 6.2, 9.8, 15),
+        270: (270, 135, 6.6, 10.2, 15), 300: (300, 150, 7.1, 10.7, 15), 330: (330, 160, 7.5, 11.5, 18),
+        360: (360, 170, 8.0, 12.7, 18), 400: (400, 180, 8.6, 13.5, 21), 450: (450, 190, 9.4, 14.6, 21),
+        500: (500, 200, 10.2, 16.0, 21), 550: (550, 210, 11.1, 17.2, 24), 600: (600, 220, 12.0, 19.0, 24),
+    },
+    "HEA": {
+        100: (96, 100, 5.0, 8.0, 12), 120: (114, 120, 5.0, 8.0, 12), 140: (133, 140, 5.5, 8.5, 12),
+        160: (152, 160, 6.0, 9.0, 15), 180: (171, 180, 6.0, 9.5, 15), 200: (190, 200, 6.5, 10.0, 18),
+        220: (210, 220, 7.0, 11.0, 18), 240: (230, 240, 7.5, 12.0, 21), 260: (250, 260, 7.5, 12.5, 24),
+        280: (270, 280, 8.0, 13.0, 24), 300: (290, 300, 8.5, 14.0, 27), 320: (310, 300, 9.0, 15.5, 27),
+        340: (330, 300, 9.5, 16.5, 27), 360: (350, 300, 10.0, 17.5, 27), 400: (390, 300, 11.0, 19.0, 27),
+        450: (440, 300, 11.5, 21.0, 27), 500: (490, 300, 12.0, 23.0, 27), 550: (540, 300, 12.5, 24.0, 27),
+        600: (590, 300, 13.0, 25.0, 27), 650: (640, 300, 13.5, 26.0, 27), 700: (690, 300, 14.5, 27.0, 27),
+        800: (790, 300, 15.0, 28.0, 30), 900: (890, 300, 16.0, 30.0, 30), 1000: (990, 300, 16.5, 31.0, 30),
+    },
+    "HEB": {
+        100: (100, 100, 6.0, 10.0, 12), 120: (120, 120, 6.5, 11.0, 12), 140: (140, 140, 7.0, 12.0, 12),
+        160: (160, 160, 8.0, 13.0, 15), 180: (180, 180, 8.5, 14.0, 15), 200: (200, 200, 9.0, 15.0, 18),
+        220: (220, 220, 9.5, 16.0, 18), 240: (240, 240, 10.0, 17.0, 21), 260: (260, 260, 10.0, 17.5, 24),
+        280: (280, 280, 10.5, 18.0, 24), 300: (300, 300, 11.0, 19.0, 27), 320: (320, 300, 11.5, 20.5, 27),
+        340: (340, 300, 12.0, 21.5, 27), 360: (360, 300, 12.5, 22.5, 27), 400: (400, 300, 13.5, 24.0, 27),
+        450: (450, 300, 14.0, 26.0, 27), 500: (500, 300, 14.5, 28.0, 27), 550: (550, 300, 15.0, 29.0, 27),
+        600: (600, 300, 15.5, 30.0, 27), 650: (650, 300, 16.0, 31.0, 27), 700: (700, 300, 17.0, 32.0, 27),
+        800: (800, 300, 17.5, 33.0, 30), 900: (900, 300, 18.5, 35.0, 30), 1000: (1000, 300, 19.0, 36.0, 30),
+    },
+    "HEM": {
+        100: (120, 106, 12.0, 20.0, 12), 120: (140, 126, 12.5, 21.0, 12), 140: (160, 146, 13.0, 22.0, 12),
+        160: (180, 166, 14.0, 23.0, 15), 180: (200, 186, 14.5, 24.0, 15), 200: (220, 206, 15.0, 25.0, 18),
+        220: (240, 226, 15.5, 26.0, 18), 240: (270, 248, 18.0, 32.0, 21), 260: (290, 268, 18.0, 32.5, 24),
+        280: (310, 288, 18.5, 33.0, 24), 300: (340, 310, 21.0, 39.0, 27), 320: (359, 309, 21.0, 40.0, 27),
+        340: (377, 309, 21.0, 40.0, 27), 360: (395, 308, 21.0, 40.0, 27), 400: (432, 307, 21.0, 40.0, 27),
+        450: (478, 307, 21.0, 40.0, 27), 500: (524, 306, 21.0, 40.0, 27), 550: (572, 306, 21.0, 40.0, 27),
+        600: (620, 305, 21.0, 40.0, 27), 650: (668, 305, 21.0, 40.0, 27), 700: (716, 304, 21.0, 40.0, 27),
+        800: (814, 303, 21.0, 40.0, 30), 900: (910, 302, 21.0, 40.0, 30), 1000: (1008, 302, 21.0, 40.0, 30),
+    },
+}
+# Density of steel used for mass per length [kg/m^3]
+DENSITY = 7850
+
+# Computed properties and their isection functions
+PROPERTIES = {
+    "A": isection.area, "Av": isection.shear_area, "Au": isection.perimeter,
+    "Iy": isection.Iy, "Iz": isection.Iz, "It": isection.It, "Iw": isection.Iw,
+    "Wely": isection.Wely, "Welz": isection.Welz, "Wply": isection.Wply, "Wplz": isection.Wplz,
+}
+DTYPE = np.dtype([("name", "U8"), ("sect_type", "U3"), ("size", np.int64),
+                  ("h", np.float64), ("b", np.float64), ("tw", np.float64), ("tf", np.float64),
+                  ("r", np.float64), ("mass", np.float64)]
+                 + [(name, np.float64) for name in PROPERTIES] + [("iy", np.float64), ("iz", np.float64)])
+
+
+def _table() -> np.ndarray:
+    rows = [(sect_type + str(size), sect_type, size) + dims
+            for sect_type, sizes in DIMENSIONS.items() for size, dims in sizes.items()]
+    table = np.zeros(len(rows), dtype=DTYPE)
+    for i, name in enumerate(("name", "sect_type", "size", "h", "b", "tw", "tf", "r")):
+        table[name] = [row[i] for row in rows]
+    dims = (table["h"], table["b"], table["tf"], table["tw"], table["r"])
+    for name, func in PROPERTIES.items():
+        table[name] = func(*dims)
+    # Mass per length [kg/m]
+    table["mass"] = table["A"] * 1e-6 * DENSITY
+    table["iy"] = np.sqrt(table["Iy"] / table["A"])
+    table["iz"] = np.sqrt(table["Iz"] / table["A"])
+    table.flags.writeable = False
+    return table
+
+
+TABLE = _table()
+# Row of each section name
+INDEX = {name: i for i, name in enumerate(TABLE["name"].tolist())}
+# Rows of each series
+SERIES = {sect_type: np.flatnonzero(TABLE["sect_type"] == sect_type) for sect_type in DIMENSIONS}
+# Sorted values and lightest rows of range queries, keyed by (property, series)
+_ranges = {}
+
+
+def index(name: str) -> int:
+    """
+    Returns row of section, e.g. "HEA300" or "HEA 300"
+    """
+    return INDEX[name.replace(" ", "").upper()]
+
+
+def row(name: str) -> np.void:
+    """
+    Returns all properties of section as a record
+    """
+    return TABLE[index(name)]
+
+
+def _range(prop: str, series: str | None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns property values in ascending order and, for each position, the lightest
+    row whose value is at least the value at that position
+    """
+    key = (prop, series)
+    if key not in _ranges:
+        rows = SERIES[series] if series is not None else np.arange(len(TABLE))
+        order = rows[np.argsort(TABLE[prop][rows], kind="stable")]
+        mass = TABLE["mass"][order]
+        # Suffix minimum of mass, ties resolved to the smaller property value
+        lightest = np.empty(len(order), dtype=np.int64)
+        best = len(order) - 1
+        for i in range(len(order) - 1, -1, -1):
+            if mass[i] <= mass[best]:
+                best = i
+            lightest[i] = order[best]
+        _ranges[key] = (TABLE[prop][order], lightest)
+    return _ranges[key]
+
+
+def lightest(prop: str, minimum, series: str = None):
+    """
+    Returns row of the lightest section whose property is at least minimum.
+    Minimum may be an array, in which case an array of rows is returned.
+    Rows are -1 where no section is sufficient.
+
+    :param prop: property name, e.g. "Wply" or "Iy"
+    :param minimum: required value or values of the property
+    :param series: "IPE", "HEA", "HEB" or "HEM", defaults to all series
+    """
+    values, rows = _range(prop, series)
+    position = np.searchsorted(values, minimum, side="left")
+    result = np.where(position < len(values), rows[np.minimum(position, len(values) - 1)], -1)
+    return int(result) if np.ndim(result) == 0 else result
+
+
+def select(series: str = None, **bounds) -> np.ndarray:
+    """
+    Returns rows of sections whose properties are within bounds in ascending order of mass,
+    e.g. select("HEB", h=(None, 300), Wply=(1e6, None))
+
+    :param series: "IPE", "HEA", "HEB" or "HEM", defaults to all series
+    :param bounds: (minimum, maximum) of properties, None for no limit
+    """
+    rows = SERIES[series] if series is not None else np.arange(len(TABLE))
+    mask = np.ones(len(rows), dtype=bool)
+    for prop, (low, high) in bounds.items():
+        values = TABLE[prop][rows]
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+    rows = rows[mask]
+    return rows[np.argsort(TABLE["mass"][rows], kind="stable")]
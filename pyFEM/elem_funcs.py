@@ -146,3 +146,329 @@ def transformation_matrix(local_coordinate_system: CoordinateSystem,
     t_matrix = np.zeros((12, 12))
     t_matrix[0:3, 0:3] = t_matrix[3:6, 3:6] = t_matrix[6:9, 6:9] = t_matrix[9:12, 9:12] = dir_cos_matrix
     return t_matrix
+
+
+def unit_vectors(vectors: np.ndarray) -> np.ndarray:
+    """
+    Returns the unit vectors of given (N, 3) array of vectors
+    """
+
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def local_axes(coordinates1: np.ndarray, coordinates2: np.ndarray,
+               up: np.ndarray = None) -> np.ndarray:
+    """
+    Calculates local coordinate axes of N elements
+
+    :param coordinates1: (N, 3) array of elements' first node coordinates
+    :param coordinates2: (N, 3) array of elements' second node coordinates
+    :param up: global up -direction
+    :return: (N, 3, 3) array, rows are local x, y and z axes
+    """
+    if up is None:
+        up = np.array([0, 0, 1])
+    x = unit_vectors(np.asarray(coordinates2, dtype=np.float64) - coordinates1)
+    up = unit_vector(np.asarray(up, dtype=np.float64))
+    x_up = x @ up
+    vertical = np.abs(1 - np.abs(x_up)) <= 1e-10
+
+    z = np.empty_like(x)
+    # Vector rejection of up -direction from element's axis
+    z[~vertical] = unit_vectors(up - x_up[~vertical, None] * x[~vertical])
+    z[vertical] = [1, 0, 0]
+    y = np.empty_like(x)
+    y[~vertical] = unit_vectors(np.cross(z[~vertical], x[~vertical]))
+    y[vertical] = [0, 1, 0]
+
+    return np.stack((x, y, z), axis=1)
+
+
+def direction_cosine_matrices(axes: np.ndarray,
+                              global_coordinate_system: CoordinateSystem) -> np.ndarray:
+    """
+    Calculates direction cosine matrices of N local coordinate systems
+
+    :param axes: (N, 3, 3) array of local axes, see local_axes
+    :param global_coordinate_system:
+    :return: (N, 3, 3) array of direction cosine matrices
+    """
+    global_axes = unit_vectors(np.array([global_coordinate_system.X,
+                                         global_coordinate_system.Y,
+                                         global_coordinate_system.Z], dtype=np.float64))
+
+    return np.clip(axes @ global_axes.T, a_min=-1.0, a_max=1.0)
+
+
+def local_stiffness_matrices(E: np.ndarray, A: np.ndarray, G: np.ndarray, Iy: np.ndarray,
+                             Iz: np.ndarray, J: np.ndarray, L: np.ndarray) -> np.ndarray:
+    """
+    Calculates local stiffness matrices of N elements
+
+    :return: (N, 12, 12) array of local stiffness matrices
+    """
+    E, A, G, Iy, Iz, J, L = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64)
+                                                  for a in (E, A, G, Iy, Iz, J, L)))
+    EA_L = E * A / L
+    GJ_L = G * J / L
+    EIy = E * Iy
+    EIz = E * Iz
+    L2 = L ** 2
+    L3 = L ** 3
+
+    k_elem = np.zeros((len(L), 12, 12))
+    # Fill the upper right triangle of matrices
+    k_elem[:, 0, 0] = k_elem[:, 6, 6] = EA_L
+    k_elem[:, 0, 6] = -EA_L
+    k_elem[:, 1, 1] = k_elem[:, 7, 7] = 12 * EIz / L3
+    k_elem[:, 1, 7] = -12 * EIz / L3
+    k_elem[:, 1, 5] = k_elem[:, 1, 11] = 6 * EIz / L2
+    k_elem[:, 5, 7] = k_elem[:, 7, 11] = -6 * EIz / L2
+    k_elem[:, 2, 2] = k_elem[:, 8, 8] = 12 * EIy / L3
+    k_elem[:, 2, 8] = -12 * EIy / L3
+    k_elem[:, 2, 4] = k_elem[:, 2, 10] = -6 * EIy / L2
+    k_elem[:, 4, 8] = k_elem[:, 8, 10] = 6 * EIy / L2
+    k_elem[:, 3, 3] = k_elem[:, 9, 9] = GJ_L
+    k_elem[:, 3, 9] = -GJ_L
+    k_elem[:, 4, 4] = k_elem[:, 10, 10] = 4 * EIy / L
+    k_elem[:, 4, 10] = 2 * EIy / L
+    k_elem[:, 5, 5] = k_elem[:, 11, 11] = 4 * EIz / L
+    k_elem[:, 5, 11] = 2 * EIz / L
+
+    # Local stiffness matrices are symmetrical along diagonal
+    # add transpose of the upper triangle
+    k_elem += np.transpose(np.triu(k_elem, k=1), (0, 2, 1))
+    return k_elem
+
+
+def transform_matrices(dir_cos_matrices: np.ndarray, k0: np.ndarray) -> np.ndarray:
+    """
+    Computes T.T @ k0 @ T for N elements using the block diagonal structure
+    of the transformation matrix T
+
+    :param dir_cos_matrices: (N, 3, 3) array of direction cosine matrices
+    :param k0: (N, 12, 12) array of local matrices
+    :return: (N, 12, 12) array of global matrices
+    """
+    n = len(k0)
+    blocks = k0.reshape((n, 4, 3, 4, 3))
+    return np.einsum('nki,nakbl,nlj->naibj',
+                     dir_cos_matrices, blocks, dir_cos_matrices,
+                     optimize=True).reshape((n, 12, 12))
+
+
+def element_geometry(coordinates1: np.ndarray, coordinates2: np.ndarray,
+                     global_coordinate_system: CoordinateSystem = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes lengths and direction cosine matrices of N elements
+
+    :param coordinates1: (N, 3) array of elements' first node coordinates
+    :param coordinates2: (N, 3) array of elements' second node coordinates
+    :param global_coordinate_system: global coordinate system, its Z -axis is the up -direction
+    :return: (N,) array of lengths and (N, 3, 3) array of direction cosine matrices
+    """
+    if global_coordinate_system is None:
+        global_coordinate_system = CoordinateSystem()
+    coordinates1 = np.asarray(coordinates1, dtype=np.float64)
+    coordinates2 = np.asarray(coordinates2, dtype=np.float64)
+    L = np.linalg.norm(coordinates2 - coordinates1, axis=-1)
+    axes = local_axes(coordinates1, coordinates2, global_coordinate_system.Z)
+    return L, direction_cosine_matrices(axes, global_coordinate_system)
+
+
+def stiffness_matrices(coordinates1: np.ndarray, coordinates2: np.ndarray,
+                       E: np.ndarray, G: np.ndarray, A: np.ndarray,
+                       Iy: np.ndarray, Iz: np.ndarray, It: np.ndarray,
+                       global_coordinate_system: CoordinateSystem = None) -> np.ndarray:
+    """
+    Computes global stiffness matrices of N elements at once
+
+    :param coordinates1: (N, 3) array of elements' first node coordinates
+    :param coordinates2: (N, 3) array of elements' second node coordinates
+    :param global_coordinate_system: global coordinate system, its Z -axis is the up -direction
+    :return: (N, 12, 12) array of elements' global stiffness matrices
+    """
+    L, dir_cos = element_geometry(coordinates1, coordinates2, global_coordinate_system)
+    k0 = local_stiffness_matrices(E, A, G, Iy, Iz, It, L)
+    return transform_matrices(dir_cos, k0)
+
+
+def dof_indices(offsets1: np.ndarray, offsets2: np.ndarray, dofs: int = 6) -> np.ndarray:
+    """
+    Returns (N, 2 * dofs) array of elements' global dof indices
+
+    :param offsets1: (N,) array of first global dof indices of elements' first nodes
+    :param offsets2: (N,) array of first global dof indices of elements' second nodes
+    """
+    local = np.arange(dofs)
+    return np.concatenate((np.asarray(offsets1)[:, None] + local,
+                           np.asarray(offsets2)[:, None] + local), axis=1)
+
+
+def to_local(dir_cos_matrices: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    Transforms (N, 3 * k) array of global vectors to elements' local coordinates,
+    i.e. computes T @ v for each element
+
+    :param dir_cos_matrices: (N, 3, 3) array of direction cosine matrices
+    :param vectors: (N, 3 * k) array of global vectors
+    :return: (N, 3 * k) array of local vectors
+    """
+    n = len(vectors)
+    return np.einsum('nij,naj->nai',
+                     dir_cos_matrices,
+                     vectors.reshape((n, -1, 3))).reshape((n, -1))
+
+
+def to_global(dir_cos_matrices: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    Transforms (N, 3 * k) array of local vectors to global coordinates,
+    i.e. computes T.T @ v for each element
+    """
+    n = len(vectors)
+    return np.einsum('nji,naj->nai',
+                     dir_cos_matrices,
+                     vectors.reshape((n, -1, 3))).reshape((n, -1))
+
+
+def section_forces(end_forces: np.ndarray, q: np.ndarray, L: np.ndarray,
+                   n_stations: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates section forces of N elements at evenly spaced stations
+
+    :param end_forces: (N, 12) array of local forces acting on elements at their nodes
+    :param q: (N, 2, 6) array of local distributed loads qx, qy, qz, mx, my, mz at element's ends
+    :param L: (N,) array of element lengths
+    :param n_stations: number of stations per element, including both ends
+    :return: (N, S) array of station distances from first node and
+        (N, S, 6) array of section forces N, V_y, V_z, M_T, M_y, M_z
+    """
+    x = L[:, None] * np.linspace(0, 1, n_stations)
+    xs = x[..., None]
+    qa = q[:, None, 0]
+    dq = ((q[:, 1] - q[:, 0]) / L[:, None])[:, None]
+    # Resultants and moments of distributed loads between first node and station
+    Q1 = qa * xs + dq * xs ** 2 / 2
+    Q2 = qa * xs ** 2 / 2 + dq * xs ** 3 / 6
+    f1 = end_forces[:, None, :6]
+
+    forces = -f1 - Q1
+    forces[..., 4] += -x * f1[..., 2] - Q2[..., 2]
+    forces[..., 5] += x * f1[..., 1] + Q2[..., 1]
+    return x, forces
+
+
+def line_load_vectors(q: np.ndarray, L: np.ndarray) -> np.ndarray:
+    """
+    Calculates equivalent nodal load vectors of N line loads
+
+    :param q: (N, 12) array of line loads qx, qy, qz, mx, my, mz at first and second node
+    :param L: (N,) array of element lengths
+    :return: (N, 12) array of equivalent nodal loads
+    """
+    q = np.asarray(q, dtype=np.float64).reshape((-1, 12))
+    L = np.asarray(L, dtype=np.float64).reshape(-1)
+    L2 = L ** 2
+    qx1, qy1, qz1, mx1, my1, mz1 = q[:, :6].T
+    qx2, qy2, qz2, mx2, my2, mz2 = q[:, 6:].T
+
+    return np.stack((qx1 * L / 2,
+                     qy1 * L / 2 - mz1,
+                     qz1 * L / 2 + my1,
+                     mx1 * L / 2,
+                     -qz1 * L2 / 12,
+                     qy1 * L2 / 12,
+                     qx2 * L / 2,
+                     qy2 * L / 2 + mz2,
+                     qz2 * L / 2 - my2,
+                     mx2 * L / 2,
+                     qz2 * L2 / 12,
+                     -qy2 * L2 / 12), axis=1)
+
+
+def local_geometric_stiffness_matrices(N: np.ndarray, L: np.ndarray, A: np.ndarray,
+                                       Ip: np.ndarray) -> np.ndarray:
+    """
+    Calculates local geometric stiffness matrices of N elements
+
+    :param N: (N,) array of axial forces, tension positive
+    :param L: (N,) array of element lengths
+    :param A: (N,) array of cross-section areas
+    :param Ip: (N,) array of polar moments of area
+    :return: (N, 12, 12) array of local geometric stiffness matrices
+    """
+    N, L, A, Ip = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (N, L, A, Ip)))
+    P_L = N / L
+    L2 = L ** 2
+
+    kg = np.zeros((len(L), 12, 12))
+    # Fill the upper right triangle of matrices
+    kg[:, 1, 1] = kg[:, 7, 7] = kg[:, 2, 2] = kg[:, 8, 8] = 6 / 5 * P_L
+    kg[:, 1, 7] = kg[:, 2, 8] = -6 / 5 * P_L
+    kg[:, 1, 5] = kg[:, 1, 11] = kg[:, 4, 8] = kg[:, 8, 10] = N / 10
+    kg[:, 2, 4] = kg[:, 2, 10] = kg[:, 5, 7] = kg[:, 7, 11] = -N / 10
+    kg[:, 3, 3] = kg[:, 9, 9] = P_L * Ip / A
+    kg[:, 3, 9] = -P_L * Ip / A
+    kg[:, 4, 4] = kg[:, 5, 5] = kg[:, 10, 10] = kg[:, 11, 11] = 2 / 15 * P_L * L2
+    kg[:, 4, 10] = kg[:, 5, 11] = -P_L * L2 / 30
+
+    # Geometric stiffness matrices are symmetrical along diagonal
+    # add transpose of the upper triangle
+    kg += np.transpose(np.triu(kg, k=1), (0, 2, 1))
+    return kg
+
+
+def local_mass_matrices(rho: np.ndarray, A: np.ndarray, Ip: np.ndarray,
+                        L: np.ndarray) -> np.ndarray:
+    """
+    Calculates local consistent mass matrices of N elements
+
+    :param rho: (N,) array of densities
+    :param A: (N,) array of cross-section areas
+    :param Ip: (N,) array of polar moments of area
+    :param L: (N,) array of element lengths
+    :return: (N, 12, 12) array of local consistent mass matrices
+    """
+    rho, A, Ip, L = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (rho, A, Ip, L)))
+    mL = rho * A * L
+    c = mL / 420
+    L2 = L ** 2
+
+    m_elem = np.zeros((len(L), 12, 12))
+    # Fill the upper right triangle of matrices
+    m_elem[:, 0, 0] = m_elem[:, 6, 6] = mL / 3
+    m_elem[:, 0, 6] = mL / 6
+    m_elem[:, 1, 1] = m_elem[:, 7, 7] = m_elem[:, 2, 2] = m_elem[:, 8, 8] = 156 * c
+    m_elem[:, 1, 7] = m_elem[:, 2, 8] = 54 * c
+    m_elem[:, 1, 5] = m_elem[:, 8, 10] = 22 * L * c
+    m_elem[:, 7, 11] = m_elem[:, 2, 4] = -22 * L * c
+    m_elem[:, 5, 7] = m_elem[:, 2, 10] = 13 * L * c
+    m_elem[:, 1, 11] = m_elem[:, 4, 8] = -13 * L * c
+    m_elem[:, 3, 3] = m_elem[:, 9, 9] = mL * Ip / A / 3
+    m_elem[:, 3, 9] = mL * Ip / A / 6
+    m_elem[:, 4, 4] = m_elem[:, 10, 10] = m_elem[:, 5, 5] = m_elem[:, 11, 11] = 4 * L2 * c
+    m_elem[:, 4, 10] = m_elem[:, 5, 11] = -3 * L2 * c
+
+    # Mass matrices are symmetrical along diagonal
+    # add transpose of the upper triangle
+    m_elem += np.transpose(np.triu(m_elem, k=1), (0, 2, 1))
+    return m_elem
+
+
+def lumped_masses(rho: np.ndarray, A: np.ndarray, Iy: np.ndarray, Iz: np.ndarray,
+                  L: np.ndarray, dir_cos_matrices: np.ndarray) -> np.ndarray:
+    """
+    Calculates diagonals of global lumped mass matrices of N elements.
+    Half of element's mass is lumped to each node. Rotational masses are the rotary
+    inertias of the cross-section, of which only the diagonal in global axes is kept.
+
+    :param dir_cos_matrices: (N, 3, 3) array of direction cosine matrices
+    :return: (N, 12) array of nodal masses
+    """
+    rho, A, Iy, Iz, L = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64)
+                                              for a in (rho, A, Iy, Iz, L)))
+    half = rho * L / 2
+    rotary = half[:, None] * np.stack((Iy + Iz, Iy, Iz), axis=1)
+    nodal = np.concatenate((np.repeat((half * A)[:, None], 3, axis=1),
+                            np.einsum('nki,nk->ni', dir_cos_matrices ** 2, rotary)), axis=1)
+    return np.concatenate((nodal, nodal), axis=1)
@@ -1,3 +1,5 @@
+import functools
+import warnings
 from dataclasses import dataclass, field
 from typing import Protocol
 
@@ -27,6 +29,35 @@ class Section(Protocol):
     It: float
 
 
+def _memoized(func):
+    """
+    Memoizes element's property value when element's caching is enabled.
+    Cached values are dropped when element's nodes move or are renumbered, or when
+    its nodes, section, material or coordinate system are replaced.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        if not self.cached:
+            return func(self)
+        cache = self._cache
+        state = self.state
+        cached_state = cache.get(None)
+        # Section, material and coordinate system are compared by identity
+        if (cached_state is None or cached_state[:8] != state[:8]
+                or any(a is not b for a, b in zip(cached_state[8:], state[8:]))):
+            cache.clear()
+            cache[None] = state
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+            return value
+
+    return wrapper
+
+
 @dataclass(slots=True)
 class Element:
     n1: 'Node'
@@ -36,6 +67,27 @@ class Element:
     elem_id: int = field(init=False)
     global_coordinate_system: CoordinateSystem = field(default_factory=CoordinateSystem)
     has_load: bool = False
+    # Opt-in memoization of geometry and stiffness
+    cached: bool = False
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def invalidate(self) -> None:
+        """
+        Clears element's cached values, e.g. after modifying its section in place
+        """
+        cache = getattr(self, "_cache", None)
+        if cache:
+            cache.clear()
+
+    @property
+    def state(self) -> tuple:
+        """
+        Returns element's nodes' coordinates and ids, section, material and coordinate
+        system, used to validate cached values
+        """
+        n1, n2 = self.n1, self.n2
+        return (n1.x, n1.y, n1.z, n2.x, n2.y, n2.z, n1.node_id, n2.node_id,
+                self.section, self.material, self.global_coordinate_system)
 
     @property
     def up(self) -> np.ndarray:
@@ -45,6 +97,7 @@ class Element:
         return self.global_coordinate_system.Z
 
     @property
+    @_memoized
     def local_coordinate_system(self) -> CoordinateSystem:
         """
         Returns element's local coordinate system
@@ -68,6 +121,7 @@ class Element:
         return np.array([self.n1.coordinate, self.n2.coordinate])
 
     @property
+    @_memoized
     def L(self) -> float:
         """
         Returns element's length
@@ -103,6 +157,7 @@ class Element:
         return self.n2.coordinate - self.n1.coordinate
 
     @property
+    @_memoized
     def unit_vector(self) -> np.ndarray:
         """
         Returns element's unit vector
@@ -117,6 +172,7 @@ class Element:
         return self.n1.coordinate + self.unit_vector * self.L * 0.5
 
     @property
+    @_memoized
     def local_stiffness_matrix(self) -> np.ndarray:
         """
         Returns element's local stiffness matrix
@@ -130,6 +186,7 @@ class Element:
                                          self.L)
 
     @property
+    @_memoized
     def transformation_matrix(self) -> np.ndarray:
         """
         Retrurns element's transformation matrix
@@ -138,6 +195,7 @@ class Element:
                                         self.global_coordinate_system)
 
     @property
+    @_memoized
     def stiffness_matrix(self) -> np.ndarray:
         """
         Returns element's global stiffness matrix
@@ -153,18 +211,32 @@ class Element:
     def dofs(self):
         return len(self.n1.coordinate) * 2
 
+    def dof_indices(self, offsets: np.ndarray = None) -> np.ndarray:
+        """
+        Returns element's 12 global dof indices
+
+        :param offsets: nodes' first global dof indices indexed by node id,
+            see FEModel.dof_offsets, defaults to node id order
+        """
+        n1_id, n2_id = self.n1.node_id, self.n2.node_id
+        if offsets is None:
+            return ef.dof_indices([n1_id * self.dofs], [n2_id * self.dofs], self.dofs)[0]
+        return ef.dof_indices(offsets[[n1_id]], offsets[[n2_id]], self.dofs)[0]
+
     @property
     def idxs(self) -> np.ndarray:
-        n1_id = self.n1.node_id * self.dofs
-        n2_id = self.n2.node_id * self.dofs
-        idxs = np.append(np.arange(n1_id, n1_id + self.dofs, dtype=np.uint32),
-                         np.arange(n2_id, n2_id + self.dofs, dtype=np.uint32))
-        return idxs
+        warnings.warn("Element.idxs ignores dof reordering, use Element.dof_indices(model.dof_offsets)",
+                      DeprecationWarning, stacklevel=2)
+        return self.dof_indices()
 
     @property
     def rows(self) -> np.ndarray:
-        return np.repeat(self.idxs, 12)
+        warnings.warn("Element.rows ignores dof reordering, use Element.dof_indices(model.dof_offsets)",
+                      DeprecationWarning, stacklevel=2)
+        return np.repeat(self.dof_indices(), 12)
 
     @property
     def cols(self) -> np.ndarray:
-        return np.tile(self.idxs, 12)
+        warnings.warn("Element.cols ignores dof reordering, use Element.dof_indices(model.dof_offsets)",
+                      DeprecationWarning, stacklevel=2)
+        return np.tile(self.dof_indices(), 12)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pyFEM.section import BaseSection
 import numpy as np
 
@@ -10,14 +10,15 @@ def area(h, b, tf, tw, r):
 
 
 def shear_area(h, b, tf, tw, r):
-    # Shear area of section [mm^2]
-    Ashear = A - 2.0 * b * tf + (tw + 2.0 * r) * tf
+    # Shear area of section for load parallel to web [mm^2]
+    Ashear = area(h, b, tf, tw, r) - 2.0 * b * tf + (tw + 2.0 * r) * tf
     return Ashear
 
 
 def perimeter(h, b, tf, tw, r):
-    # Perimeter of cross-section
-    Au = 4 * (b - 2 * r) + 2 * (h - 2 * tw) + 2 * np.pi * r
+    # Perimeter of cross-section [mm]
+    Au = 4 * (b - 2 * r) + 2 * (h - tw) + 2 * np.pi * r
+    return Au
 
 
 def Iy(h, b, tf, tw, r):
@@ -88,6 +89,24 @@ class ISection(BaseSection):
     tw: float
     tf: float
     r: float
+    # Catalog designation, e.g. "HEA 300", whose size is not the height of HE sections
+    designation: str = None
+    # Precomputed properties and the dimensions they are valid for, see set_properties
+    _properties: tuple = field(default=None, init=False, repr=False, compare=False)
+
+    def set_properties(self, row) -> None:
+        """
+        Stores properties of a catalog table row, which are returned instead of
+        evaluating the formulas as long as the dimensions are not modified
+        """
+        self._properties = (self.dimensions, {name: float(row[name]) for name in row.dtype.names
+                                              if row.dtype[name].kind == "f"})
+
+    def _property(self, name: str, func):
+        dimensions = self.dimensions
+        if self._properties is not None and self._properties[0] == dimensions:
+            return self._properties[1][name]
+        return func(*dimensions)
 
     @property
     def dimensions(self):
@@ -95,15 +114,15 @@ class ISection(BaseSection):
 
     @property
     def A(self):
-        return area(*self.dimensions)
+        return self._property("A", area)
 
     @property
     def Iy(self):
-        return Iy(*self.dimensions)
+        return self._property("Iy", Iy)
 
     @property
     def Iz(self):
-        return Iz(*self.dimensions)
+        return self._property("Iz", Iz)
 
     @property
     def I(self):
@@ -111,8 +130,30 @@ class ISection(BaseSection):
 
     @property
     def It(self):
-        return It(*self.dimensions)
+        return self._property("It", It)
+
+    @property
+    def Iw(self):
+        return self._property("Iw", Iw)
+
+    @property
+    def Wely(self):
+        return self._property("Wely", Wely)
+
+    @property
+    def Welz(self):
+        return self._property("Welz", Welz)
+
+    @property
+    def Wply(self):
+        return self._property("Wply", Wply)
+
+    @property
+    def Wplz(self):
+        return self._property("Wplz", Wplz)
 
     @property
     def name(self):
+        if self.designation is not None:
+            return self.designation
         return self.sect_type + " " + str(self.h)
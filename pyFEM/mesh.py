@@ -0,0 +1,162 @@
+"""
+Preprocessing of member geometry into nodes and elements.
+
+Members are subdivided into elements with vectorized node generation, and coincident
+nodes are merged with a KD-tree: all pairs of points closer than the tolerance are
+found in O(n log n) and points connected by such pairs become one node. Merging
+is transitive, so a chain of points each within tolerance of the next is merged
+even if its ends are further apart.
+"""
+from __future__ import annotations
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+from scipy.spatial import cKDTree
+
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.node import Node
+from pyFEM.pointload import PointLoad
+
+# Default tolerance of coincident nodes [mm]
+TOLERANCE = 1e-3
+
+
+def subdivide(coordinates1: np.ndarray, coordinates2: np.ndarray,
+              n: int | np.ndarray = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Divides members into equal elements
+
+    :param coordinates1: (M, 3) array of members' start points
+    :param coordinates2: (M, 3) array of members' end points
+    :param n: number of elements per member, scalar or (M,) array
+    :return: (P, 3) array of points, (E, 2) array of elements' point indices and
+        (E,) array of elements' member indices. Members' end points are repeated
+        for every member, see merge_points.
+    """
+    c1 = np.asarray(coordinates1, dtype=np.float64).reshape((-1, 3))
+    c2 = np.asarray(coordinates2, dtype=np.float64).reshape((-1, 3))
+    n = np.broadcast_to(np.asarray(n, dtype=np.int64), len(c1))
+    if np.any(n < 1):
+        raise ValueError("Members must be divided into at least one element")
+    counts = n + 1
+    starts = np.cumsum(counts) - counts
+    member = np.repeat(np.arange(len(c1)), counts)
+    k = np.arange(counts.sum()) - starts[member]
+    t = (k / n[member])[:, None]
+    points = c1[member] + t * (c2 - c1)[member]
+
+    elem_member = np.repeat(np.arange(len(c1)), n)
+    first = starts[elem_member] + np.arange(n.sum()) - (np.cumsum(n) - n)[elem_member]
+    return points, np.column_stack((first, first + 1)), elem_member
+
+
+def merge_points(points: np.ndarray, tol: float = TOLERANCE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merges points that are within tolerance of each other
+
+    :param points: (P, 3) array of points
+    :param tol: merging distance
+    :return: indices of kept points, the first of each group of coincident points
+        in ascending order, and (P,) array of each point's position among kept points
+    """
+    points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+    n = len(points)
+    pairs = cKDTree(points).query_pairs(tol, output_type="ndarray")
+    if not len(pairs):
+        return np.arange(n), np.arange(n)
+    graph = sparse.coo_matrix((np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])), shape=(n, n))
+    _, labels = csgraph.connected_components(graph, directed=False)
+    _, first = np.unique(labels, return_index=True)
+    order = np.argsort(first)
+    position = np.empty(len(first), dtype=np.int64)
+    position[order] = np.arange(len(first))
+    return first[order], position[labels]
+
+
+def add_members(model, coordinates1: np.ndarray, coordinates2: np.ndarray, sections, materials,
+                n: int | np.ndarray = 1, tol: float = TOLERANCE) -> list[list[Element]]:
+    """
+    Subdivides members into elements and adds them to model. Nodes within tol of
+    each other or of model's existing nodes are merged, existing nodes are kept.
+
+    :param model: FEModel
+    :param coordinates1: (M, 3) array of members' start points
+    :param coordinates2: (M, 3) array of members' end points
+    :param sections: section of all members or one per member
+    :param materials: material of all members or one per member
+    :param n: number of elements per member, scalar or (M,) array
+    :param tol: merging distance
+    :return: elements of each member from start to end
+    """
+    points, connectivity, elem_member = subdivide(coordinates1, coordinates2, n)
+    n_members = len(np.asarray(coordinates1).reshape((-1, 3)))
+    if not isinstance(sections, (list, tuple, np.ndarray)):
+        sections = [sections] * n_members
+    if not isinstance(materials, (list, tuple, np.ndarray)):
+        materials = [materials] * n_members
+
+    existing = model.node_list
+    coordinates = np.array([(node.x, node.y, node.z) for node in existing], dtype=np.float64).reshape((-1, 3))
+    points = np.concatenate((coordinates, points))
+    kept, position = merge_points(points, tol)
+    nodes = [existing[i] if i < len(existing) else Node(*xyz)
+             for i, xyz in zip(kept.tolist(), points[kept].tolist())]
+    connectivity = position[connectivity + len(existing)]
+    if np.any(connectivity[:, 0] == connectivity[:, 1]):
+        raise ValueError("Element is shorter than merging tolerance")
+
+    members = [[] for _ in range(n_members)]
+    for (i, j), m in zip(connectivity.tolist(), elem_member.tolist()):
+        elem = Element(nodes[i], nodes[j], sections[m], materials[m])
+        model.add(elem)
+        members[m].append(elem)
+    return members
+
+
+def merge_nodes(model, tol: float = TOLERANCE) -> tuple[int, list[Element]]:
+    """
+    Merges model's coincident nodes. Elements, supports, point loads and superelements
+    are connected to the first of each group of coincident nodes and nodes are renumbered.
+    Elements whose both nodes are merged into one are removed with their line loads.
+
+    :return: number of removed nodes and removed elements
+    """
+    nodes = model.node_list
+    coordinates = np.array([(node.x, node.y, node.z) for node in nodes], dtype=np.float64).reshape((-1, 3))
+    kept, position = merge_points(coordinates, tol)
+    if len(kept) == len(nodes):
+        return 0, []
+    replace = {node.node_id: nodes[kept[p]] for node, p in zip(nodes, position.tolist())}
+
+    removed = []
+    for elem in model.element_list:
+        n1, n2 = replace[elem.n1.node_id], replace[elem.n2.node_id]
+        if n1 is n2:
+            removed.append(elem)
+            del model.elements[elem.elem_id]
+            continue
+        if elem.n1 is not n1:
+            elem.n1 = n1
+        if elem.n2 is not n2:
+            elem.n2 = n2
+    for supp in model.support_list:
+        supp.node = replace[supp.node.node_id]
+        supp.node.supported = True
+    removed_ids = {id(elem) for elem in removed}
+    for load_id, load in list(model.loads.items()):
+        if isinstance(load, LineLoad) and id(load.element) in removed_ids:
+            del model.loads[load_id]
+    for lc in model.load_cases.values():
+        lc.loads = [load for load in lc.loads
+                    if not (isinstance(load, LineLoad) and id(load.element) in removed_ids)]
+    loads = list(model.loads.values()) + [load for lc in model.load_cases.values() for load in lc.loads]
+    for load in loads:
+        if isinstance(load, PointLoad):
+            load.node = replace[load.node.node_id]
+    for instance in model.superelements.values():
+        instance.nodes = [replace[node.node_id] for node in instance.nodes]
+
+    model.renumber_nodes([nodes[i] for i in kept.tolist()])
+    return len(nodes) - len(kept), removed
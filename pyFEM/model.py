@@ -4,13 +4,25 @@ from dataclasses import dataclass, field
 from typing import Protocol, runtime_checkable
 
 import numpy as np
+from scipy import sparse
 
+import pyFEM.elem_funcs as ef
+import pyFEM.parallel as parallel
+import pyFEM.reanalysis as reanalysis
+import pyFEM.renumbering as renumbering
 import pyFEM.solver as solver
 # from pyFEM.plotter import Plotter
 from pyFEM.coordinate_system import CoordinateSystem
 from pyFEM.loads.lineload import LineLoad
 from pyFEM.pointload import PointLoad
+from pyFEM.results.result_beam import ResultBeams
+from pyFEM.postprocessor import Postprocessor
+from pyFEM.results.history import TimeHistory
+from pyFEM.results.results import BucklingResult, ModalResult
+from pyFEM.superelement import SuperelementInstance
 from pyFEM.support import NodalSupport
+from loading.loadcase import LoadCase, check_load_ids
+import loading.loadcombination as lcomb
 
 
 # Protocols
@@ -46,11 +58,21 @@ class FEModel:
     elements: dict[int: 'Element'] = field(default_factory=dict)
     supports: dict[int: 'Support'] = field(default_factory=dict)
     loads: dict[int: 'PointLoad' | 'LineLoad'] = field(default_factory=dict)
+    nodes: dict[int: 'Node'] = field(default_factory=dict)
+    load_cases: dict[int: 'LoadCase'] = field(default_factory=dict)
     elem_id: int = 0
     supp_id: int = 0
     load_id: int = 0
     node_id: int = 0
+    load_case_id: int = 0
     global_coordinate_system: CoordinateSystem = field(default_factory=CoordinateSystem)
+    superelements: dict[int: SuperelementInstance] = field(default_factory=dict)
+    # Opt-in reuse of element arrays between analyses, see element_arrays
+    cached: bool = False
+    _dof_offsets: np.ndarray = field(default=None, init=False, repr=False)
+    _assembly_plan: solver.AssemblyPlan = field(default=None, init=False, repr=False)
+    _element_arrays: tuple = field(default=None, init=False, repr=False)
+    _element_geometry: tuple = field(default=None, init=False, repr=False)
 
     #
     # def __init__(self):
@@ -86,13 +108,20 @@ class FEModel:
         Renumbers nodes
         """
         self.nodes.clear()
+        self._dof_offsets = None
+        self._element_arrays = None
+        self._element_geometry = None
         for i, node in enumerate(nodes):
             node.node_id = i
             self.nodes[i] = node
+        self.node_id = len(self.nodes)
 
-    def renumber(self):
+    def renumber(self, strategy: str = None) -> dict[str, int] | None:
         """
         Renumbers every object in model
+
+        :param strategy: dof ordering strategy, see reorder_dofs
+        :return: bandwidth and profile before and after reordering dofs
         """
         # NODES
         self.renumber_nodes(self.node_list)
@@ -100,11 +129,49 @@ class FEModel:
         self.renumber_elements(self.element_list)
         # SUPPORTS
         self.renumber_supports(self.support_list)
+        # DOFS
+        if strategy is not None:
+            return self.reorder_dofs(strategy)
+
+    def reorder_dofs(self, strategy: str = "rcm") -> dict[str, int]:
+        """
+        Reorders global dofs without changing node ids. Assembly, solvers and results use
+        the new ordering through dof_offsets. Adding new nodes resets natural ordering.
+
+        :param strategy: "rcm" for reverse Cuthill-McKee ordering of the node adjacency graph,
+            "natural" for node id order
+        :return: bandwidth and profile of the stiffness matrix before and after reordering
+        """
+        n_nodes = len(self.nodes)
+        n1 = np.array([elem.n1.node_id for elem in self.element_list], dtype=np.int64)
+        n2 = np.array([elem.n2.node_id for elem in self.element_list], dtype=np.int64)
+        if strategy == "rcm":
+            positions = renumbering.rcm_positions(renumbering.node_adjacency(n1, n2, n_nodes))
+        elif strategy == "natural":
+            positions = np.arange(n_nodes, dtype=np.int64)
+        else:
+            raise ValueError(f"Unknown dof ordering strategy: {strategy}")
+
+        before = self.dof_offsets // 6
+        bandwidth_before, profile_before = renumbering.bandwidth_profile(before[n1], before[n2], n_nodes)
+        bandwidth_after, profile_after = renumbering.bandwidth_profile(positions[n1], positions[n2], n_nodes)
+        self._dof_offsets = positions * 6
+        return {"bandwidth_before": bandwidth_before, "bandwidth_after": bandwidth_after,
+                "profile_before": profile_before, "profile_after": profile_after}
 
     @property
     def dofs(self):
         return len(self.nodes) * 6
 
+    @property
+    def dof_offsets(self) -> np.ndarray:
+        """
+        Returns nodes' first global dof indices, indexed by node id
+        """
+        if self._dof_offsets is None:
+            self._dof_offsets = np.arange(len(self.nodes), dtype=np.int64) * 6
+        return self._dof_offsets
+
     @property
     def support_list(self) -> list:
         """
@@ -126,18 +193,6 @@ class FEModel:
         """
         return list(self.nodes.values())
 
-    @property
-    def nodes(self):
-        nodes = {}
-        for elem in self.element_list:
-            n1 = elem.n1
-            n2 = elem.n2
-            if n1.node_id not in nodes:
-                nodes[n1.node_id] = n1
-            if n2.node_id not in nodes:
-                nodes[n2.node_id] = n2
-        return nodes
-
     @property
     def pointloads(self):
         return [pl for pl in self.loads.values() if isinstance(pl, PointLoad)]
@@ -149,59 +204,631 @@ class FEModel:
     @property
     def global_load_vector(self) -> np.ndarray:
         """
-        Computes the global load vector
-        """
-        forces = np.zeros(self.dofs)
-        for pl in self.pointloads:
-            node_id = pl.node.node_id
-            idx = node_id * 6
-            forces[idx:idx + 6] += pl.global_load_vector
-        for ll in self.lineloads:
-            n1_id = ll.element.n1.node_id
-            n2_id = ll.element.n2.node_id
-            llf1 = ll.global_load_vector[:6]
-            llf2 = ll.global_load_vector[6:]
-            idx1 = n1_id * 6
-            idx2 = n2_id * 6
-            forces[idx1: idx1 + 6] += llf1
-            forces[idx2: idx2 + 6] += llf2
-
-        return forces.reshape((self.dofs, 1))
+        Computes the global load vector, including superelements' condensed loads
+        """
+        forces = self.load_vector(self.loads.values())
+        offsets = self.dof_offsets
+        for instance in self.superelements.values():
+            forces[instance.dofs(offsets), 0] += instance.load_vector
+        return forces
+
+    def load_vector(self, loads: list[PointLoad | LineLoad]) -> np.ndarray:
+        """
+        Computes the global load vector of given loads
+        """
+        dofs = self.dofs
+        forces = np.zeros(dofs)
+        offsets = self.dof_offsets
+        for load in loads:
+            if isinstance(load, PointLoad):
+                idx = offsets[load.node.node_id]
+                forces[idx:idx + 6] += load.global_load_vector
+            elif isinstance(load, LineLoad):
+                llf = load.global_load_vector
+                idx1 = offsets[load.element.n1.node_id]
+                idx2 = offsets[load.element.n2.node_id]
+                forces[idx1: idx1 + 6] += llf[:6]
+                forces[idx2: idx2 + 6] += llf[6:]
+
+        return forces.reshape((dofs, 1))
+
+    def invalidate(self) -> None:
+        """
+        Clears cached element arrays, e.g. after modifying a section or material in place
+        """
+        self._element_arrays = None
+        self._element_geometry = None
+
+    def _element_arrays_key(self) -> tuple:
+        """
+        Returns what cached element arrays depend on: element ids, node coordinates, and
+        elements' node ids and section and material identities
+        """
+        elements = self.element_list
+        refs = np.array([(elem.elem_id, elem.n1.node_id, elem.n2.node_id, id(elem.section), id(elem.material))
+                         for elem in elements], dtype=np.int64).reshape((-1, 5))
+        coordinates = np.array([(node.x, node.y, node.z) for node in self.node_list],
+                               dtype=np.float64).reshape((-1, 3))
+        return refs, coordinates, id(self.global_coordinate_system)
+
+    @property
+    def element_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Returns elements' node ids, coordinates and cross-section properties as arrays.
+        If model is cached, read-only arrays are reused until elements, nodes or node
+        coordinates change or an element's section or material is replaced. Sections
+        and materials are compared by identity, so call invalidate after modifying them.
+        """
+        if not self.cached:
+            return self._element_arrays_of(self.element_list)
+        key = self._element_arrays_key()
+        cached = self._element_arrays
+        if (cached is None or cached[0][2] != key[2] or not np.array_equal(cached[0][0], key[0])
+                or not np.array_equal(cached[0][1], key[1])):
+            arrays = self._element_arrays_of(self.element_list)
+            for value in arrays.values():
+                value.flags.writeable = False
+            self._element_arrays = (key, arrays)
+        return self._element_arrays[1]
+
+    @staticmethod
+    def _element_arrays_of(elements: list[Element]) -> dict[str, np.ndarray]:
+        properties = {}
+        for elem in elements:
+            key = (id(elem.section), id(elem.material))
+            if key not in properties:
+                properties[key] = (elem.material.E, elem.material.G, elem.material.density,
+                                   elem.section.A, elem.section.Iy, elem.section.Iz, elem.section.It)
+        props = np.array([properties[id(elem.section), id(elem.material)] for elem in elements],
+                         dtype=np.float64).reshape((-1, 7))
+        coords = np.array([(elem.n1.x, elem.n1.y, elem.n1.z, elem.n2.x, elem.n2.y, elem.n2.z)
+                           for elem in elements], dtype=np.float64).reshape((-1, 6))
+        node_ids = np.array([(elem.n1.node_id, elem.n2.node_id) for elem in elements],
+                            dtype=np.int64).reshape((-1, 2))
+        return {"n1": node_ids[:, 0], "n2": node_ids[:, 1],
+                "coordinates1": coords[:, :3], "coordinates2": coords[:, 3:],
+                "E": props[:, 0], "G": props[:, 1], "rho": props[:, 2], "A": props[:, 3],
+                "Iy": props[:, 4], "Iz": props[:, 5], "It": props[:, 6]}
+
+    def element_geometry(self, arrays: dict[str, np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (N,) array of elements' lengths and (N, 3, 3) array of their direction
+        cosine matrices. If model is cached, they are kept with the cached element arrays.
+        """
+        if arrays is None:
+            arrays = self.element_arrays
+        if self._element_geometry is not None and self._element_geometry[0] is arrays:
+            return self._element_geometry[1]
+        geometry = ef.element_geometry(arrays["coordinates1"], arrays["coordinates2"],
+                                       self.global_coordinate_system)
+        if self.cached and self._element_arrays is not None and self._element_arrays[1] is arrays:
+            for value in geometry:
+                value.flags.writeable = False
+            self._element_geometry = (arrays, geometry)
+        return geometry
+
+    def element_dofs(self, arrays: dict[str, np.ndarray] = None) -> np.ndarray:
+        """
+        Returns (N, 12) array of elements' global dof indices
+        """
+        if arrays is None:
+            arrays = self.element_arrays
+        offsets = self.dof_offsets
+        return ef.dof_indices(offsets[arrays["n1"]], offsets[arrays["n2"]])
+
+    def element_stiffness_matrices(self, arrays: dict[str, np.ndarray] = None) -> np.ndarray:
+        """
+        Returns (N, 12, 12) array of elements' global stiffness matrices
+        """
+        if arrays is None:
+            arrays = self.element_arrays
+        L, dir_cos = self.element_geometry(arrays)
+        k0 = ef.local_stiffness_matrices(arrays["E"], arrays["A"], arrays["G"],
+                                         arrays["Iy"], arrays["Iz"], arrays["It"], L)
+        return ef.transform_matrices(dir_cos, k0)
+
+    def element_geometric_stiffness_matrices(self, N: np.ndarray,
+                                             arrays: dict[str, np.ndarray] = None) -> np.ndarray:
+        """
+        Returns (N, 12, 12) array of elements' global geometric stiffness matrices
+
+        :param N: (N,) array of elements' axial forces, tension positive
+        """
+        if arrays is None:
+            arrays = self.element_arrays
+        L, dir_cos = self.element_geometry(arrays)
+        kg = ef.local_geometric_stiffness_matrices(N, L, arrays["A"], arrays["Iy"] + arrays["Iz"])
+        return ef.transform_matrices(dir_cos, kg)
+
+    def assemble_matrix(self, element_matrices: np.ndarray,
+                        arrays: dict[str, np.ndarray] = None) -> sparse.csr_matrix:
+        """
+        Assembles (N, 12, 12) array of elements' global matrices into a sparse global matrix
+        """
+        return self.assembly_plan(arrays).assemble(element_matrices)
+
+    def assembly_plan(self, arrays: dict[str, np.ndarray] = None) -> solver.AssemblyPlan:
+        """
+        Returns compiled assembly plan of model's topology. The plan is cached and
+        compiled again only when elements' dof indices change.
+        """
+        idxs = self.element_dofs(arrays)
+        plan = self._assembly_plan
+        if plan is None or plan.ndof != self.dofs or not np.array_equal(plan.element_dofs, idxs):
+            plan = self._assembly_plan = solver.AssemblyPlan.from_element_dofs(idxs, self.dofs)
+        return plan
 
     @property
     def global_stiffness_matrix(self):
-        rows = np.asarray([elem.rows for elem in self.element_list])
-        cols = np.asarray([elem.cols for elem in self.element_list])
-        stiff_data = np.asarray([elem.stiffness_matrix for elem in self.element_list])
-        return solver.global_stiffness_matrix(rows, cols, stiff_data)
+        return self.stiffness_matrix()
+
+    def stiffness_matrix(self, arrays: dict[str, np.ndarray] = None,
+                         element_matrices: np.ndarray = None) -> sparse.csr_matrix:
+        """
+        Assembles the global stiffness matrix of elements and superelements
+
+        :param element_matrices: (N, 12, 12) array of elements' global stiffness matrices,
+            computed from arrays if not given
+        """
+        if arrays is None:
+            arrays = self.element_arrays
+        if element_matrices is None:
+            element_matrices = self.element_stiffness_matrices(arrays)
+        K = self.assemble_matrix(element_matrices, arrays)
+        if self.superelements:
+            K = (K + self.superelement_stiffness_matrix()).tocsr()
+        return K
+
+    def superelement_stiffness_matrix(self) -> sparse.csr_matrix:
+        """
+        Assembles superelements' condensed stiffness matrices into a sparse global matrix
+        """
+        return self._assemble_superelements([instance.stiffness_matrix
+                                             for instance in self.superelements.values()])
+
+    def superelement_mass_matrix(self, lumped: bool = False) -> sparse.csr_matrix:
+        """
+        Assembles superelements' condensed mass matrices into a sparse global matrix
+        """
+        return self._assemble_superelements([instance.mass_matrix(lumped)
+                                             for instance in self.superelements.values()])
+
+    def _assemble_superelements(self, matrices: list[np.ndarray]) -> sparse.csr_matrix:
+        offsets = self.dof_offsets
+        rows, cols, data = [], [], []
+        for instance, matrix in zip(self.superelements.values(), matrices):
+            dofs = instance.dofs(offsets)
+            rows.append(np.repeat(dofs, len(dofs)))
+            cols.append(np.tile(dofs, len(dofs)))
+            data.append(matrix.ravel())
+        return sparse.coo_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                                 shape=(self.dofs, self.dofs)).tocsr()
+
+    def mass_matrix(self, lumped: bool = False,
+                    arrays: dict[str, np.ndarray] = None) -> sparse.csr_matrix:
+        """
+        Assembles the global mass matrix of elements and superelements. Material density
+        is in kg/mm^3 and masses are returned in tonnes, which is consistent with N, mm and s.
+
+        :param lumped: assemble lumped mass matrix instead of consistent one, it is
+            diagonal unless the model has superelements
+        """
+        if arrays is None:
+            arrays = self.element_arrays
+        L, dir_cos = self.element_geometry(arrays)
+        rho = arrays["rho"] * 1e-3
+        if lumped:
+            masses = ef.lumped_masses(rho, arrays["A"], arrays["Iy"], arrays["Iz"], L, dir_cos)
+            M = sparse.diags(np.bincount(self.element_dofs(arrays).ravel(), weights=masses.ravel(),
+                                         minlength=self.dofs), format="csr")
+        else:
+            m0 = ef.local_mass_matrices(rho, arrays["A"], arrays["Iy"] + arrays["Iz"], L)
+            M = self.assemble_matrix(ef.transform_matrices(dir_cos, m0), arrays)
+        if self.superelements:
+            M = (M + self.superelement_mass_matrix(lumped)).tocsr()
+        return M
+
+    def parallel_stiffness_matrix(self, workers: int = None, executor: str = "thread",
+                                  chunk_size: int = None) -> sparse.csr_matrix:
+        """
+        Assembles the global stiffness matrix with a pool of workers. Models smaller than
+        parallel.MIN_PARALLEL_ELEMENTS elements are assembled serially. Triplets are summed
+        with the model's assembly plan, so the matrix equals global_stiffness_matrix.
+
+        :param workers: number of workers, defaults to number of CPUs
+        :param executor: "thread" or "process"
+        :param chunk_size: number of elements per task
+        """
+        arrays = self.element_arrays
+        K = parallel.global_stiffness_matrix(arrays, self.dof_offsets, self.global_coordinate_system,
+                                             workers, executor, chunk_size, self.assembly_plan(arrays))
+        if self.superelements:
+            K = (K + self.superelement_stiffness_matrix()).tocsr()
+        return K
+
+    def node_values(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Returns global dof vectors (ndof, ...) as (n_nodes, 6, ...) array indexed by node id
+        """
+        return vectors[self.dof_offsets[:, None] + np.arange(6)]
 
     @property
-    def constraint_matrix(self) -> np.ndarray:
-        B_tot = np.array([])
+    def constraint_matrix(self) -> sparse.csr_matrix:
+        """
+        Returns sparse constraint matrix B with one row per restrained dof
+        """
+        return solver.constraint_matrix(self.fixed_dofs, self.dofs)
 
-        for supp in self.support_list:
-            B = supp.B(self.dofs)
-            B_tot = np.vstack((B_tot, B)) if B_tot.size else B
-        return B_tot
+    @property
+    def constraint_vector(self) -> np.ndarray:
+        """
+        Returns prescribed displacements b of the constraint equations B U = b
+        """
+        if not self.supports:
+            return np.array([])
+        return np.concatenate([supp.prescribed_displacements for supp in self.support_list])
+
+    @property
+    def fixed_dofs(self) -> np.ndarray:
+        """
+        Returns global indices of all restrained dofs
+        """
+        if not self.supports:
+            return np.array([], dtype=int)
+        node_ids = np.array([supp.node.node_id for supp in self.support_list])
+        supp, dof = np.nonzero(np.array([supp.as_vector for supp in self.support_list], dtype=bool))
+        return self.dof_offsets[node_ids[supp]] + dof
+
+    def linear_statics(self, load_id=0, method: str = "reduced",
+                       **options) -> solver.ConvergenceInfo | None:
+        """
+        Performs linear static analysis
+
+        :param load_id: key under which results are stored
+        :param method: "reduced" eliminates restrained dofs from the sparse stiffness matrix,
+            "iterative" solves the reduced system with preconditioned conjugate gradient method,
+            "lagrange" solves the Lagrange multiplier system
+        :param options: preconditioner ("none", "jacobi", "block_jacobi" or "ilu"), rtol and
+            maxiter of the iterative method, see solver.iterative_static_load_analysis
+        :return: convergence statistics of the iterative method
+        """
+        info = None
+        if method == "reduced":
+            U, F_react = solver.reduced_static_load_analysis(self.global_stiffness_matrix,
+                                                             self.global_load_vector,
+                                                             self.fixed_dofs,
+                                                             self.constraint_vector)
+        elif method == "iterative":
+            U, F_react, info = solver.iterative_static_load_analysis(self.global_stiffness_matrix,
+                                                                     self.global_load_vector,
+                                                                     self.fixed_dofs,
+                                                                     self.constraint_vector,
+                                                                     **options)
+        elif method == "lagrange":
+            B = self.constraint_matrix
+            U, R = solver.static_load_analysis(self.global_stiffness_matrix,
+                                               self.global_load_vector,
+                                               B,
+                                               self.dofs,
+                                               self.constraint_vector)
+            F_react = B.T @ R
+        else:
+            raise ValueError(f"Unknown solution method: {method}")
+
+        self.store_results(U, F_react, load_id)
+        return info
+
+    def reanalysis(self, load_id: int = 0, max_rank: int = 120) -> reanalysis.Reanalysis:
+        """
+        Performs linear static analysis that can be updated after local changes with
+        Reanalysis.update, reusing the factorization of the stiffness matrix
 
-    def linear_statics(self, load_id=0):
+        :param load_id: key under which results are stored
+        :param max_rank: maximum number of changed free dofs before refactorization
+        """
+        return reanalysis.Reanalysis(self, load_id, max_rank)
 
-        U, R = solver.static_load_analysis(self.global_stiffness_matrix.toarray(),
-                                           self.global_load_vector,
-                                           self.constraint_matrix,
-                                           self.dofs)
+    def second_order_statics(self, load_id=0, n_steps: int = 10, modified: bool = False,
+                             arc_length: bool = False, **options) -> list[solver.StepInfo]:
+        """
+        Performs geometrically nonlinear (P-Delta) static analysis. Equilibrium is
+        solved with incremental Newton-Raphson method. Internal forces of each element are
+        (k0 + kg(N)) u, where the axial force N follows the element's elongation, and
+        the tangent stiffness includes the variation of kg(N) u with the elongation.
+        Tangent stiffness matrix is assembled with model's assembly plan and only its
+        values are refreshed between iterations. Superelements are linear, their
+        condensed stiffness is added to the tangent and internal forces.
+        Elements' rotations are assumed small, so large displacements, which would need
+        a corotational formulation, are not supported.
+
+        :param load_id: key under which results are stored
+        :param n_steps: number of load steps
+        :param modified: use modified Newton-Raphson method, i.e. one tangent per step
+        :param arc_length: use arc-length method to follow the equilibrium path
+        :param options: tol, max_iter, max_cuts and max_steps of solver.nonlinear_static_analysis
+        :return: convergence statistics of load steps
+        """
+        arrays = self.element_arrays
+        L, dir_cos = self.element_geometry(arrays)
+        k0 = ef.local_stiffness_matrices(arrays["E"], arrays["A"], arrays["G"],
+                                         arrays["Iy"], arrays["Iz"], arrays["It"], L)
+        EA_L = arrays["E"] * arrays["A"] / L
+        # Geometric stiffness is linear in the axial force
+        kg1 = ef.local_geometric_stiffness_matrices(1.0, L, arrays["A"], arrays["Iy"] + arrays["Iz"])
+        plan = self.assembly_plan(arrays)
+        idxs = plan.element_dofs
+        ndof = self.dofs
+        K = plan.assemble(ef.transform_matrices(dir_cos, k0))
+        # Superelements are linear and add a constant stiffness
+        K_se = self.superelement_stiffness_matrix() if self.superelements else None
+
+        def axial_forces(U):
+            u = ef.to_local(dir_cos, U[idxs])
+            return u, EA_L * (u[:, 6] - u[:, 0])
+
+        def tangent(U):
+            u, N = axial_forces(U)
+            k = k0 + N[:, None, None] * kg1
+            # Derivative of kg(N) u with respect to elongation
+            g = EA_L[:, None] * np.einsum('nij,nj->ni', kg1, u)
+            k[:, :, 6] += g
+            k[:, :, 0] -= g
+            plan.refresh(K, ef.transform_matrices(dir_cos, k))
+            return K if K_se is None else (K + K_se).tocsr()
+
+        def internal_forces(U):
+            u, N = axial_forces(U)
+            f = np.einsum('nij,nj->ni', k0, u) + N[:, None] * np.einsum('nij,nj->ni', kg1, u)
+            f_int = np.bincount(idxs.ravel(), weights=ef.to_global(dir_cos, f).ravel(), minlength=ndof)
+            return f_int if K_se is None else f_int + K_se @ U
+
+        U, F_react, steps = solver.nonlinear_static_analysis(tangent, internal_forces,
+                                                             self.global_load_vector,
+                                                             self.fixed_dofs,
+                                                             self.constraint_vector,
+                                                             n_steps, modified, arc_length,
+                                                             **options)
+        self.store_results(U, F_react, load_id)
+        return steps
+
+    def linear_statics_load_cases(self, load_cases: list[LoadCase] = None,
+                                  postprocessor: Postprocessor = None) -> None:
+        """
+        Performs linear static analysis for several load cases. The stiffness matrix
+        is factorized once and every load case is solved as a column of the right-hand side.
 
-        for node, u in zip(self.node_list, np.split(U, len(self.nodes))):
-            # OLD
-            # idx = node.node_id * 6
-            # u = U[idx: idx + 6]
-            # node.u[load_id] = u.flatten()
-            node.u[load_id] = u
+        :param load_cases: load cases to solve, defaults to all model's load cases
+        :param postprocessor: postprocessor that writes results to a result store
+            instead of storing them to nodes and supports
+        """
+        if load_cases is None:
+            load_cases = list(self.load_cases.values())
+        if not load_cases:
+            return
+        check_load_ids(load_cases)
+        K = self.global_stiffness_matrix
+        fixed_dofs = self.fixed_dofs
+        F = np.column_stack([self.load_vector(lc.loads) for lc in load_cases])
+        U, F_react = solver.reduced_static_load_analysis(K, F, fixed_dofs,
+                                                         self.constraint_vector,
+                                                         solver.factorize(K, fixed_dofs))
+        U = U.reshape((self.dofs, -1))
+        F_react = F_react.reshape((self.dofs, -1))
+        for i, lc in enumerate(load_cases):
+            if postprocessor is None:
+                self.store_results(U[:, i], F_react[:, i], lc.load_id)
+            else:
+                postprocessor.process(U[:, i], F_react[:, i], lc.load_id, lc.loads)
+
+    def displacement_vector(self, load_id: int = 0) -> np.ndarray:
+        """
+        Returns global vector of nodal displacements of a solved load case
+        """
+        U = np.zeros(self.dofs)
+        offsets = self.dof_offsets
+        for node in self.node_list:
+            idx = offsets[node.node_id]
+            U[idx:idx + 6] = node.u[load_id]
+        return U
+
+    def internal_forces(self, load_id: int = 0, n_stations: int = 11,
+                        loads: list[PointLoad | LineLoad] = None,
+                        U: np.ndarray = None) -> ResultBeams:
+        """
+        Recovers section forces of all elements of a solved load case
+
+        :param load_id: key of the results in Node.u
+        :param n_stations: number of stations per element, including both ends
+        :param loads: loads of the load case, defaults to model's loads
+        :param U: global vector of nodal displacements, read from nodes if not given
+        """
+        if loads is None:
+            loads = self.loads.values()
+        arrays = self.element_arrays
+        n_elems = len(arrays["n1"])
+        L, dir_cos = self.element_geometry(arrays)
+        k0 = ef.local_stiffness_matrices(arrays["E"], arrays["A"], arrays["G"],
+                                         arrays["Iy"], arrays["Iz"], arrays["It"], L)
+        if U is None:
+            U = self.displacement_vector(load_id)
+        u = U[self.element_dofs(arrays)]
+
+        # Equivalent nodal loads and distributed loads of line loads
+        rows = {elem_id: i for i, elem_id in enumerate(self.elements)}
+        F_eq = np.zeros((n_elems, 12))
+        q = np.zeros((n_elems, 12))
+        for ll in loads:
+            if isinstance(ll, LineLoad):
+                i = rows[ll.element.elem_id]
+                F_eq[i] += ll.global_load_vector
+                q[i] += ll.load_vector
+
+        end_forces = np.einsum('nij,nj->ni', k0, ef.to_local(dir_cos, u)) - ef.to_local(dir_cos, F_eq)
+        x, forces = ef.section_forces(end_forces, ef.to_local(dir_cos, q).reshape((n_elems, 2, 6)),
+                                      L, n_stations)
+        return ResultBeams(np.fromiter(self.elements, dtype=np.int64, count=n_elems),
+                           x, forces, end_forces, load_id)
+
+    def load_case_internal_forces(self, load_cases: list[LoadCase] = None,
+                                  n_stations: int = 11) -> dict[int, ResultBeams]:
+        """
+        Recovers section forces of solved load cases, keyed by load case id
+        """
+        if load_cases is None:
+            load_cases = list(self.load_cases.values())
+        check_load_ids(load_cases)
+        return {lc.load_id: self.internal_forces(lc.load_id, n_stations, lc.loads)
+                for lc in load_cases}
+
+    def linear_buckling(self, load_cases: list[LoadCase] = None, n_modes: int = 6,
+                        store: bool = True) -> dict[int, BucklingResult]:
+        """
+        Performs linear buckling analysis. Axial forces of each load case are solved with
+        linear static analysis, whose stiffness matrix factorization is reused by the
+        eigensolver. Element geometry and the geometric stiffness of unit axial force are
+        computed once and scaled by each load case's axial forces.
+        Superelements contribute their condensed stiffness but no geometric stiffness.
+
+        :param load_cases: load cases to analyse, defaults to all model's load cases or,
+            if the model has none, to model's loads with load id 0
+        :param n_modes: number of critical load factors per load case
+        :param store: store displacements and reactions of the reference solutions
+        :return: buckling results keyed by load id
+        """
+        if load_cases is None:
+            load_cases = list(self.load_cases.values())
+        check_load_ids(load_cases)
+        cases = [(lc.load_id, lc.loads) for lc in load_cases] or [(0, list(self.loads.values()))]
+
+        arrays = self.element_arrays
+        L, dir_cos = self.element_geometry(arrays)
+        k0 = ef.local_stiffness_matrices(arrays["E"], arrays["A"], arrays["G"],
+                                         arrays["Iy"], arrays["Iz"], arrays["It"], L)
+        plan = self.assembly_plan(arrays)
+        K = plan.assemble(ef.transform_matrices(dir_cos, k0))
+        if self.superelements:
+            K = (K + self.superelement_stiffness_matrix()).tocsr()
+        fixed_dofs = self.fixed_dofs
+        lu = solver.factorize(K, fixed_dofs)
+        if load_cases:
+            F = np.column_stack([self.load_vector(loads) for _, loads in cases])
+        else:
+            F = self.global_load_vector
+        U, F_react = solver.reduced_static_load_analysis(K, F, fixed_dofs, self.constraint_vector, lu)
+        U = U.reshape((self.dofs, -1))
+        F_react = F_react.reshape((self.dofs, -1))
+
+        # Axial force is the local x -force at the second node, N = T^T k0[6] u - F_eq
+        N = np.einsum('nj,njc->nc', ef.to_global(dir_cos, k0[:, 6]), U[plan.element_dofs])
+        rows = {elem_id: i for i, elem_id in enumerate(self.elements)}
+        for i, (_, loads) in enumerate(cases):
+            for ll in loads:
+                if isinstance(ll, LineLoad):
+                    j = rows[ll.element.elem_id]
+                    N[j, i] -= dir_cos[j, 0] @ ll.global_load_vector[6:9]
+        kg1 = ef.transform_matrices(dir_cos, ef.local_geometric_stiffness_matrices(
+            1.0, L, arrays["A"], arrays["Iy"] + arrays["Iz"]))
+
+        results = {}
+        for i, (load_id, loads) in enumerate(cases):
+            if store:
+                self.store_results(U[:, i], F_react[:, i], load_id)
+            KG = plan.assemble(N[:, i, None, None] * kg1)
+            load_factors, modes = solver.buckling_analysis(K, KG, fixed_dofs, n_modes, lu)
+            results[load_id] = BucklingResult(load_id, load_factors, self.node_values(modes))
+        return results
+
+    def modal_analysis(self, n_modes: int = 6, lumped: bool = False,
+                       sigma: float = 0.0) -> ModalResult:
+        """
+        Solves the lowest natural frequencies and vibration modes
+
+        :param n_modes: number of modes
+        :param lumped: use diagonal lumped mass matrix, which is faster to assemble and
+            multiply than the consistent mass matrix
+        :param sigma: shift of squared angular frequencies, modes nearest to it are solved
+        """
+        arrays = self.element_arrays
+        K = self.stiffness_matrix(arrays)
+        M = self.mass_matrix(lumped, arrays)
+        eigenvalues, modes, ratios = solver.modal_analysis(K, M, self.fixed_dofs, n_modes, sigma)
+        return ModalResult(eigenvalues, self.node_values(modes), ratios)
+
+    def time_history(self, dt: float, factors: np.ndarray, load_cases: list[LoadCase] = None,
+                     dofs: np.ndarray = None, path: str = None, chunk_size: int = 1000,
+                     lumped: bool = True, damping: tuple[float, float] = None,
+                     alpha: float = 0.0, callbacks: list = ()) -> TimeHistory:
+        """
+        Performs implicit time-history analysis with HHT-alpha (Newmark-beta if alpha = 0)
+        method. Histories of selected dofs and reactions are recorded, and written to disk
+        chunk by chunk if path is given.
+
+        :param dt: time step
+        :param factors: (n_steps + 1,) array of load factors of model's loads, or
+            (n_steps + 1, n_cases) array of load factors of load cases
+        :param load_cases: load cases scaled by factors
+        :param dofs: global indices of recorded dofs, defaults to all dofs
+        :param path: directory where histories are written
+        :param chunk_size: number of time steps written at once
+        :param lumped: use lumped mass matrix
+        :param damping: coefficients a0, a1 of Rayleigh damping C = a0 M + a1 K,
+            see solver.rayleigh_coefficients
+        :param alpha: HHT-alpha parameter, -1/3 <= alpha <= 0
+        :param callbacks: additional functions called as callback(n, t, U, V, A, R)
+        """
+        arrays = self.element_arrays
+        K = self.stiffness_matrix(arrays)
+        M = self.mass_matrix(lumped, arrays)
+        C = damping[0] * M + damping[1] * K if damping is not None else None
+        if load_cases is None:
+            F = self.global_load_vector
+        else:
+            F = np.column_stack([self.load_vector(lc.loads) for lc in load_cases])
+        fixed_dofs = self.fixed_dofs
+        if dofs is None:
+            dofs = np.arange(self.dofs)
+
+        history = TimeHistory(len(factors) - 1, dofs, len(fixed_dofs), path, chunk_size)
+        solver.time_history_analysis(K, M, F, factors, dt, fixed_dofs, C, alpha,
+                                     callbacks=[history, *callbacks])
+        history.flush()
+        return history
+
+    def load_case_results(self, load_ids: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns stacked results of solved load cases
+
+        :return: displacements (n_cases, n_nodes, 6) and reactions (n_cases, n_supports, 6)
+        """
+        nodes = self.node_list
+        supports = self.support_list
+        U = np.array([[node.u[load_id] for node in nodes] for load_id in load_ids]).reshape((-1, len(nodes), 6))
+        R = np.array([[supp.R[load_id] for supp in supports] for load_id in load_ids]).reshape((-1, len(supports), 6))
+        return U, R
+
+    def combine_load_cases(self, combinations: list[lcomb.LoadCombination]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Superposes solved load case results of given combinations without re-solving
+
+        :return: displacements (n_combinations, n_nodes, 6) and reactions (n_combinations, n_supports, 6)
+        """
+        load_ids = sorted(set().union(*(comb.factors for comb in combinations)))
+        factors = lcomb.factor_matrix(combinations, load_ids)
+        U, R = self.load_case_results(load_ids)
+        return lcomb.superpose(factors, U), lcomb.superpose(factors, R)
+
+    def store_results(self, U: np.ndarray, F_react: np.ndarray, load_id: int) -> None:
+        """
+        Stores displacements to nodes and reactions to supports
+        """
+        offsets = self.dof_offsets
+        for node in self.node_list:
+            idx = offsets[node.node_id]
+            node.u[load_id] = U[idx:idx + 6]
 
         for supp in self.support_list:
-            idx = supp.supp_id * 6
-            r = R[idx: idx + 6]
-            supp.R[load_id] = r.flatten()
+            idx = offsets[supp.node.node_id]
+            supp.R[load_id] = np.where(supp.as_vector, F_react[idx:idx + 6], 0.0)
 
     def add(self, item: object) -> None:
 
@@ -213,26 +840,44 @@ class FEModel:
             self.add_pointload(item)
         elif isinstance(item, LineLoad):
             self.add_lineload(item)
+        elif isinstance(item, LoadCase):
+            self.add_load_case(item)
+        elif isinstance(item, SuperelementInstance):
+            self.add_superelement(item)
 
     def add_element(self, element: Element) -> None:
         """
         Adds element to model
         """
-        # Set nodes' id's
-        n1 = element.n1
-        n2 = element.n2
-        if n1.node_id is None:
-            n1.node_id = self.node_id
-            self.node_id += 1
-        if n2.node_id is None:
-            n2.node_id = self.node_id
-            self.node_id += 1
+        for node in (element.n1, element.n2):
+            self._add_node(node)
         # Set element's global coordinate system
         element.global_coordinate_system = self.global_coordinate_system
         element.elem_id = self.elem_id
         self.elem_id += 1
         self.elements[element.elem_id] = element
 
+    def _add_node(self, node: Node) -> None:
+        """
+        Sets node's id and adds it to model's nodes
+        """
+        if node.node_id is None:
+            node.node_id = self.node_id
+            self.node_id += 1
+        if node.node_id not in self.nodes:
+            self.nodes[node.node_id] = node
+            self._dof_offsets = None
+
+    def add_superelement(self, instance: SuperelementInstance) -> None:
+        """
+        Adds superelement instance to model, its nodes are added to model's nodes.
+        Superelements contribute to stiffness_matrix, mass_matrix and global_load_vector.
+        """
+        for node in instance.nodes:
+            self._add_node(node)
+        instance.instance_id = len(self.superelements)
+        self.superelements[instance.instance_id] = instance
+
     def add_nodal_support(self, nodal_support: NodalSupport) -> None:
         """
         Adds nodal support to model
@@ -253,6 +898,17 @@ class FEModel:
         self.load_id += 1
         self.loads[ll.load_id] = ll
 
+    def add_load_case(self, lc: LoadCase) -> None:
+        """
+        Adds load case to model, load case's loads are not added to model's loads
+        """
+        for ll in lc.loads:
+            if isinstance(ll, LineLoad):
+                ll.element.has_load = True
+        lc.load_id = self.load_case_id
+        self.load_case_id += 1
+        self.load_cases[lc.load_id] = lc
+
     # def plot(self, show: bool = True):
     #     plotter = Plotter()
     #     for element in self.element_list:
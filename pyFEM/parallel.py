@@ -0,0 +1,153 @@
+"""
+Parallel assembly of the global stiffness matrix.
+
+Elements are split into chunks, whose stiffness matrices and COO indices are computed
+in a thread or process pool. Workers write their results directly into preallocated
+output arrays, which are shared memory blocks when processes are used, so chunks are
+never copied or concatenated. The triplets are then summed into one CSR matrix with an
+AssemblyPlan, in the same order as the serial assembly, so the result is bitwise equal to
+FEModel.global_stiffness_matrix whenever the element matrices are.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from scipy import sparse
+
+import pyFEM.elem_funcs as ef
+import pyFEM.solver as solver
+from pyFEM.coordinate_system import CoordinateSystem
+
+# Models with fewer elements are assembled serially
+MIN_PARALLEL_ELEMENTS = 20000
+EXECUTORS = ("thread", "process")
+INPUTS = ("coordinates1", "coordinates2", "E", "G", "A", "Iy", "Iz", "It", "offsets1", "offsets2")
+
+
+def _assemble_chunk(buffers: dict[str, np.ndarray], start: int, stop: int,
+                    global_coordinate_system: CoordinateSystem) -> None:
+    """
+    Computes stiffness matrices and COO indices of elements start:stop into output buffers
+    """
+    chunk = {name: buffers[name][start:stop] for name in INPUTS}
+    buffers["data"][start:stop] = ef.stiffness_matrices(chunk["coordinates1"], chunk["coordinates2"],
+                                                        chunk["E"], chunk["G"], chunk["A"],
+                                                        chunk["Iy"], chunk["Iz"], chunk["It"],
+                                                        global_coordinate_system)
+    idxs = ef.dof_indices(chunk["offsets1"], chunk["offsets2"])
+    buffers["rows"][start:stop] = np.repeat(idxs, 12, axis=1)
+    buffers["cols"][start:stop] = np.tile(idxs, (1, 12))
+
+
+def _assemble_chunk_shared(specs: dict[str, tuple], start: int, stop: int,
+                           global_coordinate_system: CoordinateSystem) -> None:
+    """
+    Attaches to shared memory blocks and computes a chunk, run in worker processes
+    """
+    blocks = {name: shared_memory.SharedMemory(name=shm_name) for name, (shm_name, _, _) in specs.items()}
+    try:
+        buffers = {name: np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+                   for name, (_, shape, dtype) in specs.items()}
+        _assemble_chunk(buffers, start, stop, global_coordinate_system)
+        del buffers
+    finally:
+        for block in blocks.values():
+            block.close()
+
+
+def _chunks(n: int, workers: int, chunk_size: int = None) -> list[tuple[int, int]]:
+    if chunk_size is None:
+        # A few chunks per worker balance the load
+        chunk_size = max(-(-n // (4 * workers)), 1)
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+@contextmanager
+def stiffness_triplets(arrays: dict[str, np.ndarray], offsets: np.ndarray,
+                       global_coordinate_system: CoordinateSystem = None, workers: int = None,
+                       executor: str = "thread", chunk_size: int = None):
+    """
+    Computes COO rows, columns and values of elements' global stiffness matrices in parallel.
+    Used as a context manager, the yielded arrays are valid only inside the with block
+    because shared memory is released when it exits.
+
+    :param arrays: element arrays, see FEModel.element_arrays
+    :param offsets: dof offsets indexed by node id, see FEModel.dof_offsets
+    :param workers: number of workers, defaults to number of CPUs
+    :param executor: "thread" or "process"
+    :param chunk_size: number of elements per task
+    :return: (N, 144) arrays of rows and columns and (N, 12, 12) array of values
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}")
+    if global_coordinate_system is None:
+        global_coordinate_system = CoordinateSystem()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    n = len(arrays["n1"])
+    inputs = {name: arrays[name] for name in INPUTS[:-2]}
+    inputs["offsets1"] = offsets[arrays["n1"]]
+    inputs["offsets2"] = offsets[arrays["n2"]]
+    outputs = {"data": ((n, 12, 12), np.float64),
+               "rows": ((n, 144), np.int64),
+               "cols": ((n, 144), np.int64)}
+    chunks = _chunks(n, workers, chunk_size)
+
+    if workers == 1 or n < MIN_PARALLEL_ELEMENTS or executor == "thread":
+        buffers = {**inputs, **{name: np.empty(shape, dtype) for name, (shape, dtype) in outputs.items()}}
+        if workers == 1 or n < MIN_PARALLEL_ELEMENTS:
+            _assemble_chunk(buffers, 0, n, global_coordinate_system)
+        else:
+            with ThreadPoolExecutor(workers) as pool:
+                for future in [pool.submit(_assemble_chunk, buffers, start, stop, global_coordinate_system)
+                               for start, stop in chunks]:
+                    future.result()
+        yield buffers["rows"], buffers["cols"], buffers["data"]
+        return
+
+    blocks = {}
+    shared = {}
+    try:
+        specs = {}
+        for name, value in inputs.items():
+            value = np.ascontiguousarray(value)
+            blocks[name] = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+            shared[name] = np.ndarray(value.shape, dtype=value.dtype, buffer=blocks[name].buf)
+            shared[name][...] = value
+            specs[name] = (blocks[name].name, value.shape, value.dtype)
+        for name, (shape, dtype) in outputs.items():
+            size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            blocks[name] = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            shared[name] = np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+            specs[name] = (blocks[name].name, shape, dtype)
+        with ProcessPoolExecutor(workers) as pool:
+            for future in [pool.submit(_assemble_chunk_shared, specs, start, stop, global_coordinate_system)
+                           for start, stop in chunks]:
+                future.result()
+        yield shared["rows"], shared["cols"], shared["data"]
+    finally:
+        shared.clear()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def global_stiffness_matrix(arrays: dict[str, np.ndarray], offsets: np.ndarray,
+                            global_coordinate_system: CoordinateSystem = None, workers: int = None,
+                            executor: str = "thread", chunk_size: int = None,
+                            plan: solver.AssemblyPlan = None) -> sparse.csr_matrix:
+    """
+    Assembles the global stiffness matrix in parallel, see stiffness_triplets
+
+    :param plan: assembly plan of the elements' dofs, e.g. FEModel.assembly_plan,
+        compiled from the computed triplets if not given
+    """
+    with stiffness_triplets(arrays, offsets, global_coordinate_system,
+                            workers, executor, chunk_size) as (rows, cols, data):
+        if plan is None:
+            plan = solver.AssemblyPlan(rows, cols, int(rows.max()) + 1 if rows.size else 0)
+        return plan.assemble(data)
@@ -0,0 +1,212 @@
+"""
+Binary save and load of complete FE models.
+
+Model is stored as one uncompressed .npz archive of flat arrays: node coordinates,
+element connectivity, section and material tables, supports and loads. Node, element,
+support, load and load case ids are stored with their rows, so that a loaded model
+has the same ids. Sections and materials are stored once each and restored as
+shared instances, catalog instances (SteelSection, structural_steel) are reused.
+"""
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import json
+
+import numpy as np
+
+import pyFEM.catalogs.materials.steel.structural_steel as structural_steel
+from loading.loadcase import LoadCase
+from loading.loadtype import LoadTypeEnum
+from pyFEM.coordinate_system import CoordinateSystem
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.pointload import PointLoad
+from pyFEM.steel_section import SteelSection
+from pyFEM.support import NodalSupport
+
+FORMAT_VERSION = 1
+COUNTERS = ("elem_id", "supp_id", "load_id", "node_id", "load_case_id")
+
+
+def _describe(obj) -> dict:
+    """
+    Returns class path and constructor arguments of a dataclass instance
+    """
+    cls = type(obj)
+    return {"class": f"{cls.__module__}:{cls.__qualname__}",
+            "kwargs": {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj) if f.init}}
+
+
+def _catalog():
+    """
+    Returns catalog instances of sections and materials
+    """
+    return ([sect for sect in vars(SteelSection).values() if dataclasses.is_dataclass(sect)] +
+            [mat for mat in vars(structural_steel).values() if dataclasses.is_dataclass(mat)
+             and not isinstance(mat, type)])
+
+
+def _restore(description: dict, catalog: list):
+    module, qualname = description["class"].split(":")
+    cls = getattr(importlib.import_module(module), qualname)
+    obj = cls(**description["kwargs"])
+    for instance in catalog:
+        if type(instance) is cls and instance == obj:
+            return instance
+    return obj
+
+
+def _loads_table(loads: list, owner: int, elem_rows: dict[int, int]) -> dict[str, list]:
+    table = {"pl_ids": [], "pl_owner": [], "pl_nodes": [], "pl_values": [],
+             "ll_ids": [], "ll_owner": [], "ll_elems": [], "ll_values": []}
+    for load in loads:
+        load_id = getattr(load, "load_id", -1)
+        if isinstance(load, PointLoad):
+            table["pl_ids"].append(load_id)
+            table["pl_owner"].append(owner)
+            table["pl_nodes"].append(load.node.node_id)
+            table["pl_values"].append(load.global_load_vector)
+        elif isinstance(load, LineLoad):
+            table["ll_ids"].append(load_id)
+            table["ll_owner"].append(owner)
+            table["ll_elems"].append(elem_rows[load.element.elem_id])
+            table["ll_values"].append(load.load_vector)
+    return table
+
+
+def save_model(model: FEModel, file) -> None:
+    """
+    Saves model's geometry, sections, materials, supports, loads and load cases
+    to an .npz file. Analysis results are not saved. Models with superelements
+    cannot be saved, because a superelement refers to its whole sub-model.
+    """
+    if model.superelements:
+        raise ValueError("Models with superelements cannot be saved")
+    nodes = model.node_list
+    elements = model.element_list
+    elem_rows = {elem.elem_id: i for i, elem in enumerate(elements)}
+    sections, materials = {}, {}
+    for elem in elements:
+        sections.setdefault(id(elem.section), (len(sections), elem.section))
+        materials.setdefault(id(elem.material), (len(materials), elem.material))
+    supports = model.support_list
+
+    tables = _loads_table(list(model.loads.values()), -1, elem_rows)
+    for lc in model.load_cases.values():
+        for key, values in _loads_table(lc.loads, lc.load_id, elem_rows).items():
+            tables[key].extend(values)
+
+    gcs = model.global_coordinate_system
+    meta = {"version": FORMAT_VERSION,
+            "sections": [_describe(sect) for _, sect in sections.values()],
+            "materials": [_describe(mat) for _, mat in materials.values()],
+            "load_cases": [{"load_id": lc.load_id, "name": lc.name,
+                            "load_type": lc.load_type.name if lc.load_type is not None else None}
+                           for lc in model.load_cases.values()]}
+    arrays = {
+        "meta": np.array(json.dumps(meta)),
+        "counters": np.array([getattr(model, name) for name in COUNTERS], dtype=np.int64),
+        "coordinate_system": np.array([gcs.origin, gcs.X, gcs.Y, gcs.Z], dtype=np.float64),
+        "node_ids": np.array([node.node_id for node in nodes], dtype=np.int64),
+        "coordinates": np.array([(node.x, node.y, node.z) for node in nodes],
+                                dtype=np.float64).reshape((-1, 3)),
+        "elem_ids": np.array([elem.elem_id for elem in elements], dtype=np.int64),
+        "connectivity": np.array([(elem.n1.node_id, elem.n2.node_id) for elem in elements],
+                                 dtype=np.int64).reshape((-1, 2)),
+        "element_section": np.array([sections[id(elem.section)][0] for elem in elements], dtype=np.int64),
+        "element_material": np.array([materials[id(elem.material)][0] for elem in elements], dtype=np.int64),
+        "element_flags": np.array([(elem.has_load, elem.cached) for elem in elements],
+                                  dtype=bool).reshape((-1, 2)),
+        "supp_ids": np.array([supp.supp_id for supp in supports], dtype=np.int64),
+        "support_nodes": np.array([supp.node.node_id for supp in supports], dtype=np.int64),
+        "restraints": np.array([supp.as_vector for supp in supports], dtype=bool).reshape((-1, 6)),
+        "support_displacements": np.array([np.asarray(supp.displacement, dtype=np.float64)
+                                           for supp in supports]).reshape((-1, 6)),
+        "pl_values": np.array(tables.pop("pl_values"), dtype=np.float64).reshape((-1, 6)),
+        "ll_values": np.array(tables.pop("ll_values"), dtype=np.float64).reshape((-1, 12)),
+        **{key: np.array(values, dtype=np.int64) for key, values in tables.items()},
+    }
+    if model._dof_offsets is not None:
+        arrays["dof_offsets"] = model._dof_offsets
+    np.savez(file, **arrays)
+
+
+def load_model(file) -> FEModel:
+    """
+    Loads model saved with save_model
+    """
+    with np.load(file) as data:
+        arrays = {key: data[key] for key in data.files}
+    meta = json.loads(arrays["meta"].item())
+    if meta["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported model file version: {meta['version']}")
+
+    origin, X, Y, Z = arrays["coordinate_system"]
+    model = FEModel(global_coordinate_system=CoordinateSystem(origin, X, Y, Z))
+    for name, value in zip(COUNTERS, arrays["counters"].tolist()):
+        setattr(model, name, value)
+
+    catalog = _catalog()
+    sections = [_restore(sect, catalog) for sect in meta["sections"]]
+    materials = [_restore(mat, catalog) for mat in meta["materials"]]
+
+    nodes = {}
+    for node_id, xyz in zip(arrays["node_ids"].tolist(), arrays["coordinates"].tolist()):
+        node = Node(*xyz)
+        node.node_id = node_id
+        nodes[node_id] = node
+    model.nodes = nodes
+
+    elements = []
+    for elem_id, (n1, n2), sect, mat, (has_load, cached) in zip(
+            arrays["elem_ids"].tolist(), arrays["connectivity"].tolist(),
+            arrays["element_section"].tolist(), arrays["element_material"].tolist(),
+            arrays["element_flags"].tolist()):
+        elem = Element(nodes[n1], nodes[n2], sections[sect], materials[mat],
+                       global_coordinate_system=model.global_coordinate_system,
+                       has_load=has_load, cached=cached)
+        elem.elem_id = elem_id
+        elements.append(elem)
+        model.elements[elem_id] = elem
+
+    for supp_id, node_id, restraint, disp in zip(arrays["supp_ids"].tolist(),
+                                                 arrays["support_nodes"].tolist(),
+                                                 arrays["restraints"].tolist(),
+                                                 arrays["support_displacements"]):
+        supp = NodalSupport(nodes[node_id], *restraint, displacement=disp.copy())
+        supp.supp_id = supp_id
+        supp.node.supported = True
+        model.supports[supp_id] = supp
+
+    load_cases = {}
+    for lc_meta in meta["load_cases"]:
+        load_type = LoadTypeEnum[lc_meta["load_type"]] if lc_meta["load_type"] is not None else None
+        lc = LoadCase(load_type, name=lc_meta["name"])
+        lc.load_id = lc_meta["load_id"]
+        load_cases[lc.load_id] = lc
+    model.load_cases = load_cases
+
+    def place(load, load_id, owner):
+        if load_id >= 0:
+            load.load_id = load_id
+        if owner < 0:
+            model.loads[load_id] = load
+        else:
+            load_cases[owner].add(load)
+
+    for load_id, owner, node_id, values in zip(arrays["pl_ids"].tolist(), arrays["pl_owner"].tolist(),
+                                               arrays["pl_nodes"].tolist(), arrays["pl_values"].tolist()):
+        place(PointLoad(nodes[node_id], *values), load_id, owner)
+    for load_id, owner, elem_row, values in zip(arrays["ll_ids"].tolist(), arrays["ll_owner"].tolist(),
+                                                arrays["ll_elems"].tolist(), arrays["ll_values"]):
+        q = values.reshape((2, 6))
+        place(LineLoad(elements[elem_row], *q.T.copy()), load_id, owner)
+    # Model's loads in the original order
+    model.loads = dict(sorted(model.loads.items()))
+
+    if "dof_offsets" in arrays:
+        model._dof_offsets = arrays["dof_offsets"]
+    return model
@@ -1,13 +1,50 @@
-from pyFEM.results.results import Results
+from __future__ import annotations
+
+import numpy as np
 from numpy import ndarray
 
-class Postprocessor:
+from pyFEM.results.results import Results
+from pyFEM.results.store import ResultStore
 
 
-    def __init__(self):
-        pass
+class Postprocessor:
+    """
+    Writes displacements, reactions and element forces of solved load cases
+    to a columnar result store on disk
+    """
 
+    def __init__(self, model, path: str, n_cases: int, n_stations: int = 11):
+        """
+        :param model: FEModel whose results are processed
+        :param path: directory of the result store
+        :param n_cases: number of load cases the store has room for
+        :param n_stations: number of section force stations per element
+        """
+        self.model = model
+        self.n_stations = n_stations
+        self.node_ids = np.array([node.node_id for node in model.node_list], dtype=np.int64)
+        supports = model.support_list
+        self.restraints = np.array([supp.as_vector for supp in supports], dtype=bool).reshape((-1, 6))
+        store = ResultStore.create(path, self.node_ids,
+                                   np.fromiter(model.elements, dtype=np.int64, count=len(model.elements)),
+                                   np.array([supp.node.node_id for supp in supports], dtype=np.int64),
+                                   n_cases, n_stations)
+        self.results = Results(store=store)
 
-    def process(self, U: ndarray, R: ndarray) -> None:
-        pass
+    def process(self, U: ndarray, R: ndarray, load_id: int = 0, loads: list = None) -> None:
+        """
+        Writes results of one load case
 
+        :param U: global vector of nodal displacements
+        :param R: global vector of residual forces, see solver.reduced_static_load_analysis
+        :param loads: loads of the load case, defaults to model's loads
+        """
+        store = self.results.store
+        offsets = self.model.dof_offsets
+        node_dofs = offsets[self.node_ids][:, None] + np.arange(6)
+        support_dofs = offsets[store.indices["support_node_ids"]][:, None] + np.arange(6)
+        beams = self.model.internal_forces(load_id, self.n_stations, loads, U)
+        if not store.load_ids:
+            store.write_stations(beams.x)
+        store.write(load_id, U[node_dofs], np.where(self.restraints, R[support_dofs], 0.0),
+                    beams.end_forces, beams.forces)
@@ -5,24 +5,87 @@
 # @Project: pyFEM
 # @AUTHOR : Jaakko Huusko
 import esper
-from components import Material, Section, Line
-import elem_funcs as ef
+import numpy as np
 
-class ElementProcessor:
-    ...
+import pyFEM.elem_funcs as ef
+import pyFEM.solver as solver
+from pyFEM.array_model import ArrayModel
 
 
-class LocalStiffnessMatrixProcessor(esper.Processor):
+class StiffnessProcessor(esper.Processor):
+    """
+    Computes elements' global stiffness matrices and assembles the global stiffness matrix
+    """
     world: esper.World
+    priority = 40
 
+    def process(self, model: ArrayModel, *args, **kwargs):
+        arrays = model.element_arrays
+        model.element_stiffness = ef.stiffness_matrices(arrays["coordinates1"], arrays["coordinates2"],
+                                                        arrays["E"], arrays["G"], arrays["A"],
+                                                        arrays["Iy"], arrays["Iz"], arrays["It"],
+                                                        model.global_coordinate_system)
+        idxs = ef.dof_indices(arrays["n1"] * 6, arrays["n2"] * 6)
+        model.K = solver.global_stiffness_matrix(np.repeat(idxs, 12, axis=1),
+                                                 np.tile(idxs, (1, 12)),
+                                                 model.element_stiffness)
 
-    def process(self, *args, **kwargs):
-        for ent, (mat, sect, line) in self.world.get_components(Material, Section, Line):
-            lsm = ef.local_stiffness_matrix(mat.E,
-                                            mat.A,
-                                            mat.G,
-                                            sect.Iy,
-                                            sect.Iz,
-                                            sect.J,
-                                            ef.line_length(line.P1, line.P2)
-                                            )
\ No newline at end of file
+
+class LoadProcessor(esper.Processor):
+    """
+    Assembles the global load vector from point and line loads
+    """
+    world: esper.World
+    priority = 30
+
+    def process(self, model: ArrayModel, *args, **kwargs):
+        F = np.zeros((model.n_nodes, 6))
+        np.add.at(F, model.pointload_nodes, model.pointloads)
+        llf = ef.line_load_vectors(model.lineloads, model.lengths[model.lineload_elements])
+        elems = model.connectivity[model.lineload_elements]
+        np.add.at(F, elems[:, 0], llf[:, :6])
+        np.add.at(F, elems[:, 1], llf[:, 6:])
+        model.F = F.ravel()
+
+
+class SolveProcessor(esper.Processor):
+    """
+    Solves nodal displacements and reactions of the reduced system
+    """
+    world: esper.World
+    priority = 20
+
+    def process(self, model: ArrayModel, *args, **kwargs):
+        model.U, model.R = solver.reduced_static_load_analysis(model.K, model.F,
+                                                               model.fixed_dofs,
+                                                               model.constraint_vector)
+
+
+class ResultProcessor(esper.Processor):
+    """
+    Recovers elements' local end forces
+    """
+    world: esper.World
+    priority = 10
+
+    def process(self, model: ArrayModel, *args, **kwargs):
+        arrays = model.element_arrays
+        _, dir_cos = ef.element_geometry(arrays["coordinates1"], arrays["coordinates2"],
+                                         model.global_coordinate_system)
+        u = model.U[ef.dof_indices(arrays["n1"] * 6, arrays["n2"] * 6)]
+        F_eq = np.zeros((model.n_elems, 12))
+        np.add.at(F_eq, model.lineload_elements,
+                  ef.line_load_vectors(model.lineloads, model.lengths[model.lineload_elements]))
+        # Global element stiffness is T.T k T, so T.T k T u = T.T f
+        model.end_forces = ef.to_local(dir_cos, np.einsum('nij,nj->ni', model.element_stiffness, u) - F_eq)
+
+
+def linear_statics(model: ArrayModel) -> ArrayModel:
+    """
+    Runs stiffness, load, solve and result stages on array model
+    """
+    world = esper.World()
+    for processor in (StiffnessProcessor(), LoadProcessor(), SolveProcessor(), ResultProcessor()):
+        world.add_processor(processor, processor.priority)
+    world.process(model)
+    return model
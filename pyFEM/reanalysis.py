@@ -0,0 +1,193 @@
+"""
+Incremental re-analysis of a linear static model after local changes.
+
+Changing the section or material of a few elements, or adding or removing elements
+between existing nodes, changes the stiffness matrix by K = K0 + P C P^T, where P
+selects the dofs of the changed elements and C is the assembled difference of their
+stiffness matrices. Displacements are solved with the factorization of K0 using the
+Sherman-Morrison-Woodbury identity
+
+    (K0 + P C P^T)^-1 = K0^-1 - K0^-1 P (I + C P^T K0^-1 P)^-1 C P^T K0^-1
+
+which does not require C to be invertible. When the changed dofs grow past max_rank,
+or nodes, supports or superelements change, the stiffness matrix is assembled and
+factorized again.
+"""
+from __future__ import annotations
+
+import numpy as np
+from scipy import sparse
+
+import pyFEM.elem_funcs as ef
+import pyFEM.solver as solver
+
+
+class Reanalysis:
+    """
+    Linear static analysis that is updated with low-rank corrections
+    """
+
+    def __init__(self, model, load_id: int = 0, max_rank: int = 120):
+        """
+        Performs the initial analysis and stores results to model
+
+        :param model: FEModel to analyse
+        :param load_id: key under which results are stored
+        :param max_rank: maximum number of changed free dofs before refactorization
+        """
+        self.model = model
+        self.load_id = load_id
+        self.max_rank = max_rank
+        self.refactorizations = 0
+        self.factorize()
+
+    def factorize(self) -> None:
+        """
+        Assembles and factorizes the stiffness matrix of the current model
+        and solves it
+        """
+        model = self.model
+        arrays = model.element_arrays
+        matrices = model.element_stiffness_matrices(arrays)
+        dofs = model.element_dofs(arrays)
+        self.K0 = model.stiffness_matrix(arrays, matrices)
+        self.fixed_dofs = model.fixed_dofs
+        self.free = solver.free_dofs(model.dofs, self.fixed_dofs)
+        # Row of each free dof in the reduced system
+        self.free_rows = np.cumsum(self.free) - 1
+        self.lu = solver.factorize(self.K0, self.fixed_dofs)
+        self.node_ids = set(model.nodes)
+        self.superelements = dict(model.superelements)
+        self.dof_offsets = model.dof_offsets.copy()
+        # Element matrices and dofs included in K0
+        self.base = {elem_id: (dofs[i], matrices[i]) for i, elem_id in enumerate(model.elements)}
+        self.changes = {}
+        # Columns of K0_ff^-1 of changed dofs
+        self._columns = {}
+        self.refactorizations += 1
+        self.solve(loads_changed=True)
+
+    @property
+    def rank(self) -> int:
+        """
+        Number of free dofs affected by changes since the last factorization
+        """
+        dofs, _ = self._correction()
+        return int(np.count_nonzero(self.free[dofs]))
+
+    def update(self, elements: list = (), loads_changed: bool = False) -> bool:
+        """
+        Re-analyses the model after changes and stores results to model.
+        Added and removed elements are detected automatically.
+
+        :param elements: elements whose section, material or orientation has changed
+        :param loads_changed: assemble the load vector and prescribed displacements again
+        :return: True if the change was applied as a low-rank correction,
+            False if the stiffness matrix was factorized again
+        """
+        model = self.model
+        if elements:
+            model.invalidate()
+        if (set(model.nodes) != self.node_ids or not np.array_equal(model.dof_offsets, self.dof_offsets)
+                or not np.array_equal(model.fixed_dofs, self.fixed_dofs)
+                or model.superelements != self.superelements):
+            self.factorize()
+            return False
+
+        changed = {elem.elem_id: elem for elem in elements}
+        for elem_id in model.elements.keys() - self.base.keys():
+            changed[elem_id] = model.elements[elem_id]
+        # Drop changes of elements no longer in model, removed base elements are added below
+        for key in list(self.changes):
+            if (key[0] if isinstance(key, tuple) else key) not in model.elements:
+                del self.changes[key]
+        for elem_id in self.base.keys() - model.elements.keys():
+            self.changes[elem_id] = (self.base[elem_id][0], -self.base[elem_id][1])
+
+        if changed:
+            elems = list(changed.values())
+            matrices = ef.stiffness_matrices(
+                np.array([(elem.n1.x, elem.n1.y, elem.n1.z) for elem in elems], dtype=np.float64),
+                np.array([(elem.n2.x, elem.n2.y, elem.n2.z) for elem in elems], dtype=np.float64),
+                *np.array([(elem.material.E, elem.material.G, elem.section.A, elem.section.Iy,
+                            elem.section.Iz, elem.section.It) for elem in elems], dtype=np.float64).T,
+                model.global_coordinate_system)
+            offsets = model.dof_offsets
+            dofs = ef.dof_indices(offsets[[elem.n1.node_id for elem in elems]],
+                                  offsets[[elem.n2.node_id for elem in elems]])
+            for elem_id, elem_dofs, matrix in zip(changed, dofs, matrices):
+                if elem_id in self.base:
+                    base_dofs, base_matrix = self.base[elem_id]
+                    if np.array_equal(base_dofs, elem_dofs):
+                        self.changes[elem_id] = (elem_dofs, matrix - base_matrix)
+                        continue
+                    # Element moved to other nodes, remove old and add new stiffness
+                    self.changes[(elem_id, "removed")] = (base_dofs, -base_matrix)
+                self.changes[elem_id] = (elem_dofs, matrix)
+
+        if self.rank > self.max_rank:
+            self.factorize()
+            return False
+        self.solve(loads_changed)
+        return True
+
+    def _correction(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns global dofs D and the dense matrix C of K = K0 + P_D C P_D^T
+        """
+        if not self.changes:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 0))
+        dofs = np.concatenate([elem_dofs for elem_dofs, _ in self.changes.values()])
+        D = np.unique(dofs)
+        C = np.zeros((len(D), len(D)))
+        for elem_dofs, delta in self.changes.values():
+            idx = np.searchsorted(D, elem_dofs)
+            C[np.ix_(idx, idx)] += delta
+        return D, C
+
+    def _inverse_columns(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Returns columns of K0_ff^-1 at given rows of the reduced system, cached between updates
+        """
+        missing = [row for row in rows.tolist() if row not in self._columns]
+        if missing:
+            E = np.zeros((self.lu.shape[0], len(missing)))
+            E[missing, np.arange(len(missing))] = 1.0
+            for row, column in zip(missing, self.lu.solve(E).T):
+                self._columns[row] = column
+        if not len(rows):
+            return np.zeros((self.lu.shape[0], 0))
+        return np.column_stack([self._columns[row] for row in rows.tolist()])
+
+    def solve(self, loads_changed: bool = False) -> None:
+        """
+        Solves displacements of the current stiffness and stores results to model.
+        Load vector and the solution with K0 are reused unless loads have changed.
+        """
+        model = self.model
+        free, fixed_dofs = self.free, self.fixed_dofs
+        if loads_changed:
+            self.F = model.global_load_vector.ravel()
+            self.U_fixed = np.zeros(model.dofs)
+            self.U_fixed[fixed_dofs] = model.constraint_vector
+            self.x0 = self.lu.solve(self.F[free] - (self.K0 @ self.U_fixed)[free])
+        D, C = self._correction()
+        dK = sparse.coo_matrix((C.ravel(), (np.repeat(D, len(D)), np.tile(D, len(D)))),
+                               shape=self.K0.shape).tocsr()
+
+        U = self.U_fixed.copy()
+        x = self.x0
+        prescribed = (dK @ U)[free]
+        if np.any(prescribed):
+            x = x - self.lu.solve(prescribed)
+
+        D_free = D[free[D]]
+        if len(D_free):
+            rows = self.free_rows[D_free]
+            Z = self._inverse_columns(rows)
+            C_ff = C[np.ix_(free[D], free[D])]
+            y = np.linalg.solve(np.eye(len(rows)) + C_ff @ Z[rows], C_ff @ x[rows])
+            x = x - Z @ y
+        U[free] = x
+        F_react = self.F - self.K0 @ U - dK @ U
+        model.store_results(U, F_react, self.load_id)
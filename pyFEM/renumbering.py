@@ -0,0 +1,46 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+
+
+def node_adjacency(n1_ids: np.ndarray, n2_ids: np.ndarray, n_nodes: int) -> sparse.csr_matrix:
+    """
+    Returns symmetric node adjacency matrix of elements' connectivity
+    """
+    rows = np.concatenate((n1_ids, n2_ids))
+    cols = np.concatenate((n2_ids, n1_ids))
+    adjacency = sparse.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)),
+                                  shape=(n_nodes, n_nodes))
+    adjacency.sum_duplicates()
+    return adjacency
+
+
+def rcm_positions(adjacency: sparse.csr_matrix) -> np.ndarray:
+    """
+    Returns nodes' positions in reverse Cuthill-McKee order, indexed by node id
+    """
+    order = csgraph.reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+    positions = np.empty(len(order), dtype=np.int64)
+    positions[order] = np.arange(len(order))
+    return positions
+
+
+def bandwidth_profile(positions1: np.ndarray, positions2: np.ndarray, n_nodes: int,
+                      dofs: int = 6) -> tuple[int, int]:
+    """
+    Calculates half-bandwidth and profile (envelope size of the lower triangle)
+    of the global stiffness matrix without assembling it
+
+    :param positions1: (N,) array of elements' first nodes' positions in dof numbering
+    :param positions2: (N,) array of elements' second nodes' positions in dof numbering
+    :param n_nodes: number of nodes
+    :param dofs: number of dofs per node
+    """
+    # Lowest coupled node position of every node position
+    first = np.arange(n_nodes)
+    np.minimum.at(first, positions1, positions2)
+    np.minimum.at(first, positions2, positions1)
+    distance = np.arange(n_nodes) - first
+    bandwidth = int(distance.max(initial=0)) * dofs + dofs - 1
+    profile = int(distance.sum()) * dofs ** 2 + n_nodes * dofs * (dofs - 1) // 2
+    return bandwidth, profile
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+
+class TimeHistory:
+    """
+    Records displacement and reaction histories of a time-history analysis.
+    Only selected dofs are recorded. If path is given, histories are buffered
+    in chunks of time steps and written to .npy files, so that they never have to
+    fit in memory. Otherwise they are kept in arrays.
+
+    Use as a callback of solver.time_history_analysis.
+    """
+
+    FILES = ("time", "displacements", "reactions")
+
+    def __init__(self, n_steps: int, dofs: np.ndarray, n_reactions: int,
+                 path: str = None, chunk_size: int = 1000):
+        """
+        :param n_steps: number of time steps, the initial state is recorded in addition
+        :param dofs: global indices of recorded dofs
+        :param n_reactions: number of restrained dofs
+        :param path: directory where histories are written
+        :param chunk_size: number of time steps buffered in memory between writes
+        """
+        self.dofs = np.asarray(dofs, dtype=np.int64)
+        self.path = path
+        self.chunk_size = chunk_size
+        shapes = {"time": (n_steps + 1,),
+                  "displacements": (n_steps + 1, len(self.dofs)),
+                  "reactions": (n_steps + 1, n_reactions)}
+        if path is None:
+            self.time, self.displacements, self.reactions = (np.zeros(shapes[name])
+                                                             for name in self.FILES)
+            self._buffers = None
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.time, self.displacements, self.reactions = (
+                np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode="w+",
+                                          dtype=np.float64, shape=shapes[name])
+                for name in self.FILES)
+            self._buffers = [np.zeros((chunk_size,) + shapes[name][1:]) for name in self.FILES]
+        self._start = 0
+        self._n = 0
+
+    def __call__(self, n: int, t: float, U: np.ndarray, V: np.ndarray, A: np.ndarray,
+                 R: np.ndarray) -> None:
+        if self._buffers is None:
+            self.time[n] = t
+            self.displacements[n] = U[self.dofs]
+            self.reactions[n] = R
+            return
+        i = n - self._start
+        self._buffers[0][i] = t
+        self._buffers[1][i] = U[self.dofs]
+        self._buffers[2][i] = R
+        self._n = n + 1
+        if i + 1 == self.chunk_size or self._n == len(self.time):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes buffered time steps to disk
+        """
+        if self._buffers is None or self._n == self._start:
+            return
+        count = self._n - self._start
+        for array, buffer in zip((self.time, self.displacements, self.reactions), self._buffers):
+            array[self._start:self._n] = buffer[:count]
+            array.flush()
+        self._start = self._n
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = "r") -> dict[str, np.ndarray]:
+        """
+        Opens histories written to path as memory-mapped arrays
+        """
+        return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                for name in cls.FILES}
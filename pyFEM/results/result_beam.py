@@ -31,3 +31,55 @@ class ResultBeam:
     """
     sections: list[ResultSection]
 
+
+@dataclass
+class ResultBeams:
+    """
+    Class that handles section forces of all beams of one load case as arrays
+    """
+    # (N,) element ids
+    elem_ids: np.ndarray
+    # (N, S) station distances from element's first node
+    x: np.ndarray
+    # (N, S, 6) section forces N, V_y, V_z, M_T, M_y, M_z
+    forces: np.ndarray
+    # (N, 12) local forces acting on elements at their nodes
+    end_forces: np.ndarray
+    load_id: int = 0
+
+    @property
+    def N(self) -> np.ndarray:
+        return self.forces[..., 0]
+
+    @property
+    def V_y(self) -> np.ndarray:
+        return self.forces[..., 1]
+
+    @property
+    def V_z(self) -> np.ndarray:
+        return self.forces[..., 2]
+
+    @property
+    def M_T(self) -> np.ndarray:
+        return self.forces[..., 3]
+
+    @property
+    def M_y(self) -> np.ndarray:
+        return self.forces[..., 4]
+
+    @property
+    def M_z(self) -> np.ndarray:
+        return self.forces[..., 5]
+
+    def index(self, elem_id: int) -> int:
+        """
+        Returns element's row in result arrays
+        """
+        return int(np.flatnonzero(self.elem_ids == elem_id)[0])
+
+    def beam(self, elem_id: int) -> ResultBeam:
+        """
+        Returns element's section forces as ResultBeam
+        """
+        forces = self.forces[self.index(elem_id)]
+        return ResultBeam([ResultSection(*f, load_id=self.load_id) for f in forces.tolist()])
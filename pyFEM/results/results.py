@@ -1,10 +1,25 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from pyFEM.results.store import ResultStore
+
 
 @dataclass
 class Results:
     internal_forces: dict = field(default_factory=dict)
     support_reactions: dict = field(default_factory=dict)
+    # Columnar on-disk results, see ResultStore
+    store: ResultStore = None
+
+    @classmethod
+    def open(cls, path: str) -> Results:
+        """
+        Opens results written by Postprocessor, arrays are read lazily
+        """
+        return cls(store=ResultStore(path))
 
 """
 
@@ -20,4 +35,44 @@ internal_forces = {}
     }
 
 
-"""
\ No newline at end of file
+"""
+
+@dataclass
+class BucklingResult:
+    """
+    Critical load factors and buckling modes of one load case
+    """
+    load_id: int
+    # (n_modes,) critical load factors in ascending order
+    load_factors: np.ndarray
+    # (n_nodes, 6, n_modes) mode shapes indexed by node id
+    modes: np.ndarray
+
+
+@dataclass
+class ModalResult:
+    """
+    Natural frequencies and vibration modes
+    """
+    # (n_modes,) squared angular frequencies [rad^2/s^2]
+    eigenvalues: np.ndarray
+    # (n_nodes, 6, n_modes) mass normalized mode shapes indexed by node id
+    modes: np.ndarray
+    # (n_modes, 3) participating mass ratios in global X, Y and Z -directions
+    participating_mass_ratios: np.ndarray
+
+    @property
+    def angular_frequencies(self) -> np.ndarray:
+        return np.sqrt(np.maximum(self.eigenvalues, 0.0))
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """
+        Natural frequencies [Hz]
+        """
+        return self.angular_frequencies / (2 * np.pi)
+
+    @property
+    def periods(self) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            return 1 / self.frequencies
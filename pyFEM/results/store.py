@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import os
+
+import numpy as np
+
+# Column name: shape of one load case's block, resolved from the store's dimensions
+COLUMNS = {
+    "displacements": ("n_nodes", 6),
+    "reactions": ("n_supports", 6),
+    "end_forces": ("n_elems", 12),
+    "section_forces": ("n_elems", "n_stations", 6),
+}
+INDICES = ("node_ids", "elem_ids", "support_node_ids")
+
+
+class ResultStore:
+    """
+    Columnar on-disk store of analysis results. Every column is a memory-mapped .npy
+    file of shape (n_cases, ...), which is written one load case at a time and read lazily.
+    Rows are indexed by node, element and support node ids and load case ids.
+
+    Indexing with single ids returns views of the memory-mapped files, so only
+    the accessed part of the result set is read from disk.
+    """
+
+    def __init__(self, path: str, mode: str = "r"):
+        """
+        Opens an existing store
+
+        :param path: directory of the store
+        :param mode: "r" for reading, "r+" for writing more load cases
+        """
+        self.path = path
+        self.mode = mode
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.indices = {name: np.load(os.path.join(path, f"{name}.npy")) for name in INDICES}
+        self.stations = np.load(os.path.join(path, "stations.npy"), mmap_mode="r")
+        self._columns = {}
+        self._lookup = {}
+
+    @classmethod
+    def create(cls, path: str, node_ids: np.ndarray, elem_ids: np.ndarray,
+               support_node_ids: np.ndarray, n_cases: int, n_stations: int = 11) -> ResultStore:
+        """
+        Creates an empty store with room for n_cases load cases. Space on disk
+        is allocated as files are written.
+        """
+        os.makedirs(path, exist_ok=True)
+        ids = {"node_ids": node_ids, "elem_ids": elem_ids, "support_node_ids": support_node_ids}
+        for name in INDICES:
+            np.save(os.path.join(path, f"{name}.npy"), np.asarray(ids[name], dtype=np.int64))
+        dims = {"n_cases": n_cases, "n_nodes": len(node_ids), "n_elems": len(elem_ids),
+                "n_supports": len(support_node_ids), "n_stations": n_stations}
+        for name, shape in COLUMNS.items():
+            shape = (n_cases,) + tuple(dims.get(dim, dim) for dim in shape)
+            np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode="w+",
+                                      dtype=np.float64, shape=shape).flush()
+        np.lib.format.open_memmap(os.path.join(path, "stations.npy"), mode="w+",
+                                  dtype=np.float64, shape=(len(elem_ids), n_stations)).flush()
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({**dims, "load_ids": []}, f)
+        return cls(path, mode="r+")
+
+    @property
+    def load_ids(self) -> list[int]:
+        return self.meta["load_ids"]
+
+    @property
+    def n_stations(self) -> int:
+        return self.meta["n_stations"]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns (n_cases, ...) memory-mapped array of a column, only written load cases
+        """
+        if name not in self._columns:
+            self._columns[name] = np.load(os.path.join(self.path, f"{name}.npy"),
+                                          mmap_mode=self.mode)
+        return self._columns[name][:len(self.load_ids)]
+
+    def index(self, name: str, ids) -> np.ndarray | int:
+        """
+        Returns rows of ids in index "node_ids", "elem_ids", "support_node_ids" or "load_ids"
+        """
+        if name == "load_ids":
+            keys = np.asarray(self.load_ids, dtype=np.int64)
+        else:
+            keys = self.indices[name]
+        if name not in self._lookup or len(self._lookup[name]) != len(keys):
+            self._lookup[name] = np.argsort(keys, kind="stable")
+        order = self._lookup[name]
+        if not len(keys):
+            raise KeyError(f"{ids} not in {name}")
+        # Ids above the largest key are clipped to it and rejected below
+        rows = order[np.minimum(np.searchsorted(keys, ids, sorter=order), len(keys) - 1)]
+        if np.any(keys[rows] != ids):
+            raise KeyError(f"{ids} not in {name}")
+        return int(rows) if np.ndim(rows) == 0 else rows
+
+    def write(self, load_id: int, displacements: np.ndarray, reactions: np.ndarray,
+              end_forces: np.ndarray = None, section_forces: np.ndarray = None) -> None:
+        """
+        Writes results of one load case, rows in the order of the store's indices
+        """
+        if self.mode == "r":
+            raise PermissionError("Result store is opened read-only")
+        if load_id in self.load_ids:
+            row = self.load_ids.index(load_id)
+        elif len(self.load_ids) < self.meta["n_cases"]:
+            row = len(self.load_ids)
+            self.load_ids.append(load_id)
+        else:
+            raise IndexError(f"Result store is full, it has room for {self.meta['n_cases']} load cases")
+        values = {"displacements": displacements, "reactions": reactions,
+                  "end_forces": end_forces, "section_forces": section_forces}
+        for name, value in values.items():
+            if value is not None:
+                column = self.column(name)
+                column[row] = value
+                column.flush()
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(self.meta, f)
+
+    def write_stations(self, x: np.ndarray) -> None:
+        """
+        Writes (n_elems, n_stations) array of station distances from elements' first nodes
+        """
+        stations = np.load(os.path.join(self.path, "stations.npy"), mmap_mode="r+")
+        stations[:] = x
+        stations.flush()
+        self.stations = np.load(os.path.join(self.path, "stations.npy"), mmap_mode="r")
+
+    def displacements(self, load_id: int = None, node_id: int = None) -> np.ndarray:
+        """
+        Returns nodal displacements, (n_cases, n_nodes, 6) array if neither id is given
+        """
+        return self._select("displacements", "node_ids", load_id, node_id)
+
+    def reactions(self, load_id: int = None, node_id: int = None) -> np.ndarray:
+        """
+        Returns support reactions, (n_cases, n_supports, 6) array if neither id is given
+        """
+        return self._select("reactions", "support_node_ids", load_id, node_id)
+
+    def end_forces(self, load_id: int = None, elem_id: int = None) -> np.ndarray:
+        """
+        Returns elements' local end forces, (n_cases, n_elems, 12) array if neither id is given
+        """
+        return self._select("end_forces", "elem_ids", load_id, elem_id)
+
+    def section_forces(self, load_id: int = None, elem_id: int = None) -> np.ndarray:
+        """
+        Returns section forces N, V_y, V_z, M_T, M_y, M_z at stations,
+        (n_cases, n_elems, n_stations, 6) array if neither id is given
+        """
+        return self._select("section_forces", "elem_ids", load_id, elem_id)
+
+    def envelope(self, elem_id: int, load_ids: list[int] = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns minimum and maximum section forces of an element over load cases
+
+        :return: two (n_stations, 6) arrays
+        """
+        forces = self.section_forces(elem_id=elem_id)
+        if load_ids is not None:
+            forces = forces[self.index("load_ids", load_ids)]
+        return forces.min(axis=0), forces.max(axis=0)
+
+    def _select(self, column: str, index: str, load_id: int | None, item_id: int | None) -> np.ndarray:
+        data = self.column(column)
+        if load_id is not None:
+            data = data[self.index("load_ids", load_id)]
+            if item_id is not None:
+                data = data[self.index(index, item_id)]
+        elif item_id is not None:
+            data = data[:, self.index(index, item_id)]
+        return data
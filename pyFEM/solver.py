@@ -1,20 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable
+
 import numpy as np
 from scipy import sparse
+from scipy.sparse import linalg as splinalg
+
+
+@dataclass
+class ConvergenceInfo:
+    """
+    Convergence statistics of an iterative solution, one entry per load vector
+    """
+    iterations: list[int]
+    residual_norms: list[float]
+    converged: bool
+    preconditioner: str
+
+
+@dataclass
+class StepInfo:
+    """
+    Convergence statistics of one load step of an incremental analysis
+    """
+    load_factor: float
+    iterations: int = 0
+    residual_norms: list[float] = field(default_factory=list)
+    converged: bool = False
 
 
-def static_load_analysis(K: np.array, F: np.array, B: np.array, ndof: int) -> tuple[np.array, np.array]:
+def static_load_analysis(K: sparse.spmatrix, F: np.array, B: sparse.spmatrix, ndof: int,
+                         b: np.array = None) -> tuple[np.array, np.array]:
     """
-    Perform a static load analysis
+    Perform a static load analysis using Lagrange multipliers
     Returns:
         :U: global vector of nodal displacements
-        :F_react: reaction loads
+        :F_react: reaction loads, one per constraint row
     """
-
-    b = np.zeros((B.shape[0], 1))
+    F = np.asarray(F, dtype=np.float64).ravel()
+    if b is None:
+        b = np.zeros(B.shape[0])
 
     # Assemble the system of equations
-    n_lr = B.shape[0]  # Number of linear constraints
-    Z = np.zeros((n_lr, n_lr))
     # A_system = np.block([
     #     [K, B.T],
     #     [B, Z]
@@ -45,21 +73,623 @@ def static_load_analysis(K: np.array, F: np.array, B: np.array, ndof: int) -> tu
     #     [ndof, ]
     # )
     return np.split(
-        sparse.linalg.spsolve(
-            sparse.csr_matrix(np.block([
+        splinalg.spsolve(
+            sparse.bmat([
                 [K, B.T],
-                [B, Z]
-            ])),
-            np.block([
-                [F],  # + F_accel
-                [b]
-            ])
+                [B, None]
+            ], format="csc"),
+            np.concatenate((F, b))
         ),
         [ndof, ]
     )
     # return np.split(np.linalg.solve(A_system, x_system), [ndof, ])
 
 
+def free_dofs(ndof: int, fixed_dofs: np.ndarray) -> np.ndarray:
+    """
+    Returns boolean mask of dofs that are not restrained
+    """
+    free = np.ones(ndof, dtype=bool)
+    free[fixed_dofs] = False
+    return free
+
+
+def factorize(K: sparse.csr_matrix, fixed_dofs: np.ndarray) -> splinalg.SuperLU:
+    """
+    Computes sparse LU factorization of the stiffness matrix with restrained dofs eliminated
+    """
+    free = free_dofs(K.shape[0], fixed_dofs)
+    return splinalg.splu(K[free][:, free].tocsc())
+
+
+def reduced_static_load_analysis(K: sparse.csr_matrix, F: np.ndarray,
+                                 fixed_dofs: np.ndarray,
+                                 b: np.ndarray = None,
+                                 lu: splinalg.SuperLU = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Perform a static load analysis by eliminating the restrained dofs
+    from the sparse stiffness matrix. The matrix is never densified.
+
+    F may hold one load vector per column, all columns are solved
+    with the same factorization. Pass lu from factorize to reuse it.
+    Returns:
+        :U: global vector of nodal displacements
+        :F_react: global vector of residual forces F - K U, non-zero only at restrained dofs
+    """
+    ndof = K.shape[0]
+    F = np.asarray(F, dtype=np.float64).reshape((ndof, -1))
+    free = free_dofs(ndof, fixed_dofs)
+    if lu is None:
+        lu = factorize(K, fixed_dofs)
+
+    U = np.zeros_like(F)
+    rhs = F[free]
+    if b is not None and np.any(b):
+        U[fixed_dofs] = np.reshape(b, (-1, 1))
+        rhs = rhs - K[free][:, fixed_dofs] @ U[fixed_dofs]
+    U[free] = lu.solve(rhs)
+    F_react = F - K @ U
+
+    if F.shape[1] == 1:
+        return U.ravel(), F_react.ravel()
+    return U, F_react
+
+
+def jacobi_preconditioner(K_ff: sparse.csr_matrix) -> splinalg.LinearOperator:
+    """
+    Returns inverse of the diagonal of K_ff as linear operator
+    """
+    inv_diag = 1.0 / K_ff.diagonal()
+    return splinalg.LinearOperator(K_ff.shape, matvec=lambda r: inv_diag * r.ravel(), dtype=np.float64)
+
+
+def block_jacobi_preconditioner(K_ff: sparse.csr_matrix, free: np.ndarray) -> splinalg.LinearOperator:
+    """
+    Returns inverse of the 6x6 nodal diagonal blocks of K_ff as linear operator.
+    Restrained dofs are filled with identity so that every nodal block is invertible.
+    """
+    dofs = np.flatnonzero(free)
+    n_nodes = len(free) // 6
+    K_coo = K_ff.tocoo()
+    rows, cols = dofs[K_coo.row], dofs[K_coo.col]
+    same_node = rows // 6 == cols // 6
+    blocks = np.zeros((n_nodes, 6, 6))
+    blocks[:, np.arange(6), np.arange(6)] = ~free.reshape((n_nodes, 6))
+    np.add.at(blocks, (rows[same_node] // 6, rows[same_node] % 6, cols[same_node] % 6), K_coo.data[same_node])
+    inv_blocks = np.linalg.inv(blocks)
+
+    def matvec(r: np.ndarray) -> np.ndarray:
+        r_full = np.zeros(len(free))
+        r_full[free] = r.ravel()
+        return np.einsum('nij,nj->ni', inv_blocks, r_full.reshape((n_nodes, 6))).ravel()[free]
+
+    return splinalg.LinearOperator(K_ff.shape, matvec=matvec, dtype=np.float64)
+
+
+def ilu_preconditioner(K_ff: sparse.csr_matrix, drop_tol: float = 1e-5,
+                       fill_factor: float = 30) -> splinalg.LinearOperator:
+    """
+    Returns incomplete LU factorization of K_ff as linear operator.
+    scipy has no incomplete Cholesky, so the threshold ILU of SuperLU is used instead.
+    The matrix is scaled symmetrically to unit diagonal and factorized in symmetric mode
+    without pivoting so that the preconditioner stays close to symmetric.
+    """
+    scale = sparse.diags(1.0 / np.sqrt(K_ff.diagonal()))
+    ilu = splinalg.spilu((scale @ K_ff @ scale).tocsc(), drop_tol=drop_tol, fill_factor=fill_factor,
+                         permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                         options={"SymmetricMode": True})
+    return splinalg.LinearOperator(K_ff.shape, matvec=lambda r: scale @ ilu.solve(scale @ r.ravel()),
+                                   dtype=np.float64)
+
+
+PRECONDITIONERS = ("none", "jacobi", "block_jacobi", "ilu")
+
+
+def iterative_static_load_analysis(K: sparse.csr_matrix, F: np.ndarray,
+                                   fixed_dofs: np.ndarray,
+                                   b: np.ndarray = None,
+                                   preconditioner: str = "block_jacobi",
+                                   rtol: float = 1e-8,
+                                   maxiter: int = None) -> tuple[np.ndarray, np.ndarray, ConvergenceInfo]:
+    """
+    Perform a static load analysis with preconditioned conjugate gradient method
+    on the reduced symmetric positive definite system.
+
+    :param preconditioner: one of "none", "jacobi", "block_jacobi" or "ilu". Incomplete
+        Cholesky is not offered, "ilu" is the threshold ILU of SuperLU in symmetric mode,
+        see ilu_preconditioner
+    :param rtol: relative tolerance of the residual norm
+    :param maxiter: maximum number of iterations per load vector
+    Returns:
+        :U: global vector of nodal displacements
+        :F_react: global vector of residual forces F - K U, non-zero only at restrained dofs
+        :info: convergence statistics
+    """
+    ndof = K.shape[0]
+    F = np.asarray(F, dtype=np.float64).reshape((ndof, -1))
+    free = free_dofs(ndof, fixed_dofs)
+    K_f = K[free]
+    K_ff = K_f[:, free].tocsr()
+
+    if preconditioner == "none":
+        M = None
+    elif preconditioner == "jacobi":
+        M = jacobi_preconditioner(K_ff)
+    elif preconditioner == "block_jacobi":
+        M = block_jacobi_preconditioner(K_ff, free)
+    elif preconditioner == "ilu":
+        M = ilu_preconditioner(K_ff)
+    elif preconditioner in ("ic", "incomplete_cholesky"):
+        raise ValueError("Incomplete Cholesky preconditioner is not available, use \"ilu\"")
+    else:
+        raise ValueError(f"Unknown preconditioner: {preconditioner}")
+
+    U = np.zeros_like(F)
+    rhs = F[free]
+    if b is not None and np.any(b):
+        U[fixed_dofs] = np.reshape(b, (-1, 1))
+        rhs = rhs - K_f[:, fixed_dofs] @ U[fixed_dofs]
+
+    info = ConvergenceInfo([], [], True, preconditioner)
+    for i in range(F.shape[1]):
+        iterations = [0]
+
+        def count(_):
+            iterations[0] += 1
+
+        U[free, i], status = splinalg.cg(K_ff, rhs[:, i], rtol=rtol, maxiter=maxiter, M=M, callback=count)
+        rhs_norm = np.linalg.norm(rhs[:, i])
+        residual = np.linalg.norm(rhs[:, i] - K_ff @ U[free, i])
+        info.iterations.append(iterations[0])
+        info.residual_norms.append(residual / rhs_norm if rhs_norm else residual)
+        info.converged = info.converged and status == 0
+    F_react = F - K @ U
+
+    if F.shape[1] == 1:
+        return U.ravel(), F_react.ravel(), info
+    return U, F_react, info
+
+
+def buckling_analysis(K: sparse.csr_matrix, KG: sparse.csr_matrix, fixed_dofs: np.ndarray,
+                      n_modes: int = 6,
+                      lu: splinalg.SuperLU = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Solves the lowest positive critical load factors of (K + lambda KG) phi = 0.
+    The problem is solved as -KG phi = (1 / lambda) K phi, so the eigensolver works
+    with the factorization of K, i.e. shift-invert about zero load factor.
+
+    :param KG: geometric stiffness matrix of the reference loading
+    :param lu: factorization of K from factorize, reused if given
+    Returns:
+        :load_factors: (n_modes,) critical load factors in ascending order, inf for
+            modes that the reference loading does not compress
+        :modes: (ndof, n_modes) buckling mode shapes normalized to unit maximum,
+            zero where the load factor is inf
+    """
+    ndof = K.shape[0]
+    free = free_dofs(ndof, fixed_dofs)
+    if lu is None:
+        lu = factorize(K, fixed_dofs)
+    K_ff = K[free][:, free]
+    KG_ff = KG[free][:, free]
+    n = K_ff.shape[0]
+    n_modes = min(n_modes, n - 1)
+    modes = np.zeros((ndof, n_modes))
+    # Without axial forces the reference loading cannot cause buckling
+    if KG_ff.nnz == 0 or abs(KG_ff).max() <= np.finfo(np.float64).eps * abs(K_ff).max():
+        return np.full(n_modes, np.inf), modes
+
+    K_inv = splinalg.LinearOperator((n, n), matvec=lambda x: lu.solve(np.asarray(x, dtype=np.float64).ravel()),
+                                    dtype=np.float64)
+    mu, phi = splinalg.eigsh(-KG_ff, k=n_modes, M=K_ff, Minv=K_inv, which="LA")
+
+    # Only compressive load factors, i.e. positive mu, are critical
+    order = np.argsort(-mu)
+    mu, phi = mu[order], phi[:, order]
+    compressive = mu > 0
+    load_factors = np.full(n_modes, np.inf)
+    load_factors[compressive] = 1.0 / mu[compressive]
+    phi = phi[:, compressive]
+    modes[free[:, None] & compressive] = (phi / np.abs(phi).max(axis=0)).ravel()
+    return load_factors, modes
+
+
+def modal_analysis(K: sparse.csr_matrix, M: sparse.csr_matrix, fixed_dofs: np.ndarray,
+                   n_modes: int = 6, sigma: float = 0.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solves the lowest natural vibration modes of K phi = omega^2 M phi with shift-invert
+    Lanczos iteration about sigma. Restrained dofs are eliminated.
+
+    :param M: mass matrix, may be diagonal
+    :param sigma: shift of eigenvalues omega^2, modes nearest to it are solved
+    Returns:
+        :eigenvalues: (n_modes,) squared angular frequencies in ascending order
+        :modes: (ndof, n_modes) mass normalized mode shapes
+        :participating_mass_ratios: (n_modes, 3) ratios of effective modal mass to
+            the total unrestrained mass in global X, Y and Z -directions
+    """
+    ndof = K.shape[0]
+    free = free_dofs(ndof, fixed_dofs)
+    K_ff = K[free][:, free].tocsc()
+    M_ff = M[free][:, free].tocsc()
+    n_modes = min(n_modes, K_ff.shape[0] - 1)
+    eigenvalues, phi = splinalg.eigsh(K_ff, k=n_modes, M=M_ff, sigma=sigma, which="LM")
+    order = np.argsort(eigenvalues)
+    eigenvalues, phi = eigenvalues[order], phi[:, order]
+    phi /= np.sqrt(np.einsum('ij,ij->j', phi, M_ff @ phi))
+
+    # Rigid body translations of free dofs
+    r = np.zeros((ndof, 3))
+    r[np.arange(ndof).reshape((-1, 6))[:, :3].ravel(), np.tile(np.arange(3), ndof // 6)] = 1.0
+    r = r[free]
+    Mr = M_ff @ r
+    total = np.einsum('ij,ij->j', r, Mr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(total > 0, (phi.T @ Mr) ** 2 / total, 0.0)
+
+    modes = np.zeros((ndof, n_modes))
+    modes[free] = phi
+    return eigenvalues, modes, ratios
+
+
+def rayleigh_coefficients(omega1: float, omega2: float, zeta1: float,
+                          zeta2: float = None) -> tuple[float, float]:
+    """
+    Returns coefficients a0, a1 of Rayleigh damping C = a0 M + a1 K that give
+    damping ratios zeta1 and zeta2 at angular frequencies omega1 and omega2
+    """
+    if zeta2 is None:
+        zeta2 = zeta1
+    a0, a1 = np.linalg.solve([[1 / (2 * omega1), omega1 / 2],
+                              [1 / (2 * omega2), omega2 / 2]], [zeta1, zeta2])
+    return float(a0), float(a1)
+
+
+def time_history_analysis(K: sparse.csr_matrix, M: sparse.csr_matrix, F: np.ndarray,
+                          factors: np.ndarray, dt: float, fixed_dofs: np.ndarray,
+                          C: sparse.csr_matrix = None, alpha: float = 0.0,
+                          beta: float = None, gamma: float = None,
+                          U0: np.ndarray = None, V0: np.ndarray = None,
+                          callbacks: list[Callable] = ()) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Integrates M A + C V + K U = F(t) in time with HHT-alpha method, which reduces to
+    Newmark-beta method when alpha = 0. The effective stiffness matrix is factorized once.
+    Restrained dofs are held at zero.
+
+    :param F: (ndof,) reference load vector or (ndof, n_loads) array of reference load vectors
+    :param factors: (n_steps + 1,) or (n_steps + 1, n_loads) array of load factors at time steps,
+        so that F(t_n) = F @ factors[n]
+    :param C: damping matrix, e.g. Rayleigh damping a0 M + a1 K
+    :param alpha: HHT-alpha parameter, -1/3 <= alpha <= 0
+    :param beta: Newmark parameter, defaults to (1 - alpha)^2 / 4
+    :param gamma: Newmark parameter, defaults to 1/2 - alpha
+    :param U0: initial displacements
+    :param V0: initial velocities
+    :param callbacks: functions called as callback(n, t, U, V, A, R) at every time step
+        including the initial state, where R are the reactions F - M A - C V - K U
+        at restrained dofs
+    Returns:
+        :U: global vector of displacements at the last time step
+        :V: global vector of velocities at the last time step
+        :A: global vector of accelerations at the last time step
+    """
+    if beta is None:
+        beta = (1 - alpha) ** 2 / 4
+    if gamma is None:
+        gamma = 0.5 - alpha
+    ndof = K.shape[0]
+    F = np.asarray(F, dtype=np.float64).reshape((ndof, -1))
+    factors = np.asarray(factors, dtype=np.float64).reshape((len(factors), -1))
+    free = free_dofs(ndof, fixed_dofs)
+    K_ff = K[free][:, free]
+    M_ff = M[free][:, free]
+    C_ff = C[free][:, free] if C is not None else sparse.csr_matrix(K_ff.shape)
+    # Rows of restrained dofs for reactions
+    K_r, M_r = K[fixed_dofs][:, free], M[fixed_dofs][:, free]
+    C_r = C[fixed_dofs][:, free] if C is not None else sparse.csr_matrix(K_r.shape)
+    F_f, F_r = F[free], F[fixed_dofs]
+
+    U, V, A = (np.zeros(ndof) for _ in range(3))
+    u = np.zeros(K_ff.shape[0]) if U0 is None else np.asarray(U0, dtype=np.float64)[free]
+    v = np.zeros(K_ff.shape[0]) if V0 is None else np.asarray(V0, dtype=np.float64)[free]
+    f = F_f @ factors[0]
+    a = splinalg.splu(M_ff.tocsc()).solve(f - C_ff @ v - K_ff @ u)
+
+    def report(n):
+        U[free], V[free], A[free] = u, v, a
+        R = F_r @ factors[n] - M_r @ a - C_r @ v - K_r @ u
+        for callback in callbacks:
+            callback(n, n * dt, U, V, A, R)
+
+    report(0)
+    c0 = 1 / (beta * dt ** 2)
+    c1 = gamma / (beta * dt)
+    lu = splinalg.splu((c0 * M_ff + (1 + alpha) * c1 * C_ff + (1 + alpha) * K_ff).tocsc())
+    for n in range(1, len(factors)):
+        f_next = F_f @ factors[n]
+        rhs = ((1 + alpha) * f_next - alpha * f + alpha * (K_ff @ u + C_ff @ v)
+               + M_ff @ (c0 * u + v / (beta * dt) + (1 / (2 * beta) - 1) * a)
+               + (1 + alpha) * (C_ff @ (c1 * u - (1 - gamma / beta) * v
+                                        - dt * (1 - gamma / (2 * beta)) * a)))
+        u_next = lu.solve(rhs)
+        a_next = c0 * (u_next - u) - v / (beta * dt) - (1 / (2 * beta) - 1) * a
+        v = v + dt * ((1 - gamma) * a + gamma * a_next)
+        u, a, f = u_next, a_next, f_next
+        report(n)
+    return U, V, A
+
+
+def _reference_norm(F: np.ndarray, f_int: np.ndarray) -> float:
+    """
+    Returns norm of loads, or of internal forces if the structure is loaded only by
+    prescribed displacements
+    """
+    norm = np.linalg.norm(F)
+    return norm if norm > 0 else max(np.linalg.norm(f_int), 1e-30)
+
+
+def _newton_iterations(tangent: Callable, internal_forces: Callable, F: np.ndarray,
+                       U: np.ndarray, load_factor: float, free: np.ndarray,
+                       fixed_dofs: np.ndarray, b: np.ndarray, modified: bool,
+                       tol: float, max_iter: int) -> StepInfo:
+    """
+    Iterates U in place to equilibrium at given load factor
+    """
+    info = StepInfo(load_factor)
+    U[fixed_dofs] = load_factor * b
+    lu = None
+    while True:
+        f_int = internal_forces(U)
+        r = load_factor * F[free] - f_int[free]
+        norm = np.linalg.norm(r)
+        info.residual_norms.append(float(norm))
+        if norm <= tol * _reference_norm(load_factor * F, f_int):
+            info.converged = True
+            return info
+        if info.iterations == max_iter or not np.isfinite(norm):
+            return info
+        if lu is None or not modified:
+            lu = factorize(tangent(U), fixed_dofs)
+        U[free] += lu.solve(r)
+        info.iterations += 1
+
+
+def _arc_length_iterations(tangent: Callable, internal_forces: Callable, F: np.ndarray,
+                           U: np.ndarray, load_factor: float, arc_length: float,
+                           previous: np.ndarray, free: np.ndarray, fixed_dofs: np.ndarray,
+                           b: np.ndarray, modified: bool, tol: float,
+                           max_iter: int) -> tuple[StepInfo, np.ndarray]:
+    """
+    Performs one step of Crisfield's cylindrical arc-length method, U is updated in place.
+    Returns statistics of the step and its displacement increment of free dofs.
+    """
+
+    def reference(K_t):
+        # Tangent response to a unit increment of load factor, including
+        # the increment of prescribed displacements
+        lu = factorize(K_t, fixed_dofs)
+        q = F[free] - K_t[free][:, fixed_dofs] @ b if len(b) else F[free]
+        return lu, lu.solve(q)
+
+    lu, dU_q = reference(tangent(U))
+    d_lambda = arc_length / np.linalg.norm(dU_q)
+    if previous is not None and previous @ dU_q < 0:
+        d_lambda = -d_lambda
+    DU = d_lambda * dU_q
+    U_0 = U.copy()
+    U[free] += DU
+    info = StepInfo(float(load_factor + d_lambda))
+
+    while True:
+        U[fixed_dofs] = info.load_factor * b
+        f_int = internal_forces(U)
+        r = info.load_factor * F[free] - f_int[free]
+        norm = np.linalg.norm(r)
+        info.residual_norms.append(float(norm))
+        if norm <= tol * _reference_norm(info.load_factor * F, f_int):
+            info.converged = True
+            return info, DU
+        if info.iterations == max_iter or not np.isfinite(norm):
+            break
+        if not modified:
+            lu, dU_q = reference(tangent(U))
+        dU_r = lu.solve(r)
+        # Load factor correction keeps the increment on the arc |DU| = arc_length
+        a = DU + dU_r
+        a1 = dU_q @ dU_q
+        a2 = 2 * dU_q @ a
+        a3 = a @ a - arc_length ** 2
+        disc = a2 ** 2 - 4 * a1 * a3
+        if disc < 0:
+            break
+        roots = (-a2 + np.array([1.0, -1.0]) * np.sqrt(disc)) / (2 * a1)
+        # Root that turns the increment least
+        root = roots[np.argmax([(a + root * dU_q) @ DU for root in roots])]
+        DU = a + root * dU_q
+        U[free] = U_0[free] + DU
+        info.load_factor += float(root)
+        info.iterations += 1
+
+    U[:] = U_0
+    return info, DU
+
+
+def nonlinear_static_analysis(tangent: Callable[[np.ndarray], sparse.csr_matrix],
+                              internal_forces: Callable[[np.ndarray], np.ndarray],
+                              F: np.ndarray, fixed_dofs: np.ndarray, b: np.ndarray = None,
+                              n_steps: int = 10, modified: bool = False,
+                              arc_length: bool = False, tol: float = 1e-6,
+                              max_iter: int = 25, max_cuts: int = 5,
+                              max_steps: int = None) -> tuple[np.ndarray, np.ndarray, list[StepInfo]]:
+    """
+    Solves equilibrium f_int(U) = lambda F incrementally with the Newton-Raphson method.
+    Load factor lambda is increased from 0 to 1 in n_steps equal steps, or along
+    equilibrium path with cylindrical arc-length method. Failed steps are bisected.
+
+    :param tangent: function returning tangent stiffness matrix at displacements U
+    :param internal_forces: function returning global vector of internal forces at displacements U
+    :param F: global reference load vector
+    :param b: prescribed displacements of restrained dofs, scaled by load factor
+    :param modified: factorize tangent only once per step
+    :param arc_length: control steps by arc-length instead of load factor,
+        the last step is solved with load control at lambda = 1
+    :param tol: residual norm tolerance relative to norm of loads
+    :param max_steps: maximum number of arc-length steps, defaults to 10 * n_steps
+    Returns:
+        :U: global vector of nodal displacements
+        :F_react: global vector of residual forces lambda F - f_int(U)
+        :steps: convergence statistics of steps, the last one is
+            not converged if the analysis failed
+    """
+    ndof = len(F)
+    F = np.asarray(F, dtype=np.float64).ravel()
+    free = free_dofs(ndof, fixed_dofs)
+    b = np.zeros(len(fixed_dofs)) if b is None else np.asarray(b, dtype=np.float64)
+    if max_steps is None:
+        max_steps = 10 * n_steps
+
+    U = np.zeros(ndof)
+    load_factor = 0.0
+    steps = []
+    cuts = 0
+    if arc_length:
+        arc = None
+        previous = None
+        while len(steps) < max_steps:
+            if arc is None:
+                # Initial arc length equals the linear increment of the first load step
+                K_t = tangent(U)
+                q = F[free] - K_t[free][:, fixed_dofs] @ b if len(b) else F[free]
+                arc = np.linalg.norm(factorize(K_t, fixed_dofs).solve(q)) / n_steps
+            U_0 = U.copy()
+            info, DU = _arc_length_iterations(tangent, internal_forces, F, U, load_factor,
+                                              arc, previous, free, fixed_dofs, b,
+                                              modified, tol, max_iter)
+            if not info.converged:
+                steps.append(info)
+                if cuts == max_cuts:
+                    break
+                arc /= 2
+                cuts += 1
+                continue
+            if info.load_factor >= 1.0:
+                # Return to the last converged state and finish with load control
+                U[:] = U_0
+                info = _newton_iterations(tangent, internal_forces, F, U, 1.0, free,
+                                          fixed_dofs, b, modified, tol, max_iter)
+                steps.append(info)
+                load_factor = 1.0
+                break
+            steps.append(info)
+            load_factor = info.load_factor
+            previous = DU
+            cuts = 0
+    else:
+        increment = 1.0 / n_steps
+        while load_factor < 1.0:
+            target = min(load_factor + increment, 1.0)
+            U_0 = U.copy()
+            info = _newton_iterations(tangent, internal_forces, F, U, target, free,
+                                      fixed_dofs, b, modified, tol, max_iter)
+            steps.append(info)
+            if info.converged:
+                load_factor = target
+                continue
+            U[:] = U_0
+            if cuts == max_cuts:
+                break
+            increment /= 2
+            cuts += 1
+
+    U[fixed_dofs] = load_factor * b
+    F_react = load_factor * F - internal_forces(U)
+    return U, F_react, steps
+
+
+def constraint_matrix(fixed_dofs: np.ndarray, ndof: int) -> sparse.csr_matrix:
+    """
+    Assembles the row-compact constraint matrix B, one row per restrained dof
+    """
+    n_lr = len(fixed_dofs)
+    return sparse.csr_matrix(
+        (np.ones(n_lr),
+         (np.arange(n_lr),
+          fixed_dofs)
+         ),
+        shape=(n_lr, ndof),
+        dtype=np.float64)
+
+
+class AssemblyPlan:
+    """
+    Compiled assembly of sparse matrices with a fixed sparsity pattern. The CSR structure
+    and the position of every COO triplet in the CSR data array are computed once per
+    topology, after which matrices are assembled from new values with one scatter-add,
+    without sorting or deduplicating indices again.
+    """
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, ndof: int):
+        """
+        :param rows: row indices of triplets
+        :param cols: column indices of triplets
+        :param ndof: number of rows and columns
+        """
+        keys = np.asarray(rows, dtype=np.int64).ravel() * ndof + np.asarray(cols, dtype=np.int64).ravel()
+        # Element triplets are runs of nearly sorted keys, which stable sort exploits
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        first = np.empty(len(keys), dtype=bool)
+        first[:1] = True
+        np.not_equal(keys[1:], keys[:-1], out=first[1:])
+        scatter = np.empty(len(keys), dtype=np.int64)
+        scatter[order] = np.cumsum(first) - 1
+        keys = keys[first]
+        self.ndof = ndof
+        # (N, n) element dof indices, if the plan was created from them
+        self.element_dofs = None
+        self.indices = (keys % ndof).astype(np.int32 if ndof < 2 ** 31 else np.int64)
+        self.indptr = np.searchsorted(keys // ndof, np.arange(ndof + 1)).astype(self.indices.dtype)
+        # Position of each triplet in the data array
+        self.scatter = scatter
+
+    @classmethod
+    def from_element_dofs(cls, idxs: np.ndarray, ndof: int) -> AssemblyPlan:
+        """
+        Creates plan of assembling (N, n, n) element matrices with (N, n) global dof indices
+        """
+        n = idxs.shape[1]
+        plan = cls(np.repeat(idxs, n, axis=1), np.tile(idxs, (1, n)), ndof)
+        plan.element_dofs = idxs
+        return plan
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    def values(self, data: np.ndarray) -> np.ndarray:
+        """
+        Sums triplet values to CSR data array
+        """
+        return np.bincount(self.scatter, weights=np.ravel(data), minlength=self.nnz)
+
+    def assemble(self, data: np.ndarray) -> sparse.csr_matrix:
+        """
+        Assembles a new matrix from triplet values. The matrix shares index arrays with the
+        plan, so its sparsity structure must not be modified in place.
+        """
+        matrix = sparse.csr_matrix((self.values(data), self.indices, self.indptr),
+                                   shape=(self.ndof, self.ndof), copy=False)
+        matrix.has_sorted_indices = True
+        return matrix
+
+    def refresh(self, matrix: sparse.csr_matrix, data: np.ndarray) -> sparse.csr_matrix:
+        """
+        Replaces values of a matrix assembled with this plan in place
+        """
+        matrix.data[:] = self.values(data)
+        return matrix
+
+
 def global_stiffness_matrix(rows: np.array, cols: np.array, data_K: np.array) -> np.array:
     """
 
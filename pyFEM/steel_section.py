@@ -1,9 +1,28 @@
+import pyFEM.catalogs.sections.i_sections as i_sections
 from pyFEM.isection import ISection
 
 
 class SteelSection:
     # IPE dimensions
     # https://eurocodeapplied.com/design/en1993/ipe-hea-heb-hem-design-properties
-    IPE80: 'ISection' = ISection("IPE", h=80, b=46, tw=3.8, tf=5.2, r=5)
-    IPE100: 'ISection' = ISection("IPE", h=100, b=55, tw=4.1, tf=5.7, r=7)
-    IPE120: 'ISection' = ISection("IPE", h=120, b=64, tw=4.4, tf=6.3, r=7)
+    IPE80: 'ISection' = ISection("IPE", h=80, b=46, tw=3.8, tf=5.2, r=5, designation="IPE 80")
+    IPE100: 'ISection' = ISection("IPE", h=100, b=55, tw=4.1, tf=5.7, r=7, designation="IPE 100")
+    IPE120: 'ISection' = ISection("IPE", h=120, b=64, tw=4.4, tf=6.3, r=7, designation="IPE 120")
+
+    @staticmethod
+    def get(name: str) -> ISection:
+        """
+        Returns catalog section by name, e.g. "HEA300" or "HEA 300"
+        """
+        return getattr(SteelSection, i_sections.TABLE["name"][i_sections.index(name)])
+
+
+# Rest of IPE, HEA, HEB and HEM sections of the catalog table, all catalog sections
+# read their properties from the table
+for _sect_type, _sizes in i_sections.DIMENSIONS.items():
+    for _size, (_h, _b, _tw, _tf, _r) in _sizes.items():
+        if not hasattr(SteelSection, f"{_sect_type}{_size}"):
+            setattr(SteelSection, f"{_sect_type}{_size}", ISection(_sect_type, h=_h, b=_b, tw=_tw, tf=_tf, r=_r,
+                                                                   designation=f"{_sect_type} {_size}"))
+        getattr(SteelSection, f"{_sect_type}{_size}").set_properties(i_sections.row(f"{_sect_type}{_size}"))
+del _sect_type, _sizes, _size, _h, _b, _tw, _tf, _r
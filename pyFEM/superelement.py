@@ -0,0 +1,202 @@
+"""
+Superelements by static condensation.
+
+A sub-model is condensed onto its boundary nodes: with boundary dofs b and interior
+dofs i, the condensed stiffness and load vector are
+
+    K_c = K_bb - K_bi K_ii^-1 K_ib,    F_c = F_b - K_bi K_ii^-1 F_i
+
+and interior displacements are recovered from the boundary displacements as
+
+    u_i = K_ii^-1 F_i - K_ii^-1 K_ib u_b
+
+Mass is condensed with the same transformation (Guyan reduction), which assumes that
+interior inertia follows the static deflection shape, so the condensed mass matrix is
+exact for the boundary dofs only at zero frequency:
+
+    M_c = T^T M T,    T = [I; -K_ii^-1 K_ib]
+
+The condensed matrices are computed once per Superelement and shared by all its
+instances, which place the superelement in a parent model with a rotation and
+connect its boundary to the parent's nodes.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+import pyFEM.solver as solver
+from pyFEM.node import Node
+
+
+def _block_rotation(rotation: np.ndarray, n_nodes: int) -> np.ndarray:
+    """
+    Returns block diagonal matrix that rotates translations and rotations of n_nodes
+    """
+    return np.kron(np.eye(2 * n_nodes), rotation)
+
+
+class Superelement:
+    """
+    Sub-model condensed onto its boundary nodes
+    """
+
+    def __init__(self, model, boundary_nodes: list[Node]):
+        """
+        :param model: sub-model, its supports restrain interior dofs and its loads
+            are condensed to the boundary
+        :param boundary_nodes: sub-model's nodes that connect to the parent model,
+            their order defines the order of superelement's dofs
+        """
+        self.model = model
+        self.boundary_nodes = list(boundary_nodes)
+        boundary_ids = [node.node_id for node in self.boundary_nodes]
+        if any(supp.node.node_id in boundary_ids for supp in model.support_list):
+            raise ValueError("Boundary nodes must not be supported in the sub-model")
+
+        offsets = model.dof_offsets
+        self.boundary_dofs = (offsets[boundary_ids][:, None] + np.arange(6)).ravel()
+        interior = np.ones(model.dofs, dtype=bool)
+        interior[self.boundary_dofs] = False
+        interior[model.fixed_dofs] = False
+        self.interior_dofs = np.flatnonzero(interior)
+
+        K = model.global_stiffness_matrix
+        F = model.global_load_vector.ravel()
+        b, i = self.boundary_dofs, self.interior_dofs
+        K_ib = K[i][:, b].toarray()
+        self._lu = solver.factorize(K, np.flatnonzero(~interior))
+        # Interior displacements due to unit boundary displacements and due to loads
+        self.transformation = self._lu.solve(K_ib)
+        self.interior_displacements = self._lu.solve(F[i])
+        K_c = K[b][:, b].toarray() - K_ib.T @ self.transformation
+        self.stiffness_matrix = 0.5 * (K_c + K_c.T)
+        self.load_vector = F[b] - K_ib.T @ self.interior_displacements
+        self._mass_matrices = {}
+
+    def mass_matrix(self, lumped: bool = False) -> np.ndarray:
+        """
+        Returns condensed mass matrix of sub-model's consistent or lumped mass matrix.
+        The condensed matrix is full even if the sub-model's mass matrix is lumped.
+        """
+        if lumped not in self._mass_matrices:
+            M = self.model.mass_matrix(lumped)
+            b, i = self.boundary_dofs, self.interior_dofs
+            X = self.transformation
+            M_ib = M[i][:, b].toarray()
+            M_c = M[b][:, b].toarray() - M_ib.T @ X - X.T @ M_ib + X.T @ (M[i][:, i] @ X)
+            self._mass_matrices[lumped] = 0.5 * (M_c + M_c.T)
+        return self._mass_matrices[lumped]
+
+    @property
+    def boundary_coordinates(self) -> np.ndarray:
+        """
+        Returns (n_boundary, 3) array of boundary nodes' coordinates in sub-model
+        """
+        return np.array([(node.x, node.y, node.z) for node in self.boundary_nodes],
+                        dtype=np.float64).reshape((-1, 3))
+
+    def place(self, origin=(0, 0, 0), rotation: np.ndarray = None,
+              nodes: list[Node | None] = None, load_factor: float = 1.0) -> SuperelementInstance:
+        """
+        Creates an instance whose boundary nodes are at origin + rotation @ coordinates
+
+        :param origin: position of sub-model's origin in parent model
+        :param rotation: (3, 3) rotation matrix from sub-model axes to parent axes
+        :param nodes: parent model's nodes to connect to, one per boundary node,
+            new nodes are created for None entries
+        :param load_factor: factor of sub-model's loads
+        """
+        rotation = np.eye(3) if rotation is None else np.asarray(rotation, dtype=np.float64)
+        coordinates = np.asarray(origin, dtype=np.float64) + self.boundary_coordinates @ rotation.T
+        if nodes is None:
+            nodes = [None] * len(self.boundary_nodes)
+        nodes = [Node(*xyz) if node is None else node for node, xyz in zip(nodes, coordinates.tolist())]
+        return SuperelementInstance(self, nodes, rotation, load_factor)
+
+    def displacements(self, u_boundary: np.ndarray, load_factor: float = 1.0) -> np.ndarray:
+        """
+        Returns sub-model's global displacement vector from boundary displacements
+        in sub-model axes
+        """
+        U = np.zeros(self.model.dofs)
+        U[self.boundary_dofs] = u_boundary
+        U[self.interior_dofs] = load_factor * self.interior_displacements - self.transformation @ u_boundary
+        return U
+
+
+class SuperelementInstance:
+    """
+    Placement of a superelement in a parent model
+    """
+
+    def __init__(self, superelement: Superelement, nodes: list[Node],
+                 rotation: np.ndarray = None, load_factor: float = 1.0):
+        """
+        :param superelement: condensed sub-model
+        :param nodes: parent model's nodes, one per boundary node
+        :param rotation: (3, 3) rotation matrix from sub-model axes to parent axes
+        :param load_factor: factor of sub-model's loads
+        """
+        if len(nodes) != len(superelement.boundary_nodes):
+            raise ValueError("Instance needs one node per boundary node of the superelement")
+        self.superelement = superelement
+        self.nodes = list(nodes)
+        self.rotation = np.eye(3) if rotation is None else np.asarray(rotation, dtype=np.float64)
+        self.load_factor = load_factor
+        self.instance_id = None
+
+    @property
+    def _T(self) -> np.ndarray:
+        return _block_rotation(self.rotation, len(self.nodes))
+
+    def dofs(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        Returns global dof indices of instance's nodes in parent model
+        """
+        return (offsets[[node.node_id for node in self.nodes]][:, None] + np.arange(6)).ravel()
+
+    @property
+    def stiffness_matrix(self) -> np.ndarray:
+        """
+        Returns condensed stiffness matrix in parent axes
+        """
+        T = self._T
+        return T @ self.superelement.stiffness_matrix @ T.T
+
+    def mass_matrix(self, lumped: bool = False) -> np.ndarray:
+        """
+        Returns condensed mass matrix in parent axes
+        """
+        T = self._T
+        return T @ self.superelement.mass_matrix(lumped) @ T.T
+
+    @property
+    def load_vector(self) -> np.ndarray:
+        """
+        Returns condensed load vector in parent axes
+        """
+        return self.load_factor * (self._T @ self.superelement.load_vector)
+
+    def displacements(self, load_id: int = 0) -> np.ndarray:
+        """
+        Recovers displacements of all sub-model nodes from parent's results
+
+        :return: (n_nodes, 6) array in parent axes, rows in the order of sub-model's node_list
+        """
+        sub = self.superelement.model
+        u_boundary = np.concatenate([node.u[load_id] for node in self.nodes])
+        U = self.superelement.displacements(self._T.T @ u_boundary, self.load_factor)
+        U = sub.node_values(U)[[node.node_id for node in sub.node_list]]
+        return U @ _block_rotation(self.rotation, 1).T
+
+    @property
+    def node_coordinates(self) -> np.ndarray:
+        """
+        Returns (n_nodes, 3) array of sub-model nodes' coordinates in parent model,
+        rows in the order of sub-model's node_list
+        """
+        se = self.superelement
+        origin = np.array([self.nodes[0].x, self.nodes[0].y, self.nodes[0].z]) \
+            - self.rotation @ se.boundary_coordinates[0]
+        coordinates = np.array([(node.x, node.y, node.z) for node in se.model.node_list], dtype=np.float64)
+        return origin + coordinates @ self.rotation.T
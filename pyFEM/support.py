@@ -1,7 +1,11 @@
+import warnings
 from dataclasses import dataclass, field
 from pyFEM.node import Node
 from enum import Enum
 import numpy as np
+from scipy import sparse
+
+import pyFEM.solver as solver
 
 
 @dataclass
@@ -15,21 +19,49 @@ class NodalSupport:
     Rz: bool = False
     supp_id: int = field(default=False, init=False)
     R: dict = field(default_factory=dict)
+    # Prescribed displacements [ux, uy, uz, rx, ry, rz], used only for restrained dofs
+    displacement: np.ndarray | list = field(default_factory=lambda: np.zeros(6))
 
     @property
     def as_vector(self) -> np.ndarray:
         return np.array([self.Tx, self.Ty, self.Tz,
                          self.Rx, self.Ry, self.Rz])
 
-    def B(self, total_dofs: int) -> np.ndarray:
-        nid = self.node.node_id
-        idx = nid * 6
-        B = np.zeros((6, total_dofs))
-        B[0:6, idx: idx + 6] = self.as_vector * np.eye(6)
-        return B
+    def restrained_dof_indices(self, offsets: np.ndarray = None) -> np.ndarray:
+        """
+        Returns global indices of support's restrained dofs
+
+        :param offsets: nodes' first global dof indices indexed by node id,
+            see FEModel.dof_offsets, defaults to node id order
+        """
+        offset = self.node.node_id * 6 if offsets is None else offsets[self.node.node_id]
+        return offset + np.flatnonzero(self.as_vector)
+
+    @property
+    def restrained_dofs(self) -> np.ndarray:
+        warnings.warn("NodalSupport.restrained_dofs ignores dof reordering, "
+                      "use NodalSupport.restrained_dof_indices(model.dof_offsets)",
+                      DeprecationWarning, stacklevel=2)
+        return self.restrained_dof_indices()
+
+    @property
+    def prescribed_displacements(self) -> np.ndarray:
+        """
+        Returns prescribed displacements of support's restrained dofs
+        """
+        return np.asarray(self.displacement, dtype=np.float64)[self.as_vector.astype(bool)]
+
+    def B(self, total_dofs: int, offsets: np.ndarray = None) -> sparse.csr_matrix:
+        """
+        Returns support's constraint rows, one per restrained dof
+
+        :param offsets: nodes' first global dof indices indexed by node id,
+            see FEModel.dof_offsets, defaults to node id order
+        """
+        return solver.constraint_matrix(self.restrained_dof_indices(offsets), total_dofs)
 
     def __call__(self, node):
-        return NodalSupport(node, *self.as_vector)
+        return NodalSupport(node, *self.as_vector, displacement=np.array(self.displacement))
 
 
 class Support:
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import pyFEM.catalogs.materials.steel.structural_steel as steel
+import pyFEM.mesh as mesh
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.steel_section import SteelSection
+
+
+def test_merge_points_is_transitive():
+    points = np.array([[0, 0, 0], [0.8, 0, 0], [1.6, 0, 0], [10, 0, 0]])
+    kept, position = mesh.merge_points(points, tol=1.0)
+    assert np.array_equal(kept, [0, 3])
+    assert np.array_equal(position, [0, 0, 0, 1])
+
+
+def test_add_members_shares_nodes():
+    model = FEModel()
+    members = mesh.add_members(model, [[0, 0, 0], [0, 0, 3000]], [[0, 0, 3000], [4000, 0, 3000]],
+                               SteelSection.IPE100, steel.S355, n=[3, 4])
+    assert [len(elems) for elems in members] == [3, 4]
+    assert len(model.nodes) == 8
+    assert members[0][-1].n2 is members[1][0].n1
+    with pytest.raises(ValueError):
+        mesh.add_members(model, [0, 0, 0], [0, 0, 1e-4], SteelSection.IPE100, steel.S355)
+
+
+def test_merge_nodes():
+    model = FEModel()
+    a, b, c, d = Node(0, 0, 0), Node(0, 0, 3000), Node(0, 0, 3000.0005), Node(4000, 0, 3000)
+    column = Element(a, b, SteelSection.IPE100, steel.S355)
+    link = Element(b, c, SteelSection.IPE100, steel.S355)
+    beam = Element(c, d, SteelSection.IPE100, steel.S355)
+    for elem in (column, link, beam):
+        model.add(elem)
+    model.add(LineLoad(link, qz=[-1, -1]))
+
+    removed_nodes, removed = mesh.merge_nodes(model)
+    assert removed_nodes == 1 and removed == [link]
+    assert model.element_list == [column, beam]
+    assert beam.n1 is b and not model.loads
+    assert [node.node_id for node in model.node_list] == [0, 1, 2]
+    assert mesh.merge_nodes(model) == (0, [])
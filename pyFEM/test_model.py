@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import pyFEM.catalogs.materials.steel.structural_steel as steel
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.pointload import PointLoad
+from pyFEM.steel_section import SteelSection
+from pyFEM.support import NodalSupport, Support
+from loading.loadcase import LoadCase
+
+
+def cantilever(n_elems: int = 4, L: float = 5000, cached: bool = False) -> FEModel:
+    model = FEModel(cached=cached)
+    nodes = [Node(0, 0, z) for z in np.linspace(0, L, n_elems + 1).tolist()]
+    for n1, n2 in zip(nodes[:-1], nodes[1:]):
+        model.add(Element(n1, n2, SteelSection.IPE100, steel.S355))
+    model.add(Support.Fixed(nodes[0]))
+    model.add(PointLoad(nodes[-1], Fx=1e3))
+    return model
+
+
+def tip_deflection(model: FEModel) -> float:
+    model.linear_statics()
+    return model.node_list[-1].u[0][0]
+
+
+def bending_deflection(P: float, L: float, section) -> float:
+    return P * L ** 3 / (3 * steel.S355.E * section.Iy)
+
+
+def test_cached_element_arrays_follow_changes():
+    model = cantilever(cached=True)
+    assert tip_deflection(model) == pytest.approx(bending_deflection(1e3, 5000, SteelSection.IPE100))
+    for node in model.node_list:
+        node.z *= 2
+    assert tip_deflection(model) == pytest.approx(bending_deflection(1e3, 10000, SteelSection.IPE100))
+    for elem in model.element_list:
+        elem.section = SteelSection.IPE120
+    assert tip_deflection(model) == pytest.approx(bending_deflection(1e3, 10000, SteelSection.IPE120))
+    arrays = model.element_arrays
+    assert model.element_arrays is arrays
+
+
+def test_euler_buckling_load():
+    model = cantilever(10)
+    model.loads.clear()
+    model.add(PointLoad(model.node_list[-1], Fz=-1e3))
+    load_factors = model.linear_buckling(n_modes=2, store=False)[0].load_factors
+    I = min(SteelSection.IPE100.Iy, SteelSection.IPE100.Iz)
+    assert load_factors[0] == pytest.approx(np.pi ** 2 * steel.S355.E * I / (4 * 5000 ** 2) / 1e3, rel=1e-3)
+    assert not model.node_list[-1].u
+
+
+def test_load_cases_match_single_solves():
+    model = cantilever()
+    tip = model.node_list[-1]
+    cases = [LoadCase(loads=[PointLoad(tip, Fx=1e3)]), LoadCase(loads=[PointLoad(tip, Fy=2e3, Fz=-5e3)]),
+             LoadCase(loads=[PointLoad(model.node_list[2], Mz=1e6)])]
+    for lc in cases:
+        model.add(lc)
+    model.linear_statics_load_cases()
+    for lc in cases:
+        model.loads = {i: load for i, load in enumerate(lc.loads)}
+        model.linear_statics(load_id="single")
+        for node in model.node_list:
+            assert np.allclose(node.u[lc.load_id], node.u["single"], rtol=1e-10, atol=1e-12)
+        assert np.allclose(model.support_list[0].R[lc.load_id], model.support_list[0].R["single"])
+
+
+def test_simply_supported_beam_section_forces():
+    q, L = 10.0, 6000.0
+    model = FEModel()
+    nodes = [Node(x, 0, 0) for x in (0, L / 2, L)]
+    for n1, n2 in zip(nodes[:-1], nodes[1:]):
+        elem = Element(n1, n2, SteelSection.IPE100, steel.S355)
+        model.add(elem)
+        model.add(LineLoad(elem, qz=[-q, -q]))
+    model.add(NodalSupport(nodes[0], True, True, True, True, False, False))
+    model.add(NodalSupport(nodes[-1], False, True, True, False, False, False))
+    model.linear_statics()
+    beams = model.internal_forces(n_stations=11)
+    # Moment at midspan and parabolic along the span
+    assert abs(beams.forces[0, -1, 4]) == pytest.approx(q * L ** 2 / 8, rel=1e-10)
+    x = np.concatenate((beams.x[0], L / 2 + beams.x[1]))
+    M = np.abs(np.concatenate((beams.forces[0, :, 4], beams.forces[1, :, 4])))
+    assert np.allclose(M, q * x * (L - x) / 2, rtol=1e-9, atol=1e-6 * q * L ** 2)
+    assert abs(beams.forces[0, 0, 2]) == pytest.approx(q * L / 2)
+
+
+@pytest.mark.parametrize("lumped, rtol", [(False, 1e-4), (True, 2e-2)])
+def test_cantilever_natural_frequencies(lumped, rtol):
+    L = 5000
+    section = SteelSection.IPE100
+    result = cantilever(20, L).modal_analysis(2, lumped)
+    # Mass per length [t/mm]
+    m = steel.S355.density * 1e-3 * section.A
+    expected = [1.875104 ** 2 / (2 * np.pi * L ** 2) * np.sqrt(steel.S355.E * I / m)
+                for I in sorted((section.Iy, section.Iz))]
+    assert np.allclose(np.sqrt(result.eigenvalues) / (2 * np.pi), expected, rtol=rtol)
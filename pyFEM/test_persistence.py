@@ -0,0 +1,52 @@
+import numpy as np
+
+import pyFEM.catalogs.materials.steel.structural_steel as steel
+from pyFEM.element import Element
+from pyFEM.isection import ISection
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.persistence import load_model, save_model
+from pyFEM.pointload import PointLoad
+from pyFEM.steel_section import SteelSection
+from pyFEM.support import NodalSupport, Support
+from loading.loadcase import LoadCase
+from loading.loadtype import LoadTypeEnum
+
+
+def frame() -> FEModel:
+    model = FEModel()
+    n1, n2, n3, n4 = Node(0, 0, 0), Node(0, 0, 4000), Node(6000, 0, 4000), Node(6000, 0, 0)
+    beam = Element(n2, n3, ISection("WI", h=400, b=200, tw=8, tf=12, r=0), steel.S355)
+    for elem in (Element(n1, n2, SteelSection.HEA300, steel.S355), beam,
+                 Element(n3, n4, SteelSection.HEA300, steel.S355)):
+        model.add(elem)
+    model.add(Support.Fixed(n1))
+    model.add(NodalSupport(n4, True, True, True, True, False, True, displacement=np.array([0, 0, -5, 0, 0, 0])))
+    model.add(PointLoad(n2, Fx=10e3))
+    model.add(LineLoad(beam, qz=[-10, -20]))
+    model.add(LoadCase(LoadTypeEnum.Permanent, [LineLoad(beam, qz=[-5, -5])], "G"))
+    model.add(LoadCase(LoadTypeEnum.Wind, [PointLoad(n3, Fx=-3e3)], "W"))
+    return model
+
+
+def results(model: FEModel) -> np.ndarray:
+    model.linear_statics(load_id=-1)
+    model.linear_statics_load_cases()
+    load_ids = [-1] + list(model.load_cases)
+    return np.array([[node.u[load_id] for node in model.node_list] for load_id in load_ids])
+
+
+def test_round_trip(tmp_path):
+    model = frame()
+    path = tmp_path / "frame.npz"
+    save_model(model, path)
+    loaded = load_model(path)
+
+    assert np.allclose(results(loaded), results(model))
+    assert [lc.name for lc in loaded.load_cases.values()] == ["G", "W"]
+    assert loaded.element_list[0].section is SteelSection.HEA300
+    assert loaded.element_list[1].section == model.element_list[1].section
+    lc = LoadCase(LoadTypeEnum.Snow)
+    loaded.add(lc)
+    assert lc.load_id == 2
@@ -0,0 +1,58 @@
+import numpy as np
+
+import pyFEM.catalogs.materials.steel.structural_steel as steel
+from pyFEM.element import Element
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.pointload import PointLoad
+from pyFEM.steel_section import SteelSection
+from pyFEM.support import Support
+
+
+def frame() -> FEModel:
+    model = FEModel()
+    n1, n2, n3, n4 = Node(0, 0, 0), Node(0, 0, 5000), Node(5000, 0, 5000), Node(5000, 0, 0)
+    for a, b in ((n1, n2), (n2, n3), (n3, n4)):
+        model.add(Element(a, b, SteelSection.IPE100, steel.S355))
+    model.add(Support.Fixed(n1))
+    model.add(Support.Fixed(n4))
+    model.add(PointLoad(n2, Fx=10e3))
+    return model
+
+
+def displacements(model: FEModel, load_id: int) -> np.ndarray:
+    return np.array([node.u[load_id] for node in model.node_list])
+
+
+def test_added_and_removed_element():
+    model = frame()
+    session = model.reanalysis(load_id=0)
+    n1, n2, n3, n4 = model.node_list
+    brace = Element(n1, n3, SteelSection.IPE100, steel.S355)
+    model.add(brace)
+    assert session.update()
+    model.linear_statics(load_id=1)
+    assert np.allclose(displacements(model, 0), displacements(model, 1))
+
+    del model.elements[brace.elem_id]
+    assert session.update()
+    model.linear_statics(load_id=1)
+    assert np.allclose(displacements(model, 0), displacements(model, 1))
+    assert session.rank == 0
+
+
+def test_changed_and_removed_base_element():
+    model = frame()
+    session = model.reanalysis(load_id=0)
+    column = model.element_list[0]
+    column.section = SteelSection.HEA200
+    assert session.update([column])
+    model.linear_statics(load_id=1)
+    assert np.allclose(displacements(model, 0), displacements(model, 1))
+
+    n1, n2, n3, n4 = model.node_list
+    model.add(Element(n1, n3, SteelSection.IPE100, steel.S355))
+    del model.elements[column.elem_id]
+    assert session.update()
+    model.linear_statics(load_id=1)
+    assert np.allclose(displacements(model, 0), displacements(model, 1))
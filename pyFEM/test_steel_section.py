@@ -0,0 +1,27 @@
+import dataclasses
+
+import pytest
+
+import pyFEM.catalogs.sections.i_sections as i_sections
+import pyFEM.isection as isection
+from pyFEM.steel_section import SteelSection
+
+PROPERTIES = {"A": isection.area, "Iy": isection.Iy, "Iz": isection.Iz, "It": isection.It, "Iw": isection.Iw,
+              "Wely": isection.Wely, "Welz": isection.Welz, "Wply": isection.Wply, "Wplz": isection.Wplz}
+
+
+@pytest.mark.parametrize("name, designation", [("IPE 100", "IPE 100"), ("HEA300", "HEA 300"),
+                                               ("HEM 1000", "HEM 1000")])
+def test_catalog_section(name, designation):
+    section = SteelSection.get(name)
+    assert section.name == designation
+    for prop, func in PROPERTIES.items():
+        assert getattr(section, prop) == pytest.approx(func(*section.dimensions), rel=1e-12)
+
+
+def test_modified_dimensions():
+    section = dataclasses.replace(SteelSection.IPE100)
+    section.set_properties(i_sections.row("IPE100"))
+    section.h += 100
+    assert section.A == pytest.approx(isection.area(*section.dimensions))
+    assert section.A > SteelSection.IPE100.A
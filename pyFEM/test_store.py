@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from pyFEM.results.store import ResultStore
+
+
+def store(path) -> ResultStore:
+    store = ResultStore.create(str(path), node_ids=np.array([4, 0, 7]), elem_ids=np.array([2, 5]),
+                               support_node_ids=np.array([0]), n_cases=2, n_stations=3)
+    for load_id in (3, 1):
+        store.write(load_id, np.full((3, 6), load_id, dtype=float), np.zeros((1, 6)),
+                    np.zeros((2, 12)), np.zeros((2, 3, 6)))
+    return store
+
+
+def test_lookup(tmp_path):
+    results = store(tmp_path)
+    assert results.index("node_ids", 7) == 2
+    assert np.array_equal(results.index("node_ids", [0, 4]), [1, 0])
+    assert np.array_equal(results.displacements(load_id=1, node_id=7), np.ones(6))
+    assert results.displacements(node_id=4).shape == (2, 6)
+    assert np.array_equal(ResultStore(str(tmp_path)).displacements(3, 0), np.full(6, 3.0))
+
+
+@pytest.mark.parametrize("name, ids", [("node_ids", 8), ("node_ids", [0, 100]), ("node_ids", 1),
+                                       ("load_ids", 4), ("elem_ids", -1)])
+def test_unknown_id(tmp_path, name, ids):
+    with pytest.raises(KeyError):
+        store(tmp_path).index(name, ids)
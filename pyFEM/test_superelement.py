@@ -0,0 +1,72 @@
+import io
+
+import numpy as np
+import pytest
+
+import pyFEM.catalogs.materials.steel.structural_steel as steel
+from pyFEM.array_model import ArrayModel
+from pyFEM.element import Element
+from pyFEM.loads.lineload import LineLoad
+from pyFEM.model import FEModel
+from pyFEM.node import Node
+from pyFEM.persistence import save_model
+from pyFEM.pointload import PointLoad
+from pyFEM.steel_section import SteelSection
+from pyFEM.superelement import Superelement
+from pyFEM.support import Support
+
+L, H = 5000.0, 4000.0
+
+
+def beam(model: FEModel, n1: Node, n2: Node, n: int = 4) -> list[Node]:
+    nodes = [n1] + [Node(L * i / n, 0, H) for i in range(1, n)] + [n2]
+    for a, b in zip(nodes[:-1], nodes[1:]):
+        elem = Element(a, b, SteelSection.IPE100, steel.S355)
+        model.add(elem)
+        model.add(LineLoad(elem, qz=[-2, -2]))
+    return nodes
+
+
+def frame(condensed: bool) -> FEModel:
+    """
+    Portal frame whose beam is either modelled with elements or condensed to a superelement
+    """
+    model = FEModel()
+    a0, a1, b0, b1 = Node(0, 0, 0), Node(0, 0, H), Node(L, 0, 0), Node(L, 0, H)
+    model.add(Element(a0, a1, SteelSection.IPE100, steel.S355))
+    model.add(Element(b0, b1, SteelSection.IPE100, steel.S355))
+    if condensed:
+        sub = FEModel()
+        nodes = beam(sub, Node(0, 0, H), Node(L, 0, H))
+        model.add(Superelement(sub, [nodes[0], nodes[-1]]).place(nodes=[a1, b1]))
+    else:
+        beam(model, a1, b1)
+    model.add(Support.Fixed(a0))
+    model.add(Support.Fixed(b0))
+    model.add(PointLoad(a1, Fx=1e3, Fz=-20e3))
+    return model
+
+
+def test_linear_statics():
+    full, condensed = frame(False), frame(True)
+    for model in (full, condensed):
+        model.linear_statics()
+    for supp_full, supp in zip(full.support_list, condensed.support_list):
+        assert np.allclose(supp_full.R[0], supp.R[0])
+
+
+@pytest.mark.parametrize("lumped", [False, True])
+def test_modal_analysis(lumped):
+    full = frame(False).modal_analysis(2, lumped).eigenvalues
+    condensed = frame(True).modal_analysis(2, lumped).eigenvalues
+    # Guyan reduction overestimates frequencies slightly
+    assert np.all(condensed >= full * (1 - 1e-9))
+    assert np.allclose(condensed, full, rtol=0.02)
+
+
+def test_unsupported_entry_points():
+    model = frame(True)
+    with pytest.raises(ValueError):
+        save_model(model, io.BytesIO())
+    with pytest.raises(ValueError):
+        ArrayModel.from_model(model)